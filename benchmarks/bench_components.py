@@ -0,0 +1,266 @@
+"""
+Micro-benchmarks of the hot components, each measured in isolation (no network, no MySQL, no Redis server):
+
+- StoreSchema load / dump of 1 and 10k stores
+- validate_active_session() against an in-memory Redis stand-in (session cache off and on)
+- verify_jwt_in_request() with the verified-token cache off and on (extensions/jwt_cache.py)
+- parse_edifact(), transform_edifact_to_json() and transform_edifact_messages() on generated interchanges
+- ORM hydration of StoreModel lists from SQLite (1k and 10k rows), with and without StoreSchema dump, and the
+  GET /stores fast path (column rows + utils/fast_json.py)
+
+Every case is timed with timeit (auto-ranged loop count, --repeat runs); the median seconds per call is kept.
+
+    python benchmarks/bench_components.py                                   # print the results
+    python benchmarks/bench_components.py --save benchmarks/baseline.json   # record a baseline
+    python benchmarks/bench_components.py --compare benchmarks/baseline.json --max-regression 0.25
+    python benchmarks/bench_components.py --only edifact --edifact-sizes 4KB,16MB,256MB
+
+--compare exits with status 1 when a case is more than --max-regression slower than its baseline. Baselines
+are only comparable on the same machine (the file records python version and platform); record them on the
+runner that does the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from sqlalchemy import select
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+os.environ.setdefault("ALLOWED_ORIGINS", "http://localhost")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-with-32-bytes!")
+
+from store_service.extensions.db import db  # noqa: E402
+from store_service.extensions.session_cache import SessionCache  # noqa: E402
+from store_service.helper.edifact_parser import parse_edifact  # noqa: E402
+from store_service.models.store_db import StoreModel  # noqa: E402
+from store_service.resources import store as store_resource  # noqa: E402
+from store_service.resources.store import STORE_LIST_COLUMNS  # noqa: E402
+from store_service.schemas.store_schema import StoreSchema  # noqa: E402
+from store_service.utils import fast_json  # noqa: E402
+from store_service.utils.pagination import paginate_rows  # noqa: E402
+from store_service.utils.edifact_transformer import (  # noqa: E402
+    transform_edifact_messages,
+    transform_edifact_to_json,
+)
+
+from fake_redis import InMemoryRedis  # noqa: E402
+
+ORDER_MESSAGE = (
+    "UNH+{n}+ORDERS:D:96A:UN'BGM+220+{store}+9'DTM+137:20240101:102'CUX+2:INR:9'"
+    "LIN+1++4000862141404:SRS'QTY+21:2'PRI+AAA:1499.50'"
+    "LIN+2++4000862141411:SRS'QTY+21:1'PRI+AAA:250.00'UNT+10+{n}'\n"
+)
+SIZE_UNITS = {"KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+
+def store_payload(number):
+    return {
+        "store_number": number,
+        "customer_name": "Customer",
+        "store_name": f"Store {number}",
+        "address_line1": "12 Main Road",
+        "address_line2": None,
+        "address_line3": None,
+        "pin_code": "560001",
+        "state_code": "KA",
+        "country_code": "IN",
+        "shipping_time": 2,
+    }
+
+
+def parse_size(text):
+    text = text.strip().upper()
+    for unit, factor in SIZE_UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[: -len(unit)]) * factor)
+    return int(text)
+
+
+def generate_interchange(path, size):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("UNA:+.? 'UNB+UNOC:3+SENDER+RECEIVER+240101:1200+1'\n")
+        written, n = 0, 0
+        while written < size:
+            n += 1
+            message = ORDER_MESSAGE.format(n=n, store=n % 1000 + 1)
+            f.write(message)
+            written += len(message)
+        f.write(f"UNZ+{n}+1'\n")
+    return n
+
+
+def measure(func, repeat):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return statistics.median(timer.repeat(repeat=repeat, number=number)) / number
+
+
+# --- cases --------------------------------------------------------------------------------------------------
+
+def schema_cases():
+    schema, many = StoreSchema(), StoreSchema(many=True)
+    payload = store_payload(1)
+    payloads = [store_payload(number) for number in range(10_000)]
+    stores = [StoreModel(store_id=number, user_id=1, **store_payload(number)) for number in range(10_000)]
+    yield "schema.load[1]", lambda: schema.load(payload), None
+    yield "schema.load[10k]", lambda: many.load(payloads), None
+    yield "schema.dump[1]", lambda: schema.dump(stores[0]), None
+    yield "schema.dump[10k]", lambda: many.dump(stores), None
+
+
+def session_cases(app):
+    from flask_jwt_extended import create_access_token, verify_jwt_in_request
+
+    with app.app_context():
+        token = create_access_token(identity="1")
+    fake = InMemoryRedis()
+    fake.set("session:1", json.dumps({"token": token}))
+    store_resource.redis_client = fake
+    headers = {"Authorization": f"Bearer {token}"}
+    disabled = SessionCache(client=fake, enabled=False)
+    # Cache warm and listener considered connected: measures the in-process hit path only.
+    warm = SessionCache(client=fake, enabled=True)
+    warm.ensure_listener = lambda: None
+    warm._listening = True
+
+    def validate(cache):
+        def run():
+            store_resource.session_cache = cache
+            with app.test_request_context(headers=headers):
+                store_resource.validate_active_session(1)
+        return run
+
+    yield "session.validate[redis]", validate(disabled), None
+    yield "session.validate[cache]", validate(warm), None
+
+    def verify_jwt(enabled):
+        def run():
+            token_cache.enabled = enabled
+            with app.test_request_context(headers=headers):
+                verify_jwt_in_request()
+        return run
+
+    token_cache = app.extensions["flask-jwt-extended"].token_cache
+    yield "session.jwt_verify[pyjwt]", verify_jwt(False), None
+    yield "session.jwt_verify[cache]", verify_jwt(True), None
+
+
+def edifact_cases(sizes, workdir):
+    for size_text in sizes:
+        path = os.path.join(workdir, f"orders-{size_text}.edi")
+        generate_interchange(path, parse_size(size_text))
+        size_mb = os.path.getsize(path) / SIZE_UNITS["MB"]
+        yield f"edifact.parse[{size_text}]", lambda p=path: parse_edifact(p), size_mb
+        yield f"edifact.transform[{size_text}]", lambda p=path: transform_edifact_to_json(p), size_mb
+        yield f"edifact.messages[{size_text}]", lambda p=path: sum(1 for _ in transform_edifact_messages(p)), size_mb
+
+
+def orm_cases(app):
+    with app.app_context():
+        db.session.bulk_insert_mappings(
+            StoreModel, [dict(store_payload(number), user_id=1) for number in range(1, 10_001)]
+        )
+        db.session.commit()
+    many = StoreSchema(many=True)
+
+    def hydrate(limit, dump=False):
+        def run():
+            with app.app_context():
+                stores = StoreModel.query.filter_by(user_id=1).order_by(StoreModel.store_id).limit(limit).all()
+                if dump:
+                    many.dump(stores)
+                db.session.remove()
+        return run
+
+    yield "orm.hydrate[1k]", hydrate(1_000), None
+    yield "orm.hydrate[10k]", hydrate(10_000), None
+    yield "orm.hydrate+dump[10k]", hydrate(10_000, dump=True), None
+
+    def fast_rows():
+        with app.app_context():
+            rows, _ = paginate_rows(
+                db.session, select(*STORE_LIST_COLUMNS).where(StoreModel.user_id == 1), StoreModel.store_id, 0, 10_000
+            )
+            fast_json.dumps(rows)
+            db.session.remove()
+
+    yield "rows+fast_json[10k]", fast_rows, None
+
+
+# --- baseline handling --------------------------------------------------------------------------------------
+
+def environment():
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def compare(results, baseline, max_regression):
+    if baseline.get("environment") != environment():
+        print(f"warning: baseline recorded on {baseline.get('environment')}, comparing on {environment()}")
+    regressions = []
+    for name, seconds in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:<28} new case, no baseline")
+            continue
+        change = seconds / previous - 1
+        flag = "REGRESSION" if change > max_regression else ""
+        print(f"{name:<28} {previous * 1000:10.3f} ms -> {seconds * 1000:10.3f} ms  {change * 100:+7.1f}%  {flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help="comma-separated groups: schema, session, edifact, orm")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--edifact-sizes", default="4KB,1MB,32MB", help="generated file sizes (KB / MB / GB)")
+    parser.add_argument("--save", help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    args = parser.parse_args()
+
+    from store_service.main import create_app
+
+    app = create_app(db_url="sqlite://")
+    only = set(args.only.split(",")) if args.only else None
+    groups = {
+        "schema": schema_cases,
+        "session": lambda: session_cases(app),
+        "edifact": lambda: edifact_cases(args.edifact_sizes.split(","), workdir),
+        "orm": lambda: orm_cases(app),
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for group, cases in groups.items():
+            if only and group not in only:
+                continue
+            for name, func, size_mb in cases():
+                seconds = measure(func, args.repeat)
+                results[name] = seconds
+                throughput = f"{size_mb / seconds:8.1f} MB/s" if size_mb else ""
+                print(f"{name:<28} {seconds * 1000:12.4f} ms/call  {throughput}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {args.max_regression:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Thread-safe in-memory stand-in for the Redis commands the store service issues (sessions, store cache),
+shared by the benchmarks so they run without a Redis server. Expiry is not enforced.
+"""
+import threading
+
+
+class InMemoryRedis:
+    def __init__(self):
+        self.data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        with self._lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = str(value)
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def incr(self, key):
+        with self._lock:
+            self.data[key] = str(int(self.data.get(key, 0)) + 1)
+            return int(self.data[key])
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args, **kwargs: self.queued.append((method, args, kwargs))
+
+    def execute(self):
+        results = [method(*args, **kwargs) for method, args, kwargs in self.queued]
+        self.queued = []
+        return results
+
+
+class AsyncInMemoryRedis:
+    # redis.asyncio view of an InMemoryRedis (the async session check of store_service/asgi.py)
+
+    def __init__(self, client):
+        self.client = client
+
+    async def get(self, key):
+        return self.client.get(key)
+
+    async def close(self):
+        pass
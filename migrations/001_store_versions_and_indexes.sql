@@ -0,0 +1,26 @@
+-- store_service/migrations/001_store_versions_and_indexes.sql
+--
+-- Upgrades a MySQL / MariaDB `stores` table created before row versions and the read indexes existed.
+-- db.create_all() (DB_CREATE_ALL, flask init-db) only creates missing tables; it never alters an existing one,
+-- so without these steps the app fails with "Unknown column 'version'".
+--
+-- Run once per database, before the new image is rolled out:
+--     mysql -h "$DB_HOST" -u "$DB_USER" -p "$DB_NAME" < migrations/001_store_versions_and_indexes.sql
+-- Every step can be checked first with SHOW CREATE TABLE stores; skip the ones the table already has.
+-- ALTER TABLE / CREATE INDEX rebuild InnoDB tables online (ALGORITHM=INPLACE, LOCK=NONE) on MySQL 5.6+.
+
+-- 1. Row versions and Last-Modified (ETag / 304 of GET /store/<id> and /stores)
+ALTER TABLE stores
+    ADD COLUMN version INTEGER NOT NULL DEFAULT '1',
+    ADD COLUMN updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+-- 2. Keyset pagination of GET /stores, covering for the page ETag.
+--    Schemas created by an earlier release have ix_stores_user_id_store_id (user_id, store_id) instead:
+--        DROP INDEX ix_stores_user_id_store_id ON stores;
+CREATE INDEX ix_stores_user_id_store_id_version ON stores (user_id, store_id, version);
+
+-- 3. GET /stores/search
+CREATE INDEX ix_stores_user_id_location ON stores (user_id, country_code, state_code, pin_code, shipping_time);
+CREATE INDEX ix_stores_user_id_shipping_time ON stores (user_id, shipping_time);
+CREATE INDEX ix_stores_user_id_store_name ON stores (user_id, store_name);
+CREATE INDEX ix_stores_user_id_customer_name ON stores (user_id, customer_name);
@@ -0,0 +1,14 @@
+-- store_service/migrations/002_ingest_checkpoint_mtime_ns.sql
+--
+-- edifact_ingest_checkpoints.file_mtime was a single-precision FLOAT on MySQL, which cannot hold a file mtime
+-- exactly, so no checkpoint ever matched and every file was re-ingested on every run. The mtime is now stored as
+-- os.stat().st_mtime_ns in a BIGINT.
+--
+-- Run once per database, before the new image is rolled out:
+--     mysql -h "$DB_HOST" -u "$DB_USER" -p "$DB_NAME" < migrations/002_ingest_checkpoint_mtime_ns.sql
+-- The old values cannot be converted exactly: the next flask ingest-edifact run reloads every file once (replacing
+-- its orders, as for a changed file) and checkpoints it with the exact mtime.
+
+ALTER TABLE edifact_ingest_checkpoints
+    ADD COLUMN file_mtime_ns BIGINT NOT NULL DEFAULT 0,
+    DROP COLUMN file_mtime;
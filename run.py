@@ -3,5 +3,6 @@ from store_service.main import create_app
 
 app = create_app()
 
+# Development server only; production runs gunicorn -c python:store_service.gunicorn_conf run:app
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000)
\ No newline at end of file
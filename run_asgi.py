@@ -0,0 +1,5 @@
+# run_asgi.py
+from store_service.asgi import create_asgi_app
+
+# Async store endpoints + the Flask app behind them (pip install .[async]); see src/store_service/asgi.py
+app = create_asgi_app()
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from werkzeug.wrappers import Request, Response
+
+from store_service.extensions.compression import ResponseCompression
+from store_service.extensions.db import async_engine_from_env
+from store_service.extensions.metrics import observe_request
+from store_service.extensions.redis_client import build_async_client
+from store_service.main import create_app
+from store_service.resources.store_async import ROUTES
+from store_service.utils.fast_json import can_replace_jsonify
+
+"""
+    ASGI entry point (pip install .[async]):  uvicorn run_asgi:app --workers 2
+
+    Requests handled by resources/store_async.py (GET /store/<id>, GET /stores, DELETE /store/<id>) run on the
+    worker's event loop with redis.asyncio and the AsyncEngine (aiomysql), so a single worker keeps hundreds of
+    them in flight while they wait on I/O. Every other request - and every request those handlers decline - is
+    passed to the Flask app from create_app() on a pool of ASGI_WSGI_THREADS threads, exactly as under gunicorn.
+
+    - Flask responses are buffered before they are sent (no streaming through this path).
+    - Natively served requests are counted in store_http_request_duration_seconds / store_http_requests_total
+      under the Flask endpoint names, and compressed like the Flask responses (extensions/compression.py).
+    - Natively served requests are rate limited and shed like the Flask ones (extensions/rate_limit.py) before
+      their handler runs.
+    - The AsyncEngine has its own pool (SQLALCHEMY_POOL_SIZE / SQLALCHEMY_MAX_OVERFLOW) next to the one of the
+      Flask app, and so does the async Redis client (REDIS_MAX_CONNECTIONS).
+"""
+
+
+class AsyncStoreApp:
+    def __init__(self, flask_app, wsgi_threads=4):
+        self.flask_app = flask_app
+        self.engine = None
+        self.redis = None
+        self.compression = ResponseCompression.from_env()
+        self.routes = [(method, re.compile(pattern), *target) for method, pattern, *target in ROUTES]
+        # The async handlers write their bodies with fast_json, which only matches jsonify() in compact mode
+        with flask_app.app_context():
+            self.native = can_replace_jsonify()
+        self._executor = ThreadPoolExecutor(max_workers=wsgi_threads, thread_name_prefix="wsgi")
+
+    async def startup(self):
+        # Engine and Redis pools belong to the running event loop
+        if self.engine is None:
+            self.engine = async_engine_from_env(self.flask_app.config["SQLALCHEMY_DATABASE_URI"])
+            self.redis = build_async_client()
+
+    async def shutdown(self):
+        if self.engine is not None:
+            await self.engine.dispose()
+            await self.redis.close()
+            self.engine = self.redis = None
+        self._executor.shutdown(wait=False)
+
+    def route(self, method, path):
+        if self.native:
+            for route_method, pattern, endpoint, handler in self.routes:
+                match = pattern.fullmatch(path)
+                if route_method == method and match:
+                    return endpoint, handler, match.groupdict()
+        return None, None, None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']!r}")
+
+        environ = build_environ(scope, await _read_body(receive))
+        request = Request(environ)
+        response = None
+        admitted = False
+        endpoint, handler, params = self.route(request.method, request.path)
+        try:
+            if handler is not None:
+                await self.startup()
+                started = time.perf_counter()
+                response, admitted = await self.guard(environ)
+                if response is None:
+                    response = await handler(self, request, **params)
+                if response is not None:
+                    if self.compression is not None:
+                        self.compression.compress(response, request.accept_encodings)
+                    observe_request(endpoint, request.method, response.status_code, time.perf_counter() - started)
+            if response is None:
+                response = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, lambda: Response.from_app(self.flask_app, environ, buffered=True)
+                )
+        finally:
+            if admitted:
+                self.flask_app.extensions["rate_limiting"].shedder.leave()
+        await _send_response(send, response, environ)
+
+    async def guard(self, environ):
+        # Rate limiting and load shedding of the Flask app (extensions/rate_limit.py) for a native request:
+        # (429 / 503 response or None, whether a load shedding slot was taken)
+        guard = self.flask_app.extensions.get("rate_limiting")
+        if guard is None or not guard.enabled:
+            return None, False
+        # The limiter's Redis round trip is synchronous; keep the event loop free
+        return await asyncio.to_thread(guard.guard_environ, self.flask_app, environ)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+def build_environ(scope, body):
+    # WSGI environ of an ASGI http scope (PEP 3333 strings are latin-1 decoded bytes)
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": (scope.get("client") or ("", 0))[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope.get("headers", ()):
+        key = name.decode("latin-1").upper().replace("-", "_")
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+        value = value.decode("latin-1")
+        environ[key] = f"{environ[key]},{value}" if key in environ and key.startswith("HTTP_") else value
+    return environ
+
+
+async def _send_response(send, response, environ):
+    # get_wsgi_headers() applies what the WSGI server would (no Content-Length on a 304, absolute Location, ...)
+    body = b"" if response.status_code in (204, 304) or environ["REQUEST_METHOD"] == "HEAD" else response.get_data()
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in response.get_wsgi_headers(environ).to_wsgi_list()
+    ]
+    await send({"type": "http.response.start", "status": response.status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def create_asgi_app(db_url=None):
+    return AsyncStoreApp(create_app(db_url), wsgi_threads=int(os.getenv("ASGI_WSGI_THREADS", "4")))
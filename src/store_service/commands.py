@@ -0,0 +1,47 @@
+# store_service/src/store_service/commands.py
+import click
+from flask.cli import with_appcontext
+
+"""
+    flask CLI commands registered by create_app(). The modules doing the work are imported when a command runs,
+    so they add nothing to the boot time of the web workers.
+
+    flask init-db                              create the missing tables (what DB_CREATE_ALL=true does at boot)
+    flask ingest-edifact /data/edi --workers 4 nightly EDIFACT batch load (utils/edifact_ingest.py)
+"""
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db_command():
+    """Create every table that does not exist yet (existing tables are left untouched)."""
+    from store_service.extensions.db import db
+
+    db.create_all()
+    click.echo("tables created")
+
+
+@click.command("ingest-edifact")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--workers", type=int, default=None, help="Transform processes (default: CPU count, 0 = in-process).")
+@click.option("--chunk-size", type=int, default=1000, show_default=True, help="Orders per INSERT transaction.")
+@click.option("--pattern", default="*.edi", show_default=True)
+@with_appcontext
+def ingest_edifact_command(directory, workers, chunk_size, pattern):
+    """Transform every new .edi file under DIRECTORY and load the orders into the database."""
+    from store_service.utils.edifact_ingest import ingest_directory
+
+    def progress(report):
+        click.echo(f"... {report.files_done + report.files_failed} files, {report.orders} orders")
+
+    report = ingest_directory(directory, workers=workers, chunk_size=chunk_size, pattern=pattern, progress=progress)
+
+    click.echo(
+        f"files: {report.files_seen} seen, {report.files_skipped} already loaded, "
+        f"{report.files_done} loaded, {report.files_failed} failed; orders: {report.orders}"
+    )
+    click.echo(f"throughput: {report.files_per_second:.1f} files/sec")
+    click.echo(
+        "timings: " + ", ".join(f"{stage}={seconds:.3f}s" for stage, seconds in report.timings.items())
+        + " (transform is summed over workers)"
+    )
@@ -0,0 +1,109 @@
+# store_service/src/store_service/extensions/compression.py
+import os
+import zlib
+
+from flask import request
+
+from store_service.utils.config import env_flag
+
+"""
+    gzip compression of response bodies, negotiated through Accept-Encoding (COMPRESSION_ENABLED, on by default).
+
+    - Only JSON and text bodies are compressed, and only when the client accepts gzip with a non-zero q-value.
+    - Bodies smaller than COMPRESSION_MIN_SIZE bytes (/health, single stores, 304s) go out as they are: below a
+      few hundred bytes the gzip header and the CPU time cost more than the bytes saved.
+    - Streamed responses are compressed chunk by chunk (each chunk is flushed, so the client still receives data
+      as it is produced); their size is unknown up front, so the threshold only applies when Content-Length is set.
+    - COMPRESSION_LEVEL is the zlib level (1 fastest - 9 smallest). 6 is zlib's default; 1-4 give most of the
+      saving on repetitive JSON for a fraction of the CPU.
+    - A strong ETag becomes weak on a compressed response (the bytes differ from the identity representation);
+      If-None-Match uses the weak comparison, so conditional GETs keep answering 304.
+"""
+
+COMPRESSIBLE_MIMETYPES = ("application/json", "application/problem+json", "text/html", "text/plain", "text/css",
+                          "application/javascript", "text/javascript")
+
+
+class ResponseCompression:
+    def __init__(self, min_size=1024, level=6, mimetypes=COMPRESSIBLE_MIMETYPES):
+        self.min_size = min_size
+        self.level = level
+        self.mimetypes = frozenset(mimetypes)
+
+    @classmethod
+    def from_env(cls):
+        if not env_flag("COMPRESSION_ENABLED", "true"):
+            return None
+        return cls(
+            min_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+            level=min(max(int(os.getenv("COMPRESSION_LEVEL", "6")), 1), 9),
+        )
+
+    def _compressor(self):
+        # wbits 31: deflate stream with a gzip header and trailer
+        return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+
+    def after_request(self, response):
+        return self.compress(response, request.accept_encodings)
+
+    def compress(self, response, accept_encodings):
+        if response.mimetype not in self.mimetypes or response.status_code in (204, 304):
+            return response
+        response.vary.add("Accept-Encoding")
+
+        if "Content-Encoding" in response.headers or "Content-Range" in response.headers:
+            return response
+        if not _accepts_gzip(accept_encodings):
+            return response
+        if response.content_length is not None and response.content_length < self.min_size:
+            return response
+
+        if response.is_streamed:
+            response.response = self._compress_stream(response.iter_encoded(), response.response)
+            response.direct_passthrough = False
+            response.headers.pop("Content-Length", None)
+        else:
+            body = response.get_data()
+            if len(body) < self.min_size:
+                return response
+            compressor = self._compressor()
+            compressed = compressor.compress(body) + compressor.flush()
+            if len(compressed) >= len(body):
+                return response
+            response.set_data(compressed)
+
+        response.headers["Content-Encoding"] = "gzip"
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _compress_stream(self, chunks, source):
+        compressor = self._compressor()
+        try:
+            for chunk in chunks:
+                compressed = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                if compressed:
+                    yield compressed
+            yield compressor.flush()
+        finally:
+            # The WSGI server closes our generator; pass that on to the wrapped iterable (stream_with_context etc.)
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+
+
+def _accepts_gzip(accept_encodings):
+    # An explicit "gzip;q=0" wins over "*"; no Accept-Encoding header means identity only.
+    for value, quality in accept_encodings:
+        if value.lower() == "gzip":
+            return quality > 0
+    return accept_encodings["*"] > 0
+
+
+def init_compression(app):
+    compression = ResponseCompression.from_env()
+    if compression is None:
+        return None
+    app.after_request(compression.after_request)
+    return compression
@@ -1,3 +1,170 @@
+import os
+import threading
+import time
+
+from flask import current_app, has_app_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from store_service.utils.config import env_flag
+
+
+def _replica_router():
+    # ReadReplicaRouter of the current app (extensions/read_replicas.py), None when no replicas are configured
+    return current_app.extensions.get("read_replicas") if has_app_context() else None
+
+
+class RoutingSession(Session):
+    """
+    db.session: the SELECTs of GET / HEAD requests go to the read replica the app's ReadReplicaRouter picked for
+    the request; writes, flushes and everything outside a read request use the primary. A SELECT that fails on a
+    replica with a connection-level error ejects that replica and is retried once on the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and getattr(clause, "is_select", False):
+            router = _replica_router()
+            bind_key = router.read_bind_key() if router is not None else None
+            if bind_key is not None:
+                return router.engines[bind_key]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def execute(self, statement, *args, **kwargs):
+        try:
+            return super().execute(statement, *args, **kwargs)
+        except (OperationalError, InterfaceError):
+            router = _replica_router()
+            bind_key = router.read_bind_key() if router is not None and getattr(statement, "is_select", False) else None
+            if bind_key is None:
+                raise
+            # Read-only request: nothing to lose in the rollback, and the retry runs on the primary
+            self.rollback()
+            router.eject(bind_key)
+            return super().execute(statement, *args, **kwargs)
+
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+
+
+class TimedQueuePool(QueuePool):
+    # QueuePool that also records how long requests wait for a connection and how often they give up.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waiting = 0  # threads inside a checkout right now: the queue load shedding watches
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self._checkout = threading.local()
+
+    def _do_get(self):
+        # QueuePool._do_get() calls itself again when it loses the race for an overflow slot; only the outermost
+        # call of a checkout is counted (and counted as waiting)
+        if getattr(self._checkout, "active", False):
+            return super()._do_get()
+        self._checkout.active = True
+        started = time.perf_counter()
+        with self._stats_lock:
+            self.waiting += 1
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            self._checkout.active = False
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.waiting -= 1
+                self.checkouts += 1
+                self.wait_time_total += waited
+                self.wait_time_max = max(self.wait_time_max, waited)
+
+    def recreate(self):
+        # Used by engine.dispose(); keep the class so the counters survive a dispose.
+        new_pool = super().recreate()
+        new_pool.checkouts, new_pool.timeouts = self.checkouts, self.timeouts
+        new_pool.wait_time_total, new_pool.wait_time_max = self.wait_time_total, self.wait_time_max
+        return new_pool
+
+
+def engine_options_from_env(database_uri):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS built from the environment:
+    - SQLALCHEMY_POOL_SIZE / SQLALCHEMY_MAX_OVERFLOW    persistent / burst connections per worker process
+    - SQLALCHEMY_POOL_TIMEOUT                          seconds a request waits for a connection before failing
+    - SQLALCHEMY_POOL_RECYCLE                          reconnect before MySQL's wait_timeout closes the socket
+    - SQLALCHEMY_POOL_PRE_PING                         test a connection on checkout (stale connection errors)
+    - DB_CONNECT_TIMEOUT / DB_READ_TIMEOUT / DB_WRITE_TIMEOUT   PyMySQL socket timeouts in seconds
+    SQLite keeps Flask-SQLAlchemy's defaults (it has no server side pool to tune).
+    """
+    url = make_url(database_uri)
+    if url.get_backend_name() == "sqlite":
+        return {}
+
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_size": int(os.getenv("SQLALCHEMY_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", "5")),
+        "pool_timeout": float(os.getenv("SQLALCHEMY_POOL_TIMEOUT", "5")),
+        "pool_recycle": int(os.getenv("SQLALCHEMY_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": env_flag("SQLALCHEMY_POOL_PRE_PING", "true"),
+    }
+    if url.get_driver_name() == "pymysql":
+        options["connect_args"] = {
+            "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+            "read_timeout": int(os.getenv("DB_READ_TIMEOUT", "30")),
+            "write_timeout": int(os.getenv("DB_WRITE_TIMEOUT", "30")),
+        }
+    return options
+
+
+# Drivers of the async engine (store_service/asgi.py) for the database the WSGI app uses
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+def async_engine_from_env(database_uri):
+    """
+    AsyncEngine on the same database as SQLALCHEMY_DATABASE_URI (pip install .[async]): pymysql -> aiomysql,
+    sqlite -> aiosqlite, with the pool settings of engine_options_from_env(). The pool is SQLAlchemy's
+    async-adapted QueuePool, so it has no wait-time counters in /stats.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = make_url(database_uri)
+    url = url.set(drivername=f"{url.get_backend_name()}+{ASYNC_DRIVERS[url.get_backend_name()]}")
+    options = engine_options_from_env(database_uri)
+    options.pop("poolclass", None)
+    if "connect_args" in options:
+        # aiomysql has no read/write socket timeouts (asyncio cancels instead)
+        options["connect_args"] = {"connect_timeout": options["connect_args"]["connect_timeout"]}
+    return create_async_engine(url, **options)
+
 
-db = SQLAlchemy()
\ No newline at end of file
+def pool_stats(engine):
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, TimedQueuePool):
+        with pool._stats_lock:
+            stats.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                waiting=pool.waiting,
+                wait_time_avg_ms=round(pool.wait_time_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+                wait_time_max_ms=round(pool.wait_time_max * 1000, 3),
+            )
+    return stats
@@ -0,0 +1,161 @@
+# store_service/src/store_service/extensions/jwt_cache.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import request
+from flask_jwt_extended import JWTManager, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.config import config
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+
+from store_service.extensions.session_cache import token_digest
+from store_service.utils.config import env_flag
+
+"""
+    Per-worker cache of verified JWTs (JWT_CACHE_ENABLED, on by default).
+
+    @jwt_required() decodes the bearer token, recomputes its HMAC and checks its claims on every request, although
+    a client sends the same token for its whole lifetime. CachingJWTManager remembers the claims of every token it
+    has verified, keyed by a SHA-256 digest of the token, so the next request with that token skips pyjwt
+    entirely; get_jwt_identity() / get_jwt() are fed from the cached claims as usual.
+
+    - An entry expires at the token's exp claim, and at most JWT_CACHE_MAX_TTL seconds after it was verified
+      (tokens without exp, e.g. expires_delta=False, are re-verified that often). Expired tokens always go through
+      the full verification, which raises the usual 401.
+    - Every entry records a fingerprint of the verification settings (JWT_SECRET_KEY / public key, algorithms,
+      audience, issuer, identity claim). After a key rotation the fingerprint no longer matches, so a token signed
+      with the old key is verified again - and rejected - instead of being served from the cache.
+    - At most JWT_CACHE_MAX_SIZE tokens are kept, least recently used first out.
+"""
+
+
+class VerifiedTokenCache:
+    def __init__(self, enabled=True, max_size=10000, max_ttl=300.0, clock=time.time):
+        self.enabled = enabled
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._clock = clock  # wall clock: exp is a Unix timestamp
+
+        self._entries = OrderedDict()  # token digest -> (claims, settings fingerprint, expires_at)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            enabled=env_flag("JWT_CACHE_ENABLED", "true"),
+            max_size=int(os.getenv("JWT_CACHE_MAX_SIZE", "10000")),
+            max_ttl=float(os.getenv("JWT_CACHE_MAX_TTL", "300")),
+        )
+
+    def get(self, encoded_token, fingerprint):
+        """The claims of a token verified under the same settings and not expired yet, else None."""
+        digest = token_digest(encoded_token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            claims, entry_fingerprint, expires_at = entry
+            if expires_at <= self._clock() or entry_fingerprint != fingerprint:
+                del self._entries[digest]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return dict(claims)
+
+    def add(self, encoded_token, fingerprint, claims):
+        expires_at = self._clock() + self.max_ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, claims["exp"])
+
+        with self._lock:
+            digest = token_digest(encoded_token)
+            self._entries[digest] = (dict(claims), fingerprint, expires_at)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "max_ttl": self.max_ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+def settings_fingerprint():
+    # Everything that decides whether a token verifies, except the clock
+    settings = (
+        config.decode_key,
+        tuple(config.decode_algorithms),
+        config.decode_audience,
+        config.decode_issuer,
+        config.identity_claim_key,
+    )
+    return hashlib.sha256(repr(settings).encode("utf-8")).digest()
+
+
+class CachingJWTManager(JWTManager):
+    # JWTManager whose token decoding (decode_token(), @jwt_required()) goes through a VerifiedTokenCache
+
+    def __init__(self, app=None, cache=None, **kwargs):
+        self.token_cache = cache if cache is not None else jwt_cache
+        super().__init__(app, **kwargs)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # CSRF double submit (cookies) and allow_expired callers are rare; they always get the full verification.
+        if not self.token_cache.enabled or csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        fingerprint = settings_fingerprint()
+        claims = self.token_cache.get(encoded_token, fingerprint)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token)
+            self.token_cache.add(encoded_token, fingerprint, claims)
+        return claims
+
+
+def verified_identity():
+    # Identity of a JWT that @jwt_required() already verified for this request, else None
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        return None
+
+
+def request_identity():
+    # Identity of the request's bearer token before (or without) @jwt_required(): public endpoints and
+    # before_request hooks. A missing or bad token means anonymous; the view still answers it with its own 401.
+    identity = verified_identity()
+    if identity is None and "Authorization" in request.headers:
+        try:
+            verify_jwt_in_request(optional=True)
+            identity = get_jwt_identity()
+        except (JWTExtendedException, PyJWTError):
+            return None
+    return identity
+
+
+jwt_cache = VerifiedTokenCache.from_env()
@@ -0,0 +1,135 @@
+# store_service/src/store_service/extensions/metrics.py
+import os
+import time
+
+from flask import Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+"""
+    Prometheus metrics served at GET /metrics.
+
+    With several gunicorn workers set PROMETHEUS_MULTIPROC_DIR to an empty, writable directory (before the
+    process starts): every worker then writes its samples there and /metrics aggregates all of them, whichever
+    worker answers the scrape. gunicorn_conf.child_exit() cleans up after dead workers.
+
+    - store_http_request_duration_seconds   histogram per endpoint (stores.Store, stores.StoreList, ...) and method
+    - store_http_requests_total             counter per endpoint, method and status code
+    - store_http_requests_in_progress       gauge per endpoint and method
+    - store_db_queries_per_request / store_db_time_per_request_seconds   from SQLAlchemy cursor events
+    - store_redis_command_duration_seconds  per Redis command (see extensions/redis_client.py)
+    - store_http_requests_rejected_total    429s / 503s of the rate limiter and load shedder (extensions/rate_limit.py)
+"""
+
+# Tuned for a service whose p50 is a few ms and whose worker timeout is 30s
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+REDIS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+REQUEST_LATENCY = Histogram(
+    "store_http_request_duration_seconds", "HTTP request latency", ["endpoint", "method"], buckets=LATENCY_BUCKETS
+)
+REQUEST_COUNT = Counter("store_http_requests_total", "HTTP requests", ["endpoint", "method", "status"])
+REQUESTS_IN_PROGRESS = Gauge(
+    "store_http_requests_in_progress", "HTTP requests being served", ["endpoint", "method"], multiprocess_mode="livesum"
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "store_db_queries_per_request", "SQL statements per HTTP request", ["endpoint"],
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "store_db_time_per_request_seconds", "Time spent in SQL statements per HTTP request", ["endpoint"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_REJECTED = Counter(
+    "store_http_requests_rejected_total", "Requests refused before the view ran", ["endpoint", "reason"]
+)
+REDIS_COMMAND_LATENCY = Histogram(
+    "store_redis_command_duration_seconds", "Redis command latency", ["command"], buckets=REDIS_BUCKETS
+)
+
+
+def _endpoint():
+    return request.endpoint or "unmatched"
+
+
+def _before_request():
+    g.metrics_started = time.perf_counter()
+    g.db_queries = 0
+    g.db_time = 0.0
+    REQUESTS_IN_PROGRESS.labels(_endpoint(), request.method).inc()
+
+
+def _after_request(response):
+    g.metrics_status = response.status_code
+    return response
+
+
+def _teardown_request(_exc):
+    started = g.pop("metrics_started", None)
+    if started is None:
+        return
+    endpoint = _endpoint()
+    REQUESTS_IN_PROGRESS.labels(endpoint, request.method).dec()
+    REQUEST_LATENCY.labels(endpoint, request.method).observe(time.perf_counter() - started)
+    REQUEST_COUNT.labels(endpoint, request.method, str(g.pop("metrics_status", 500))).inc()
+    DB_QUERIES_PER_REQUEST.labels(endpoint).observe(g.pop("db_queries", 0))
+    DB_TIME_PER_REQUEST.labels(endpoint).observe(g.pop("db_time", 0.0))
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    conn.info.setdefault("metrics_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    started = conn.info.get("metrics_query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    # Statements outside of a request (CLI, create_all at boot) are not attributed to any endpoint.
+    if g and "db_queries" in g:
+        g.db_queries += 1
+        g.db_time += elapsed
+
+
+def observe_request(endpoint, method, status, seconds):
+    # Requests served outside Flask (store_service/asgi.py)
+    REQUEST_LATENCY.labels(endpoint, method).observe(seconds)
+    REQUEST_COUNT.labels(endpoint, method, str(status)).inc()
+
+
+def observe_rejected_request(endpoint, reason):
+    # reason: rate_limited (429) or overloaded (503), see extensions/rate_limit.py
+    REQUESTS_REJECTED.labels(endpoint, reason).inc()
+
+
+def observe_redis_command(command, seconds):
+    REDIS_COMMAND_LATENCY.labels(command).observe(seconds)
+
+
+def metrics_view():
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    app.add_url_rule("/metrics", "metrics", metrics_view)
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,159 @@
+# store_service/src/store_service/extensions/profiling.py
+import hmac
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from store_service.utils.config import env_flag
+
+"""
+    Opt-in per-request profiler (PROFILING_ENABLED=true). Nothing is hooked into the app when it is disabled.
+
+    A request is profiled when it carries X-Profile-Token equal to PROFILING_TOKEN, or at random with probability
+    PROFILING_SAMPLE_RATE (0.0 - 1.0). For each profiled request two files are written to PROFILING_DIR:
+    - <id>.folded     collapsed stacks ("frame;frame;frame <microseconds>") for flamegraph.pl, inferno, speedscope
+    - <id>.sql.json   every SQL statement the request issued, with its duration
+    The <id> is returned in the X-Profile-Id response header.
+
+    The profiler is deterministic (sys.setprofile on the request thread only): every Python and C call is timed,
+    so short requests are fully covered. It slows the profiled request down noticeably; other requests served
+    by the worker's other threads are not affected.
+"""
+
+
+class StackProfiler:
+    def __init__(self):
+        self.stack = []  # folded prefix of every open frame, e.g. "get (store.py:109);first (query.py:2748)"
+        self.totals = defaultdict(float)
+        self._last = None
+
+    def _profile(self, frame, event_name, arg):
+        now = time.perf_counter()
+        self.totals[self.stack[-1] if self.stack else "<flask>"] += now - self._last
+
+        if event_name == "call":
+            code = frame.f_code
+            self._push(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        elif event_name == "c_call":
+            self._push(f"{getattr(arg, '__qualname__', getattr(arg, '__name__', 'builtin'))} (builtin)")
+        elif event_name in ("return", "c_return", "c_exception") and self.stack:
+            self.stack.pop()
+
+        # Time spent in this function is not charged to the profiled code.
+        self._last = time.perf_counter()
+
+    def _push(self, name):
+        self.stack.append(f"{self.stack[-1]};{name}" if self.stack else name)
+
+    def start(self):
+        self._last = time.perf_counter()
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        sys.setprofile(None)
+
+    def folded(self):
+        lines = []
+        for stack, seconds in sorted(self.totals.items()):
+            microseconds = int(seconds * 1_000_000)
+            if microseconds:
+                lines.append(f"{stack} {microseconds}")
+        return "\n".join(lines) + "\n"
+
+
+class RequestProfiling:
+    def __init__(self, output_dir, token=None, sample_rate=0.0):
+        self.output_dir = output_dir
+        self.token = token
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def from_env(cls):
+        if not env_flag("PROFILING_ENABLED"):
+            return None
+        return cls(
+            output_dir=os.getenv("PROFILING_DIR", "/tmp/store-profiles"),
+            token=os.getenv("PROFILING_TOKEN") or None,
+            sample_rate=float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+        )
+
+    def should_profile(self):
+        header = request.headers.get("X-Profile-Token")
+        # Compared as bytes: compare_digest() rejects str holding non-ASCII characters
+        if header and self.token and hmac.compare_digest(header.encode("utf-8"), self.token.encode("utf-8")):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def before_request(self):
+        if not self.should_profile():
+            return
+        g.profile_sql = []
+        g.profiler = StackProfiler()
+        g.profiler.start()
+
+    def after_request(self, response):
+        profiler = g.pop("profiler", None)
+        if profiler is None:
+            return response
+        profiler.stop()
+
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{request.endpoint or 'unmatched'}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(os.path.join(self.output_dir, f"{profile_id}.folded"), "w", encoding="utf-8") as f:
+            f.write(profiler.folded())
+        with open(os.path.join(self.output_dir, f"{profile_id}.sql.json"), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "statements": g.pop("profile_sql", []),
+                },
+                f,
+                indent=2,
+            )
+        response.headers["X-Profile-Id"] = profile_id
+        return response
+
+    def teardown_request(self, _exc):
+        # after_request is skipped on unhandled errors; never leave the profiler attached to the thread.
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.stop()
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    if g and "profile_sql" in g:
+        conn.info.setdefault("profile_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, executemany):
+    started = conn.info.get("profile_query_started")
+    if not started or not (g and "profile_sql" in g):
+        return
+    g.profile_sql.append({
+        "statement": " ".join(statement.split()),
+        "executemany": executemany,
+        "duration_ms": round((time.perf_counter() - started.pop()) * 1000, 3),
+    })
+
+
+def init_profiling(app):
+    profiling = RequestProfiling.from_env()
+    if profiling is None:
+        return None
+    app.before_request(profiling.before_request)
+    app.after_request(profiling.after_request)
+    app.teardown_request(profiling.teardown_request)
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    return profiling
@@ -0,0 +1,258 @@
+# store_service/src/store_service/extensions/rate_limit.py
+import hashlib
+import math
+import os
+import threading
+
+import redis
+from flask import g, request
+from flask_smorest import abort
+from werkzeug.exceptions import HTTPException
+
+from store_service.extensions.db import db
+from store_service.extensions.jwt_cache import request_identity
+from store_service.extensions.metrics import observe_rejected_request
+from store_service.extensions.redis_client import redis_client
+from store_service.utils.config import env_flag
+
+"""
+    Per-user rate limiting and load shedding for the store endpoints. Both run in before_request, so a rejected
+    request costs no database work at all.
+
+    Rate limiting (RATE_LIMIT_ENABLED, off by default): a token bucket per JWT identity and route, kept in Redis so
+    every worker and pod shares it. Reads (GET / HEAD) and writes have their own size and refill rate:
+    RATE_LIMIT_READ_BURST tokens, refilled at RATE_LIMIT_READ_PER_SECOND (RATE_LIMIT_WRITE_* for writes). The
+    refill and the take happen in one Lua script (EVALSHA; atomic, one round trip, clocked by Redis' TIME so pods
+    with skewed clocks agree). An empty bucket answers 429 with Retry-After. Requests without a valid token are not
+    limited here: the protected endpoints refuse them with 401 before touching the database. Redis errors let the
+    request through (the limiter never takes the service down with it).
+
+    Load shedding (per worker process, off while both limits are 0): 503 with Retry-After when
+    - LOAD_SHED_MAX_CONCURRENT requests are already being served by this worker, or
+    - LOAD_SHED_MAX_DB_WAITING requests are already queued for a connection of the database pool
+      (SQLALCHEMY_POOL_SIZE + SQLALCHEMY_MAX_OVERFLOW all checked out). Failing fast beats every tenant waiting
+      SQLALCHEMY_POOL_TIMEOUT seconds for a connection.
+
+    Requests served natively by the ASGI app (store_service/asgi.py) get the same checks from
+    RequestGuard.guard_environ() before their handler runs.
+"""
+
+# KEYS[1] bucket hash {tokens, ts}; ARGV burst, refill per second, cost. Returns {allowed, tokens left, retry ms}.
+TOKEN_BUCKET_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+if now > ts then
+    tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+end
+
+local allowed, retry_ms = 0, 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_ms = math.ceil((cost - tokens) * 1000 / rate)
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(math.max(now, ts)))
+redis.call("PEXPIRE", KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return {allowed, math.floor(tokens), retry_ms}
+"""
+TOKEN_BUCKET_SHA = hashlib.sha1(TOKEN_BUCKET_SCRIPT.encode("utf-8")).hexdigest()
+
+READ_METHODS = ("GET", "HEAD")
+# WSGI environ key set by RequestGuard.guard_environ(): the request was already checked, the hooks skip it
+GUARDED_ENVIRON_KEY = "store_service.request_guarded"
+
+
+def bucket_key(identity, method, endpoint):
+    return f"ratelimit:{identity}:{method}:{endpoint}"
+
+
+class RateLimiter:
+    def __init__(self, client=None, enabled=False, read_burst=40, read_rate=20.0, write_burst=10, write_rate=2.0):
+        self.client = client
+        self.enabled = enabled
+        self.read_limit = (read_burst, read_rate)
+        self.write_limit = (write_burst, write_rate)
+
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+        self.errors = 0
+
+    @classmethod
+    def from_env(cls, client=None):
+        return cls(
+            client=client,
+            enabled=env_flag("RATE_LIMIT_ENABLED"),
+            read_burst=int(os.getenv("RATE_LIMIT_READ_BURST", "40")),
+            read_rate=float(os.getenv("RATE_LIMIT_READ_PER_SECOND", "20")),
+            write_burst=int(os.getenv("RATE_LIMIT_WRITE_BURST", "10")),
+            write_rate=float(os.getenv("RATE_LIMIT_WRITE_PER_SECOND", "2")),
+        )
+
+    def take(self, key, burst, rate, cost=1):
+        """(allowed, tokens left, seconds until the request would be allowed) for one request of key's bucket."""
+        args = (1, key, burst, rate, cost)
+        try:
+            allowed, remaining, retry_ms = self.client.evalsha(TOKEN_BUCKET_SHA, *args)
+        except redis.exceptions.NoScriptError:
+            # First call on this Redis (or after SCRIPT FLUSH): EVAL also caches the script for the next EVALSHA
+            allowed, remaining, retry_ms = self.client.eval(TOKEN_BUCKET_SCRIPT, *args)
+        return bool(allowed), int(remaining), int(retry_ms) / 1000
+
+    def check(self, endpoint):
+        identity = request_identity()
+        if identity is None:
+            return
+        burst, rate = self.read_limit if request.method in READ_METHODS else self.write_limit
+        try:
+            allowed, remaining, retry_after = self.take(bucket_key(identity, request.method, endpoint), burst, rate)
+        except redis.RedisError:
+            with self._lock:
+                self.errors += 1
+            return
+
+        with self._lock:
+            if allowed:
+                self.allowed += 1
+            else:
+                self.limited += 1
+        if not allowed:
+            observe_rejected_request(endpoint, "rate_limited")
+            abort(429, message="Too many requests", headers={
+                "Retry-After": str(max(1, math.ceil(retry_after))),
+                "X-RateLimit-Limit": str(burst),
+                "X-RateLimit-Remaining": str(remaining),
+            })
+
+    def stats(self):
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "read_limit": {"burst": self.read_limit[0], "per_second": self.read_limit[1]},
+                "write_limit": {"burst": self.write_limit[0], "per_second": self.write_limit[1]},
+                "allowed": self.allowed,
+                "limited": self.limited,
+                "redis_errors": self.errors,
+            }
+
+
+class LoadShedder:
+    def __init__(self, max_concurrent=0, max_db_waiting=0, retry_after=1):
+        self.max_concurrent = max_concurrent
+        self.max_db_waiting = max_db_waiting
+        self.retry_after = retry_after
+
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.shed = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_concurrent=int(os.getenv("LOAD_SHED_MAX_CONCURRENT", "0")),
+            max_db_waiting=int(os.getenv("LOAD_SHED_MAX_DB_WAITING", "0")),
+            retry_after=int(os.getenv("LOAD_SHED_RETRY_AFTER", "1")),
+        )
+
+    @property
+    def enabled(self):
+        return self.max_concurrent > 0 or self.max_db_waiting > 0
+
+    def enter(self, endpoint):
+        # Counts the request as in flight, or refuses it; every admitted request must leave()
+        with self._lock:
+            overloaded = (
+                (self.max_concurrent and self.in_flight >= self.max_concurrent)
+                or (self.max_db_waiting and getattr(db.engine.pool, "waiting", 0) >= self.max_db_waiting)
+            )
+            if overloaded:
+                self.shed += 1
+            else:
+                self.in_flight += 1
+        if overloaded:
+            observe_rejected_request(endpoint, "overloaded")
+            abort(503, message="Service overloaded, retry later", headers={"Retry-After": str(self.retry_after)})
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_db_waiting": self.max_db_waiting,
+                "in_flight": self.in_flight,
+                "shed": self.shed,
+            }
+
+
+class RequestGuard:
+    # before_request / teardown_request hooks of the store blueprint's endpoints
+
+    def __init__(self, limiter, shedder, blueprints=("stores",)):
+        self.limiter = limiter
+        self.shedder = shedder
+        self.blueprints = frozenset(blueprints)
+
+    @property
+    def enabled(self):
+        return self.limiter.enabled or self.shedder.enabled
+
+    def before_request(self):
+        if (
+            request.blueprint not in self.blueprints
+            or request.method == "OPTIONS"
+            or request.environ.get(GUARDED_ENVIRON_KEY)
+        ):
+            return
+        endpoint = request.endpoint
+        if self.shedder.enabled:
+            # Shed first: an overloaded worker should not spend a Redis round trip on the request either
+            self.shedder.enter(endpoint)
+            g.load_shed_admitted = True
+        if self.limiter.enabled:
+            self.limiter.check(endpoint)
+
+    def teardown_request(self, _exc):
+        if g.pop("load_shed_admitted", False):
+            self.shedder.leave()
+
+    def guard_environ(self, app, environ):
+        """
+        before_request for a request the ASGI app serves without Flask: (rejection, admitted). rejection is the
+        429 / 503 response to send, else None; an admitted request must be released with shedder.leave() once it
+        is answered. Should the request be handed to the Flask app after all, its hooks do not count it again.
+        """
+        with app.request_context(environ):
+            try:
+                self.before_request()
+            except HTTPException as error:
+                # The same error body as the Flask app; teardown_request releases a shed slot taken before a 429
+                return app.make_response(app.handle_http_exception(error)), False
+            admitted = g.pop("load_shed_admitted", False)
+        environ[GUARDED_ENVIRON_KEY] = True
+        return None, admitted
+
+    def stats(self):
+        return {"rate_limit": self.limiter.stats(), "load_shedding": self.shedder.stats()}
+
+
+def init_rate_limiting(app, client=None):
+    guard = RequestGuard(
+        RateLimiter.from_env(client=client if client is not None else redis_client),
+        LoadShedder.from_env(),
+    )
+    app.before_request(guard.before_request)
+    app.teardown_request(guard.teardown_request)
+    app.extensions["rate_limiting"] = guard
+    return guard
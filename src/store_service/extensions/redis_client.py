@@ -1,12 +1,181 @@
 # store_service/src/store_service/extensions/redis_client.py
 import os
+import threading
+import time
+
 import redis
+from redis import asyncio as redis_asyncio
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialBackoff
+from redis.client import Pipeline
+from redis.retry import Retry
+
+from store_service.extensions.metrics import observe_redis_command
+
+"""
+    Redis client shared by every request of a worker process.
+
+    All settings come from the environment so pods can be tuned without a rebuild:
+    - REDIS_MAX_CONNECTIONS      upper bound of sockets per worker process (blocking pool, no churn under load)
+    - REDIS_POOL_TIMEOUT         seconds a request waits for a free connection before failing
+    - REDIS_SOCKET_TIMEOUT       seconds a single command may take before failing (no more hanging requests)
+    - REDIS_CONNECT_TIMEOUT      seconds allowed for the TCP connect
+    - REDIS_RETRIES              retries on connection errors / timeouts, with exponential backoff
+    - REDIS_RETRY_BACKOFF_BASE   first backoff step in seconds
+    - REDIS_RETRY_BACKOFF_CAP    largest backoff step in seconds
+    - REDIS_HEALTH_CHECK_INTERVAL  idle seconds after which a connection is PINGed before being reused
+"""
+
+
+class InstrumentedBlockingConnectionPool(redis.BlockingConnectionPool):
+    # BlockingConnectionPool waits for a free connection instead of opening a new socket on every burst.
+    # This subclass only adds the counters needed to see how close the pool is to exhaustion.
+
+    def reset(self):
+        super().reset()
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.exhausted = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def get_connection(self, command_name, *keys, **options):
+        started = time.perf_counter()
+        try:
+            return super().get_connection(command_name, *keys, **options)
+        except redis.ConnectionError as exc:
+            if str(exc) == "No connection available.":
+                with self._stats_lock:
+                    self.exhausted += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_time_total += waited
+                self.wait_time_max = max(self.wait_time_max, waited)
+
+    def stats(self):
+        # Slots still holding None were never used, real connections in the queue are idle.
+        queued = list(self.pool.queue)
+        idle = sum(1 for connection in queued if connection is not None)
+        created = len(self._connections)
+        with self._stats_lock:
+            return {
+                "max_connections": self.max_connections,
+                "created": created,
+                "in_use": created - idle,
+                "idle": idle,
+                "checkouts": self.checkouts,
+                "exhausted": self.exhausted,
+                "wait_time_avg_ms": round(self.wait_time_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+            }
+
+
+class InstrumentedPipeline(Pipeline):
+    def execute(self, raise_on_error=True):
+        started = time.perf_counter()
+        try:
+            return super().execute(raise_on_error)
+        finally:
+            observe_redis_command("PIPELINE", time.perf_counter() - started)
+
+
+class InstrumentedRedis(redis.Redis):
+    # Times every command for the store_redis_command_duration_seconds histogram (GET /metrics)
+
+    def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            observe_redis_command(str(args[0]).upper(), time.perf_counter() - started)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+class InstrumentedAsyncRedis(redis_asyncio.Redis):
+    # redis.asyncio client of store_service/asgi.py, timed like InstrumentedRedis
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            observe_redis_command(str(args[0]).upper(), time.perf_counter() - started)
+
+
+def _pool_settings(retry_class):
+    retry = retry_class(
+        ExponentialBackoff(
+            cap=float(os.getenv("REDIS_RETRY_BACKOFF_CAP", "0.5")),
+            base=float(os.getenv("REDIS_RETRY_BACKOFF_BASE", "0.01")),
+        ),
+        int(os.getenv("REDIS_RETRIES", "2")),
+    )
+    return dict(
+        host=os.getenv("REDIS_HOST", "redis-service"),
+        port=int(os.getenv("REDIS_PORT", 6379)),
+        password=os.getenv("REDIS_PASSWORD") or None,  # treat empty string as None (no AUTH command sent to Redis)
+        decode_responses=True,
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "20")),
+        timeout=float(os.getenv("REDIS_POOL_TIMEOUT", "1.0")),
+        socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5")),
+        socket_connect_timeout=float(os.getenv("REDIS_CONNECT_TIMEOUT", "0.5")),
+        socket_keepalive=True,
+        health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30")),
+        retry=retry,
+        retry_on_timeout=True,
+    )
+
+
+def build_connection_pool():
+    return InstrumentedBlockingConnectionPool(**_pool_settings(Retry))
+
+
+def build_async_client():
+    # Same settings as redis_client; create it inside the event loop that will use it (asyncio pools are per loop).
+    return InstrumentedAsyncRedis(connection_pool=redis_asyncio.BlockingConnectionPool(**_pool_settings(AsyncRetry)))
+
+
+def build_pubsub_client():
+    """
+    Client of SessionCache's revocation listener. A subscription is idle most of the time, so its connection has no
+    read timeout (REDIS_SOCKET_TIMEOUT would drop and resubscribe it on a quiet channel, losing the revocations
+    published meanwhile); TCP keepalive and the PING every REDIS_HEALTH_CHECK_INTERVAL keep it alive instead. It is
+    kept out of redis_client's pool so the long-lived subscription never holds one of the request connections.
+    """
+    settings = _pool_settings(Retry)
+    del settings["timeout"]  # BlockingConnectionPool only
+    settings.update(socket_timeout=None, retry_on_timeout=False, max_connections=2)
+    return redis.Redis(connection_pool=redis.ConnectionPool(**settings))
+
+
+redis_client = InstrumentedRedis(connection_pool=build_connection_pool())
+
+
+def get_many(keys):
+    """
+    Fetch several string keys in one round trip (MGET) and return them as a dict key -> value (None if missing).
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    return dict(zip(keys, redis_client.mget(keys)))
+
+
+def run_pipeline(commands):
+    """
+    Run several commands in one non-transactional pipeline round trip.
+    commands is a list of (method_name, args) tuples, e.g. [("get", ("session:1",)), ("ttl", ("session:1",))].
+    """
+    with redis_client.pipeline(transaction=False) as pipe:
+        for method_name, args in commands:
+            getattr(pipe, method_name)(*args)
+        return pipe.execute()
 
-_redis_password = os.getenv("REDIS_PASSWORD") or None  # treat empty string as None
 
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "redis-service"),
-    port=int(os.getenv("REDIS_PORT", 6379)),
-    password=_redis_password,  # None = no AUTH command sent to Redis
-    decode_responses=True
-)
\ No newline at end of file
+def pool_stats():
+    return redis_client.connection_pool.stats()
@@ -0,0 +1,215 @@
+# store_service/src/store_service/extensions/session_cache.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+from store_service.extensions.redis_client import build_pubsub_client
+from store_service.utils.config import env_flag
+
+"""
+    Per-worker cache of sessions that were already validated against Redis.
+
+    validate_active_session() normally does a GET session:{user_id} + json.loads on every authenticated write.
+    When SESSION_CACHE_ENABLED is set, a successful validation is remembered for SESSION_CACHE_TTL seconds so the
+    next request with the same (user_id, token) pair skips Redis entirely.
+
+    Revocation is pushed to every worker over Redis pub/sub:
+    - keyspace notifications on session:* keys (requires notify-keyspace-events to include "K" and "g$x"),
+      so a DEL / SET / EXPIRE of session:{user_id} by the auth service drops the entry immediately.
+    - an explicit SESSION_REVOCATION_CHANNEL where the auth service can PUBLISH a user_id on logout.
+
+    Entries are only served while the listener is subscribed; if the pub/sub connection drops, the cache is
+    cleared and every request falls back to Redis until the subscription is back (fail closed). The listener has
+    its own connection without a read timeout (redis_client.build_pubsub_client), so a quiet channel never drops it.
+"""
+
+SESSION_KEY_PREFIX = "session:"
+
+
+def token_digest(token):
+    # Only a digest of the bearer token is kept in worker memory.
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class SessionCache:
+    def __init__(self, client=None, enabled=False, ttl=30.0, max_size=10000,
+                 revocation_channel="session:revoked", keyspace_pattern="__keyspace@*__:session:*",
+                 clock=time.monotonic):
+        self.client = client
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_size = max_size
+        self.revocation_channel = revocation_channel
+        self.keyspace_pattern = keyspace_pattern
+        self._clock = clock
+
+        self._entries = OrderedDict()  # user_id -> (token_digest, expires_at)
+        self._lock = threading.Lock()
+
+        # Bumped on every invalidation so a Redis read that raced with a revocation is never cached.
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revocations = 0
+
+        self._listening = False
+        self._listener = None
+        self._listener_pid = None
+
+    @classmethod
+    def from_env(cls, client=None):
+        return cls(
+            client=client,
+            enabled=env_flag("SESSION_CACHE_ENABLED"),
+            ttl=float(os.getenv("SESSION_CACHE_TTL", "30")),
+            max_size=int(os.getenv("SESSION_CACHE_MAX_SIZE", "10000")),
+            revocation_channel=os.getenv("SESSION_REVOCATION_CHANNEL", "session:revoked"),
+            keyspace_pattern=os.getenv("SESSION_KEYSPACE_PATTERN", "__keyspace@*__:session:*"),
+        )
+
+    @property
+    def active(self):
+        return self.enabled and self._listening
+
+    def is_valid(self, user_id, token):
+        """Return True when (user_id, token) was validated recently and not revoked since."""
+        if not self.enabled:
+            return False
+        self.ensure_listener()
+
+        with self._lock:
+            entry = self._entries.get(user_id) if self._listening else None
+            if entry is None:
+                self.misses += 1
+                return False
+
+            cached_digest, expires_at = entry
+            if expires_at <= self._clock() or cached_digest != token_digest(token):
+                del self._entries[user_id]
+                self.misses += 1
+                return False
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return True
+
+    def generation(self):
+        """Snapshot to take *before* reading the session from Redis and hand back to add()."""
+        return self._generation
+
+    def add(self, user_id, token, generation):
+        if not self.active:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[user_id] = (token_digest(token), self._clock() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(user_id, None) is not None:
+                self.revocations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "listening": self._listening,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "revocations": self.revocations,
+            }
+
+    # --- revocation listener -------------------------------------------------------------------------------
+
+    def ensure_listener(self):
+        # Threads do not survive fork(), so each worker process starts its own subscriber.
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._lock:
+            if self._listener_pid == pid:
+                return
+            self._listener_pid = pid
+            self._listening = False
+            self._entries.clear()
+            self._listener = threading.Thread(target=self._listen, name="session-cache-revocations", daemon=True)
+            self._listener.start()
+
+    def handle_message(self, message):
+        """Drop the cached entry named by a pub/sub or keyspace notification message."""
+        if message is None:
+            return
+        if message.get("type") == "pmessage":
+            # channel = "__keyspace@0__:session:42", data = "del" / "set" / "expired" / ...
+            channel = message.get("channel") or ""
+            _, _, key = channel.partition(":")
+            user_id = key[len(SESSION_KEY_PREFIX):] if key.startswith(SESSION_KEY_PREFIX) else None
+        elif message.get("type") == "message":
+            user_id = message.get("data")
+        else:
+            return
+
+        try:
+            self.invalidate(int(user_id))
+        except (TypeError, ValueError):
+            # Unknown payload - be safe and forget everything.
+            self.clear()
+
+    def listen_once(self):
+        """Run one subscription until the connection drops; the cache is unusable outside of it."""
+        pubsub = None
+        try:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.revocation_channel)
+            pubsub.psubscribe(self.keyspace_pattern)
+            self._listening = True
+            while True:
+                # None after a second without messages; the connection itself has no read timeout
+                self.handle_message(pubsub.get_message(timeout=1.0))
+        except redis.RedisError:
+            pass
+        finally:
+            self._listening = False
+            self.clear()
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except redis.RedisError:
+                    pass
+
+    def _listen(self):
+        backoff = 0.5
+        while True:
+            started = self._clock()
+            self.listen_once()
+            if self._clock() - started > 30:
+                backoff = 0.5
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 10.0)
+
+
+session_cache = SessionCache.from_env(client=build_pubsub_client())
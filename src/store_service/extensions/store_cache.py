@@ -0,0 +1,158 @@
+# store_service/src/store_service/extensions/store_cache.py
+import json
+import os
+import random
+import time
+import uuid
+
+import redis
+from flask import current_app, jsonify
+
+from store_service.extensions.redis_client import redis_client
+from store_service.utils.config import env_flag
+
+"""
+    Read-through Redis cache of serialized store payloads (the exact JSON body returned to the client).
+
+    Keys:
+    - store:{store_id}            body of GET /store/<store_id>
+    - stores:user:{user_id}:...   bodies of GET /stores pages for that user (all sharing the version key of
+                                  stores:user:{user_id}, so one invalidation drops every page)
+    Every cache key has a companion version key "<key>:v". Writers INCR the version after their commit, and a
+    cached body is only served when it was written under the current version. A reader that loaded the row
+    before a write and stores it after the invalidation therefore never serves stale data.
+
+    Stampede protection: on a miss only the caller holding "<key>:lock" (SET NX PX) queries MySQL; the others
+    poll the cache for up to STORE_CACHE_LOCK_WAIT_MS and fall back to the database if it is still empty.
+    Redis errors never fail a request - the cache is bypassed instead.
+"""
+
+
+def store_key(store_id):
+    return f"store:{store_id}"
+
+
+def user_stores_key(user_id):
+    return f"stores:user:{user_id}"
+
+
+class StoreCache:
+    def __init__(self, client=None, enabled=False, ttl=300, list_ttl=60, lock_ttl_ms=2000, lock_wait_ms=200,
+                 poll_interval_ms=20):
+        self.client = client
+        self.enabled = enabled
+        self.ttl = ttl
+        self.list_ttl = list_ttl
+        self.lock_ttl_ms = lock_ttl_ms
+        self.lock_wait_ms = lock_wait_ms
+        self.poll_interval_ms = poll_interval_ms
+        # Response headers that are part of the cached payload (e.g. the pagination cursor)
+        self.cached_headers = ("X-Next-Cursor", "ETag", "Last-Modified")
+        # Version keys must outlive every body written under them.
+        self.version_ttl = max(ttl, list_ttl) * 10
+
+    @classmethod
+    def from_env(cls, client=None):
+        return cls(
+            client=client,
+            enabled=env_flag("STORE_CACHE_ENABLED"),
+            ttl=int(os.getenv("STORE_CACHE_TTL", "300")),
+            list_ttl=int(os.getenv("STORE_CACHE_LIST_TTL", "60")),
+            lock_ttl_ms=int(os.getenv("STORE_CACHE_LOCK_TTL_MS", "2000")),
+            lock_wait_ms=int(os.getenv("STORE_CACHE_LOCK_WAIT_MS", "200")),
+        )
+
+    def _read(self, key, version_key):
+        # One MGET for cached entry + current version; returns (entry or None, version)
+        # An entry is "<version>|<headers json>\n<body>" (json.dumps never emits a raw newline).
+        cached, version = self.client.mget([key, version_key])
+        version = version or "0"
+        if cached:
+            cached_version, _, entry = cached.partition("|")
+            if cached_version == version:
+                return entry, version
+        return None, version
+
+    def _write(self, key, version, response, ttl):
+        # Jitter spreads the expiry of keys filled at the same moment.
+        expire = ttl + random.randint(0, max(1, ttl // 10))
+        headers = {name: response.headers[name] for name in self.cached_headers if name in response.headers}
+        entry = f"{json.dumps(headers)}\n{response.get_data(as_text=True)}"
+        self.client.set(key, f"{version}|{entry}", ex=expire)
+
+    def get_or_load(self, key, loader, ttl, version_key=None):
+        """
+        Return a Flask response for key, calling loader() on a miss. loader() returns the dumped payload, or a
+        (payload, headers) tuple; it may abort() (e.g. 404), in which case nothing is cached.
+        """
+        version_key = version_key or f"{key}:v"
+        try:
+            entry, version = self._read(key, version_key)
+            if entry is not None:
+                return self._from_entry(entry)
+
+            lock_key = f"{key}:lock"
+            lock_token = uuid.uuid4().hex
+            if not self.client.set(lock_key, lock_token, nx=True, px=self.lock_ttl_ms):
+                entry = self._wait_for_fill(key, version_key)
+                if entry is not None:
+                    return self._from_entry(entry)
+                return self._render(loader())
+        except redis.RedisError:
+            return self._render(loader())
+
+        try:
+            response = self._render(loader())
+            try:
+                self._write(key, version, response, ttl)
+            except redis.RedisError:
+                pass
+            return response
+        finally:
+            try:
+                if self.client.get(lock_key) == lock_token:
+                    self.client.delete(lock_key)
+            except redis.RedisError:
+                pass
+
+    def _wait_for_fill(self, key, version_key):
+        deadline = time.monotonic() + self.lock_wait_ms / 1000
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval_ms / 1000)
+            entry, _ = self._read(key, version_key)
+            if entry is not None:
+                return entry
+        return None
+
+    def invalidate(self, *keys):
+        """Bump the version of every key (call after the write is committed)."""
+        if not self.enabled or not keys:
+            return
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(f"{key}:v")
+                    pipe.expire(f"{key}:v", self.version_ttl)
+                    pipe.delete(key)
+                pipe.execute()
+        except redis.RedisError:
+            # The bodies will still expire on their own TTL.
+            current_app.logger.warning("Store cache invalidation failed for %s", keys)
+
+    @staticmethod
+    def _render(result):
+        # Same encoding as flask-smorest's @blp.response, so cached and uncached bodies are byte-identical.
+        payload, headers = result if isinstance(result, tuple) else (result, {})
+        response = jsonify(payload)
+        response.headers.extend(headers)
+        return response
+
+    @staticmethod
+    def _from_entry(entry):
+        headers, _, body = entry.partition("\n")
+        response = current_app.response_class(body, mimetype=current_app.json.mimetype)
+        response.headers.extend(json.loads(headers))
+        return response
+
+
+store_cache = StoreCache.from_env(client=redis_client)
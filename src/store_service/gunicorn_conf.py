@@ -0,0 +1,78 @@
+# store_service/src/store_service/gunicorn_conf.py
+import multiprocessing
+import os
+
+from store_service.utils.config import env_flag
+
+"""
+    Production server settings:  gunicorn -c python:store_service.gunicorn_conf run:app
+
+    Pre-forking master with WEB_CONCURRENCY worker processes, each serving GUNICORN_THREADS requests at a time
+    (gthread worker). Requests spend most of their time waiting on MySQL and Redis, so threads give concurrency
+    cheaply while processes give CPU parallelism and isolation.
+
+    Sizing for the K8s limits in K8s/store-deployment.yaml (cpu 500m, memory 512Mi):
+    - half a core cannot keep more than one process busy, so 2 workers (one can run while the other waits on I/O)
+      x 4 threads = 8 concurrent requests per pod; scale out with replicas rather than workers.
+    - each worker is ~90-120 MiB RSS after the first requests (Flask, SQLAlchemy, marshmallow, redis); with the
+      preloaded master that is ~300 MiB per pod, leaving headroom below 512Mi for bursts and max_requests recycling.
+    - keep threads x workers <= SQLALCHEMY_POOL_SIZE + SQLALCHEMY_MAX_OVERFLOW per worker and <= REDIS_MAX_CONNECTIONS,
+      otherwise threads queue on the pools instead of the socket backlog.
+    When no limit is given the default is (2 x CPU) + 1 workers.
+
+    Reloads: SIGHUP restarts the workers gracefully with the preloaded code; to deploy new code in place send
+    SIGUSR2 (start a new master) and then SIGTERM to the old one. In K8s a rolling update replaces the pod instead,
+    and SIGTERM lets in-flight requests finish for up to GUNICORN_GRACEFUL_TIMEOUT seconds.
+"""
+
+
+def _int_env(name, default):
+    return int(os.getenv(name, default))
+
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+
+workers = _int_env("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1)
+worker_class = "gthread"
+threads = _int_env("GUNICORN_THREADS", 4)
+
+# Import create_app() once in the master; workers are forked from it (copy-on-write, faster boot).
+preload_app = env_flag("GUNICORN_PRELOAD", "true")
+
+keepalive = _int_env("GUNICORN_KEEPALIVE", 5)
+timeout = _int_env("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _int_env("GUNICORN_GRACEFUL_TIMEOUT", 25)
+backlog = _int_env("GUNICORN_BACKLOG", 2048)
+
+# Recycle workers now and then to cap slow memory growth; jitter avoids all workers restarting together.
+max_requests = _int_env("GUNICORN_MAX_REQUESTS", 5000)
+max_requests_jitter = _int_env("GUNICORN_MAX_REQUESTS_JITTER", 500)
+
+# Heartbeat files in memory rather than on the container's overlay filesystem
+worker_tmp_dir = os.getenv("GUNICORN_WORKER_TMP_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    # Sockets opened by the master while preloading (db.create_all(), ...) must not be shared between processes.
+    # The Redis pools reset themselves on first use in a new pid; the SQLAlchemy pools have to be told.
+    from store_service.extensions.db import db
+
+    app = getattr(worker, "app", None)
+    flask_app = app.wsgi() if app is not None and preload_app else None
+    if flask_app is None:
+        return
+    with flask_app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    # Drop the per-process files of a dead worker from the Prometheus multiprocess directory
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,17 +1,179 @@
+import os
+
+# Service characters used when an interchange has no UNA segment (ISO 9735 defaults)
+DEFAULT_COMPONENT_SEPARATOR = ":"
+DEFAULT_ELEMENT_SEPARATOR = "+"
+DEFAULT_DECIMAL_MARK = "."
+DEFAULT_RELEASE_CHARACTER = "?"
+DEFAULT_SEGMENT_TERMINATOR = "'"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _read_service_string(stream):
+    """
+    Returns (delimiters, first chunk of data after the UNA segment).
+    UNA is exactly 9 characters: "UNA" + component sep, element sep, decimal mark, release char, reserved, terminator.
+    """
+    head = ""
+    while len(head) < 9:
+        data = stream.read(9 - len(head))
+        if not data:
+            break
+        head += data
+
+    stripped = head.lstrip()
+    if not stripped.startswith("UNA"):
+        return (
+            DEFAULT_COMPONENT_SEPARATOR,
+            DEFAULT_ELEMENT_SEPARATOR,
+            DEFAULT_RELEASE_CHARACTER,
+            DEFAULT_SEGMENT_TERMINATOR,
+        ), head
+
+    # Leading whitespace shifted the segment; read the characters it pushed out of the first 9.
+    head = stripped + stream.read(9 - len(stripped))
+    if len(head) < 9:
+        raise ValueError("Truncated UNA service string advice")
+    component, element, _decimal, release, _reserved, terminator = head[3:9]
+    return (component, element, release if release.strip() else None, terminator), ""
+
+
+def _ends_with_release(text, release):
+    # An odd run of release characters at the end means the following delimiter is escaped.
+    trailing = len(text) - len(text.rstrip(release))
+    return trailing % 2 == 1
+
+
+def _iter_segment_texts(stream, pending, terminator, release, chunk_size):
+    # Splits the raw stream on unescaped segment terminators; only the unterminated tail is carried between chunks.
+    tail = ""
+    while True:
+        chunk = pending or stream.read(chunk_size)
+        pending = ""
+        if not chunk:
+            break
+        data = tail + chunk
+        pieces = data.split(terminator)
+        tail = pieces.pop()
+        if release and release in data:
+            merged = []
+            for piece in pieces:
+                if merged and _ends_with_release(merged[-1], release):
+                    merged[-1] += terminator + piece
+                else:
+                    merged.append(piece)
+            if merged and _ends_with_release(merged[-1], release):
+                tail = merged.pop() + terminator + tail
+            pieces = merged
+        yield from pieces
+    if tail.strip():
+        yield tail
+
+
+def _split_escaped(text, separator, release):
+    parts = []
+    current = []
+    position = 0
+    while True:
+        index = text.find(separator, position)
+        if index == -1:
+            current.append(text[position:])
+            break
+        if _ends_with_release(text[position:index], release):
+            current.append(text[position:index] + separator)
+        else:
+            current.append(text[position:index])
+            parts.append("".join(current))
+            current = []
+        position = index + len(separator)
+    parts.append("".join(current))
+    return parts
+
+
+def _unescape(text, release):
+    if release not in text:
+        return text
+    result = []
+    position = 0
+    while True:
+        index = text.find(release, position)
+        if index == -1 or index == len(text) - 1:
+            result.append(text[position:])
+            break
+        result.append(text[position:index])
+        result.append(text[index + 1])
+        position = index + 2
+    return "".join(result)
+
+
+def iter_segments(source, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8"):
+    """
+    Incrementally tokenizes an EDIFACT interchange and yields every segment in file order.
+
+    source is a file path or an open text stream. Each segment is a list of data elements and each element is a
+    list of its components, with release characters already resolved:
+        BGM+220+2+9'   -> [["BGM"], ["220"], ["2"], ["9"]]
+        PRI+AAA:1?+2'  -> [["PRI"], ["AAA", "1+2"]]
+    Delimiters come from the UNA segment when present (UNA itself is not yielded). Only one chunk and the current
+    segment are held in memory, so the size of the file does not matter.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding=encoding, newline="") as stream:
+            yield from iter_segments(stream, chunk_size=chunk_size)
+        return
+
+    (component_sep, element_sep, release, terminator), pending = _read_service_string(source)
+
+    for text in _iter_segment_texts(source, pending, terminator, release, chunk_size):
+        # Line breaks between segments are layout, not data (same as the previous split/strip parser).
+        text = text.strip("\r\n\t ")
+        if not text:
+            continue
+        if not release or release not in text:
+            # Fast path: plain str.split, no escapes to resolve
+            yield [element.split(component_sep) for element in text.split(element_sep)]
+        else:
+            yield [
+                [_unescape(component, release) for component in _split_escaped(element, component_sep, release)]
+                for element in _split_escaped(text, element_sep, release)
+            ]
+
+
+def iter_messages(source, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8"):
+    """
+    Yields the segments of every UNH ... UNT message of an interchange, one list per message (UNH and UNT included).
+    Interchange / group envelopes (UNB, UNG, UNE, UNZ) are skipped.
+    """
+    message = None
+    for segment in iter_segments(source, chunk_size=chunk_size, encoding=encoding):
+        tag = segment[0][0]
+        if tag == "UNH":
+            if message is not None:
+                raise ValueError("UNH found before the UNT of the previous message")
+            message = [segment]
+        elif message is not None:
+            message.append(segment)
+            if tag == "UNT":
+                yield message
+                message = None
+    if message is not None:
+        raise ValueError("Message is missing its UNT segment")
+
+
+def segment_parts(segment, component_separator=DEFAULT_COMPONENT_SEPARATOR):
+    # Flat form used by parse_edifact(): ["BGM", "220", "2", "9"], composites joined back with ":".
+    return [component_separator.join(element) for element in segment]
+
+
 def parse_edifact(file_path: str) -> dict:
     """
     Reads an EDIFACT .edi file and returns parsed segments as a dict.
+    The dict is keyed by tag, so only the last occurrence of a repeated segment is kept; use iter_segments() /
+    iter_messages() when every segment is needed.
     """
     segments = {}
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read().strip()
-
-    # EDIFACT segments are usually separated by `'`
-    for segment in content.split("'"):
-        segment = segment.strip()
-        if not segment:
-            continue
-        parts = [part.strip() for part in segment.split("+")]
-        tag = parts[0]
-        segments[tag] = parts
+    for segment in iter_segments(file_path):
+        parts = [part.strip() for part in segment_parts(segment)]
+        segments[parts[0]] = parts
     return segments
@@ -1,16 +1,37 @@
 import os
-from dotenv import load_dotenv
+import time
 
-load_dotenv()
+_IMPORT_STARTED = time.perf_counter()
+
+from store_service.utils.config import env_flag
+
+# Local development reads .env; containers get their environment from K8s (LOAD_DOTENV=false skips the lookup).
+# Must run before the imports below, some of them read the environment at import time.
+if env_flag("LOAD_DOTENV", "true"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 from flask import Flask, jsonify
-from flask_jwt_extended import JWTManager
 from flask_smorest import Api
 from flask_cors import CORS
 
-from store_service.extensions.db import db
+from store_service.commands import ingest_edifact_command, init_db_command
+from store_service.extensions.compression import init_compression
+from store_service.extensions.db import db, engine_options_from_env, pool_stats as db_pool_stats
+from store_service.extensions.jwt_cache import CachingJWTManager, jwt_cache
+from store_service.extensions.metrics import init_metrics
+from store_service.extensions.profiling import init_profiling
+from store_service.extensions.rate_limit import init_rate_limiting
+from store_service.extensions.read_replicas import init_read_replicas
+from store_service.extensions.redis_client import pool_stats as redis_pool_stats
+from store_service.extensions.session_cache import session_cache
 # Import all models to register them with SQLAlchemy
+from store_service.models import order_db  # noqa: F401
 from store_service.resources.store import blp as StoreBp
+from store_service.utils.startup import StartupTimings
+
+_IMPORTS_FINISHED = time.perf_counter()
 
 # This is called factory pattern
 
@@ -19,6 +40,10 @@ from store_service.resources.store import blp as StoreBp
 # db_name = Resources.config.DB_NAME
 # db_host = Resources.config.DB_HOST
 def create_app(db_url=None):
+    timings = StartupTimings(started=_IMPORT_STARTED)
+    timings.mark("imports", now=_IMPORTS_FINISHED)
+    timings.resume()
+
     store_service = Flask(__name__)
     store_service.config["CORS_AUTOMATIC_OPTIONS"] = True
     store_service.config["PROPAGATE_EXCEPTIONS"] = True
@@ -31,16 +56,17 @@ def create_app(db_url=None):
     store_service.config["OPENAPI_SWAGGER_UI_URL"] = "https://cdn.jsdelivr.net/npm/swagger-ui-dist/"
     store_service.config['TESTING'] = True  # Enable testing mode for the Flask app
     
-    # Configure CORS for production
-    allowed_origins = os.getenv('ALLOWED_ORIGINS').split(",")
-    allowed_origins = [origin.strip() for origin in allowed_origins]
-    
+    # Configure CORS for production (no cross-origin access when ALLOWED_ORIGINS is not set)
+    allowed_origins = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "").split(",") if origin.strip()]
+    if not allowed_origins:
+        print("ALLOWED_ORIGINS is not set: cross-origin requests are refused")
+
     CORS(
     store_service,
     origins=allowed_origins,
     supports_credentials=True,
     allow_headers=["Content-Type", "Authorization"],
-    methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     intercept_exceptions=True
     )
 
@@ -69,13 +95,27 @@ def create_app(db_url=None):
 
     SQLALCHEMY_DATABASE_URI = (f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}@"
                                f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT', '3306')}/{os.getenv('MYSQL_DATABASE')}")
-    print("Connecting to DB:", SQLALCHEMY_DATABASE_URI)  # helpful for debugging
 
-    store_service.config["SQLALCHEMY_DATABASE_URI"] = SQLALCHEMY_DATABASE_URI
+    store_service.config["SQLALCHEMY_DATABASE_URI"] = db_url or SQLALCHEMY_DATABASE_URI
+    # Pool size / overflow / timeouts / recycle / pre-ping from the environment (see extensions/db.py)
+    store_service.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options_from_env(
+        store_service.config["SQLALCHEMY_DATABASE_URI"]
+    )
+    timings.mark("config")
+
     db.init_app(store_service)  # db is SQLAlchemy extension
+    # GET requests read from DB_REPLICA_URLS, round-robin; writes and the writer's next reads use the primary
+    init_read_replicas(store_service)
+    timings.mark("extensions")
 
-    with store_service.app_context():
-        db.create_all()
+    """
+        DB_CREATE_ALL=false skips the schema check at boot (one round trip per table, in every worker). Use it where
+        the tables are managed by the migration job (K8s/db-migration-job.yaml) or by `flask init-db`.
+    """
+    if env_flag("DB_CREATE_ALL", "true"):
+        with store_service.app_context():
+            db.create_all()
+    timings.mark("schema")
 
     api = Api(store_service)
 
@@ -102,7 +142,9 @@ def create_app(db_url=None):
 
     store_service.config["JWT_SECRET_KEY"] = os.environ.get("JWT_SECRET_KEY")
     store_service.config["JWT_TOKEN_LOCATION"] = ["headers"]
-    JWTManager(store_service)
+    # JWTManager that remembers verified tokens until their exp (JWT_CACHE_ENABLED, see extensions/jwt_cache.py)
+    CachingJWTManager(store_service)
+    timings.mark("extensions")
 
     # @store_service.before_request
     # def create_tables():
@@ -112,6 +154,46 @@ def create_app(db_url=None):
     def health():
         return jsonify({"status": "healthy"}), 200
 
+    # Per-worker counters of the in-process caches (each worker process reports its own numbers)
+    @store_service.route("/stats")
+    def stats():
+        replicas = store_service.extensions.get("read_replicas")
+        return jsonify({
+            "session_cache": session_cache.stats(),
+            "jwt_cache": jwt_cache.stats(),
+            "redis_pool": redis_pool_stats(),
+            "db_pool": db_pool_stats(db.engine),
+            **rate_limiting.stats(),
+            "read_replicas": {
+                **replicas.stats(),
+                "pools": {bind_key: db_pool_stats(engine) for bind_key, engine in replicas.engines.items()},
+            } if replicas else None,
+            "startup": timings.as_dict(),
+        }), 200
+
     api.register_blueprint(StoreBp)
+    timings.mark("blueprints")
+
+    # GET /metrics (Prometheus): per-route latency, status codes, in-flight requests, DB and Redis timings
+    init_metrics(store_service)
+
+    # 429 per user and route (RATE_LIMIT_ENABLED, token buckets in Redis) and 503 when this worker is saturated
+    # (LOAD_SHED_*); registered after the metrics hooks so rejected requests are still counted
+    rate_limiting = init_rate_limiting(store_service)
+
+    # Opt-in request profiling (PROFILING_ENABLED): collapsed stacks + SQL per profiled request in PROFILING_DIR
+    init_profiling(store_service)
+
+    # gzip for JSON bodies of COMPRESSION_MIN_SIZE bytes or more when the client accepts it (COMPRESSION_ENABLED)
+    init_compression(store_service)
+
+    # flask ingest-edifact <directory>: nightly EDIFACT batch load; flask init-db: create the tables
+    store_service.cli.add_command(ingest_edifact_command)
+    store_service.cli.add_command(init_db_command)
+
+    store_service.before_request(timings.first_request)
+    timings.mark("observability")
+    store_service.config["STARTUP_TIMINGS"] = timings
+    print("Startup timings (ms):", timings.summary())
 
-    return store_service
\ No newline at end of file
+    return store_service
@@ -0,0 +1,32 @@
+from store_service.extensions.db import db
+
+
+class OrderModel(db.Model):
+    # One row per EDIFACT ORDERS message loaded by the batch ingestion (flask ingest-edifact)
+    __tablename__ = "edifact_orders"
+    __table_args__ = (
+        db.UniqueConstraint("source_file", "message_index", name="uq_edifact_orders_source_file_message_index"),
+    )
+
+    order_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    source_file = db.Column(db.String(255), nullable=False)
+    message_index = db.Column(db.Integer, nullable=False)  # position of the UNH..UNT message in the file
+
+    store_number = db.Column(db.Integer, nullable=False, index=True)
+    order_status = db.Column(db.String(20), nullable=False)
+    total_amount = db.Column(db.Numeric(14, 2), nullable=False)
+    currency = db.Column(db.String(3), nullable=False)
+    line_count = db.Column(db.Integer, nullable=False)
+
+
+class IngestCheckpointModel(db.Model):
+    # Files already handled by the ingestion; written in the same transaction as their orders so a crash never
+    # leaves a file half loaded or loaded twice.
+    __tablename__ = "edifact_ingest_checkpoints"
+
+    source_file = db.Column(db.String(255), primary_key=True)
+    file_size = db.Column(db.BigInteger, nullable=False)
+    file_mtime_ns = db.Column(db.BigInteger, nullable=False)  # os.stat().st_mtime_ns, compared exactly
+    status = db.Column(db.String(10), nullable=False)  # done | failed
+    message_count = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.String(255), nullable=True)
@@ -4,6 +4,15 @@ class StoreModel(db.Model):
     __tablename__ = "stores"
     __table_args__ = (
         db.UniqueConstraint("user_id", "store_number", name="uq_stores_user_id_store_number"),
+        # Keyset pagination of GET /stores: WHERE user_id = ? AND store_id > ? ORDER BY store_id
+        # version makes it covering for the ETag check of a page (store_id, version only, no row lookups)
+        db.Index("ix_stores_user_id_store_id_version", "user_id", "store_id", "version"),
+        # GET /stores/search (every search is scoped to the owner). The primary key is implicitly part of each
+        # secondary index, so the matching store_ids and COUNT(*) of a search come from the index alone.
+        db.Index("ix_stores_user_id_location", "user_id", "country_code", "state_code", "pin_code", "shipping_time"),
+        db.Index("ix_stores_user_id_shipping_time", "user_id", "shipping_time"),
+        db.Index("ix_stores_user_id_store_name", "user_id", "store_name"),
+        db.Index("ix_stores_user_id_customer_name", "user_id", "customer_name"),
     )
 
     store_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -21,4 +30,10 @@ class StoreModel(db.Model):
     state_code = db.Column(db.String(10), nullable=False)
     country_code = db.Column(db.String(10), nullable=False)
 
-    shipping_time = db.Column(db.Integer, nullable=False)  # e.g., days to ship
\ No newline at end of file
+    shipping_time = db.Column(db.Integer, nullable=False)  # e.g., days to ship
+
+    # Bumped by every update; ETag of GET /store/<id> and of the /stores pages (see utils/conditional.py)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    updated_at = db.Column(
+        db.DateTime, nullable=False, server_default=db.func.current_timestamp()
+    )  # Last-Modified, set by the database (UTC)
@@ -1,21 +1,92 @@
 import json
+import os
 
-from flask import request
+from flask import current_app, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_smorest import Blueprint, abort
 from flask.views import MethodView
-from sqlalchemy import text
+from sqlalchemy import delete, func, select, text, update
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
+from store_service.extensions.read_replicas import route_reads_to_primary
 from store_service.extensions.redis_client import redis_client
+from store_service.extensions.session_cache import session_cache
+from store_service.extensions.store_cache import store_cache, store_key, user_stores_key
 from store_service.extensions.db import db
 from store_service.models.store_db import StoreModel
-from store_service.schemas.store_schema import StoreSchema
+from store_service.schemas.store_schema import (
+    StoreBulkCreateResultSchema,
+    StoreBulkPatchSchema,
+    StoreBulkSelectionSchema,
+    StoreBulkWriteResultSchema,
+    StoreFieldsArgsSchema,
+    StoreListArgsSchema,
+    StoreSchema,
+    StoreSearchArgsSchema,
+)
+from store_service.utils.conditional import make_etag, not_modified, not_modified_from, validator_headers
+from store_service.utils.config import env_flag
+from store_service.utils.fast_json import can_replace_jsonify, json_response
+from store_service.utils.pagination import decode_cursor, page_size, paginate, paginate_rows
 
 # created a blueprint "stores" with description and Dunder method (__name__)
 # Dunder is usually used for operator overloading
 blp = Blueprint("stores", __name__, description="Operations on stores")
 
+STORE_INSERT_COLUMNS = (
+    "store_number",
+    "customer_name",
+    "store_name",
+    "address_line1",
+    "address_line2",
+    "address_line3",
+    "pin_code",
+    "state_code",
+    "country_code",
+    "shipping_time",
+    "user_id",
+)
+
+STORE_INSERT_STATEMENT = text(
+    """
+    INSERT INTO stores (
+        store_number,
+        customer_name,
+        store_name,
+        address_line1,
+        address_line2,
+        address_line3,
+        pin_code,
+        state_code,
+        country_code,
+        shipping_time,
+        user_id
+    ) VALUES (
+        :store_number,
+        :customer_name,
+        :store_name,
+        :address_line1,
+        :address_line2,
+        :address_line3,
+        :pin_code,
+        :state_code,
+        :country_code,
+        :shipping_time,
+        :user_id
+    )
+    """
+)
+
+BULK_CREATE_MAX_ROWS = int(os.getenv("BULK_CREATE_MAX_ROWS", "5000"))
+BULK_CREATE_CHUNK_SIZE = int(os.getenv("BULK_CREATE_CHUNK_SIZE", "500"))
+BULK_WRITE_MAX_STORES = int(os.getenv("BULK_WRITE_MAX_STORES", "5000"))
+BULK_WRITE_CHUNK_SIZE = int(os.getenv("BULK_WRITE_CHUNK_SIZE", "500"))
+
+# GET /stores without ORM objects or marshmallow: the columns StoreSchema dumps, straight from the rows, encoded
+# with orjson when it is installed. The body is byte-identical to the StoreSchema(many=True) + jsonify path.
+STORE_LIST_FAST_PATH = env_flag("STORE_LIST_FAST_PATH")
+STORE_LIST_COLUMNS = tuple(StoreModel.__table__.c[name] for name in StoreSchema().dump_fields)
+
 def validate_active_session(user_id):
     auth_header = request.headers.get("Authorization", "")
     token_parts = auth_header.split()
@@ -23,6 +94,11 @@ def validate_active_session(user_id):
         abort(401, message="Missing or invalid authorization token")
 
     token = token_parts[1]
+    # Opt-in per-worker cache (SESSION_CACHE_ENABLED); revocations are pushed to it over Redis pub/sub.
+    if session_cache.is_valid(user_id, token):
+        return
+
+    generation = session_cache.generation()
     cached_session = redis_client.get(f"session:{user_id}")
     if not cached_session:
         abort(401, message="Session expired or revoked")
@@ -36,21 +112,135 @@ def validate_active_session(user_id):
     if cached_token != token:
         abort(401, message="Session expired or revoked")
 
-def get_user_product_or_404(store_id, user_id):
-    store = StoreModel.query.filter_by(store_id=store_id, user_id=user_id).first()
-    if not store:
+    session_cache.add(user_id, token, generation)
+
+def parse_store_id_or_404(store_id):
+    # store_id comes from the URL as a string; anything that is not an integer cannot match a row.
+    try:
+        return int(store_id)
+    except (TypeError, ValueError):
         abort(404, message="Store not found")
-    return store
+
+
+def store_etag(store_id, version, columns):
+    return make_etag("store", store_id, version, tuple(column.key for column in columns))
+
+
+def store_page_etag(user_id, after, limit, columns, versions, next_cursor):
+    # Covers (store_id, version) of every row of the page, the fields and the next-page marker, so creates,
+    # updates and deletes all change it. No Last-Modified for pages: a delete leaves no updated_at behind.
+    fields = tuple(column.key for column in columns)
+    return make_etag("stores", user_id, after, limit, fields, versions, bool(next_cursor))
+
+
+def store_page_headers(etag, next_cursor):
+    headers = validator_headers(etag)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return headers
+
+
+def store_rows_page(columns, criteria, after, limit):
+    """
+    One keyset page of stores matching criteria, as (rows, ((store_id, version), ...), next_cursor). The rows are
+    already in dumped form: same keys and values as StoreSchema(many=True, only=<columns>).dump(stores).
+    """
+    stores = StoreModel.__table__
+    key_column, version_column = stores.c.store_id, stores.c.version
+    cursor_only = key_column.key not in {column.key for column in columns}
+    rows, next_cursor = paginate_rows(
+        db.session,
+        select(*columns, *((key_column,) if cursor_only else ()), version_column).where(*criteria),
+        key_column,
+        after,
+        limit,
+    )
+    versions = tuple((row[key_column.key], row.pop(version_column.key)) for row in rows)
+    if cursor_only:  # selected for the cursor, not asked for
+        for row in rows:
+            del row[key_column.key]
+    return rows, versions, next_cursor
+
+
+def search_criteria(user_id, search_args):
+    # WHERE clauses of GET /stores/search; each filter maps onto a prefix of one of the StoreModel indexes
+    stores = StoreModel.__table__
+    criteria = [stores.c.user_id == user_id]
+    for name in ("country_code", "state_code", "pin_code"):
+        if name in search_args:
+            criteria.append(stores.c[name] == search_args[name])
+    if "shipping_time_min" in search_args:
+        criteria.append(stores.c.shipping_time >= search_args["shipping_time_min"])
+    if "shipping_time_max" in search_args:
+        criteria.append(stores.c.shipping_time <= search_args["shipping_time_max"])
+    for name in ("store_name", "customer_name"):
+        if name in search_args:
+            # LIKE 'prefix%' with % and _ escaped: an index range scan, not a pattern match over the table
+            criteria.append(stores.c[name].startswith(search_args[name], autoescape=True))
+    return criteria
+
+
+def projected_columns(only):
+    # ?fields= in StoreSchema order (a stable cache key); every dumped column when no fields were asked for.
+    if not only:
+        return STORE_LIST_COLUMNS
+    return tuple(column for column in STORE_LIST_COLUMNS if column.key in only)
+
 
 # Inherit a class from MethodView whose methods will route to specific end-points because the blue-print is--
 # --prepared for that particular class
 # This blueprint method will route all the methods of this class to this particular end-point
 @blp.route("/store/<string:store_id>")
 class Store(MethodView):
+    @blp.arguments(StoreFieldsArgsSchema, location="query")
     @blp.response(200, StoreSchema)
-    def get(self, store_id):
-        store = StoreModel.query.get_or_404(store_id)
-        return store
+    @blp.alt_response(304, description="Not modified (If-None-Match matches the current ETag)")
+    def get(self, field_args, store_id):
+        only = field_args.get("only")
+        columns = projected_columns(only)
+
+        # Read-through cache (STORE_CACHE_ENABLED) returns the already serialized body and its ETag on a hit
+        if store_cache.enabled and store_id.isdigit():
+            route_reads_to_primary()  # the body is cached under the version the last writer set
+            key = store_key(int(store_id))
+            response = store_cache.get_or_load(
+                f"{key}:fields:{','.join(column.key for column in columns)}" if only else key,
+                lambda: self._load(columns, store_id, dump=True),
+                store_cache.ttl,
+                version_key=f"{key}:v",
+            )
+            return not_modified_from(response) or response
+
+        # Conditional GET: a primary key lookup of the version decides, the row is neither loaded nor dumped
+        if request.if_none_match:
+            stores = StoreModel.__table__
+            store_pk = parse_store_id_or_404(store_id)
+            row = db.session.execute(select(stores.c.version).where(stores.c.store_id == store_pk)).first()
+            if row is None:
+                abort(404, message="Store not found")
+            response = not_modified(store_etag(store_pk, row.version, columns))
+            if response is not None:
+                return response
+        return self._load(columns, store_id)
+
+    @staticmethod
+    def _load(columns, store_id, dump=False):
+        # Returns (store, ETag / Last-Modified headers); projections SELECT the requested columns only and
+        # StoreSchema dumps just the keys present in the row dict.
+        if columns is STORE_LIST_COLUMNS:
+            store = StoreModel.query.get_or_404(store_id)
+            headers = validator_headers(store_etag(store.store_id, store.version, columns), store.updated_at)
+            return (StoreSchema().dump(store) if dump else store), headers
+
+        stores = StoreModel.__table__
+        store_pk = parse_store_id_or_404(store_id)
+        statement = select(*columns, stores.c.version, stores.c.updated_at).where(stores.c.store_id == store_pk)
+        row = db.session.execute(statement).mappings().first()
+        if row is None:
+            abort(404, message="Store not found")
+        store = dict(row)
+        version, updated_at = store.pop("version"), store.pop("updated_at")
+        return store, validator_headers(store_etag(store_pk, version, columns), updated_at)
 
     # except KeyError:
     #     # return {"message": "store not found"}, 404
@@ -60,9 +250,23 @@ class Store(MethodView):
     def delete(self, store_id):
         user_id = int(get_jwt_identity())
         validate_active_session(user_id)
-        store = get_user_product_or_404(store_id, user_id)
-        db.session.delete(store)
-        db.session.commit()
+        store_pk = parse_store_id_or_404(store_id)
+
+        # Ownership check and delete in one statement: 0 rows means missing or owned by someone else.
+        try:
+            stores = StoreModel.__table__
+            result = db.session.execute(
+                delete(stores).where(stores.c.store_id == store_pk, stores.c.user_id == user_id)
+            )
+            if result.rowcount == 0:
+                db.session.rollback()
+                abort(404, message="Store not found")
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            abort(500, message="Error deleting store from database")
+
+        store_cache.invalidate(store_key(store_pk), user_stores_key(user_id))
         return {"message": "store deleted with store id " + store_id}
         # raise NotImplementedError("Not implemented delete store")
         # try:
@@ -82,20 +286,36 @@ class Store(MethodView):
         user_id = int(get_jwt_identity())
         validate_active_session(user_id)
 
-        store = get_user_product_or_404(store_id, user_id)
-
         if "product_code" in store_data:
             abort(400, message="product_code cannot be updated")
 
         # Ensure product ownership cannot be reassigned via request payload.
         store_data.pop("user_id", None)
         store_data.pop("store_id", None)
+        store_pk = parse_store_id_or_404(store_id)
 
-        for key, value in store_data.items():
-            setattr(store, key, value)
-
+        # UPDATE ... WHERE store_id AND user_id checks ownership in the same statement. Where the dialect supports
+        # UPDATE ... RETURNING (SQLite, PostgreSQL) the updated row comes back in that round trip; MySQL and MariaDB
+        # (no UPDATE ... RETURNING) re-read it by primary key inside the same transaction.
+        stores = StoreModel.__table__
+        statement = update(stores).where(stores.c.store_id == store_pk, stores.c.user_id == user_id).values(
+            **store_data,
+            # new ETag / Last-Modified for GET /store/<id> and the owner's /stores pages
+            version=stores.c.version + 1,
+            updated_at=func.current_timestamp(),
+        )
         try:
-            db.session.add(store)
+            if db.session.get_bind().dialect.update_returning:
+                store = db.session.execute(statement.returning(*stores.c)).mappings().first()
+            else:
+                result = db.session.execute(statement)
+                store = None
+                if result.rowcount:
+                    store = db.session.execute(select(stores).where(stores.c.store_id == store_pk)).mappings().first()
+            if store is None:
+                db.session.rollback()
+                abort(404, message="Store not found")
+            store = dict(store)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
@@ -104,20 +324,116 @@ class Store(MethodView):
             db.session.rollback()
             abort(500, message="Error updating product in database")
 
+        store_cache.invalidate(store_key(store_pk), user_stores_key(user_id))
         return store
 
 
 @blp.route("/stores")
 class StoreList(MethodView):
+    # Keyset pagination: ?limit=<n>&cursor=<X-Next-Cursor of the previous page>, ordered by store_id.
+    # The X-Next-Cursor response header is absent on the last page.
     @jwt_required()  # remove this later
+    @blp.arguments(StoreListArgsSchema, location="query")
     @blp.response(200, StoreSchema(many=True))
-    def get(self):
+    @blp.alt_response(304, description="Not modified (If-None-Match matches the current ETag)")
+    def get(self, list_args):
         # return StoreModel.query.all() - uncomment
         # store = StoreModel.query.get_or_404(store_id)
 
         # remove this part later
         user_id = int(get_jwt_identity())
-        return StoreModel.query.filter_by(user_id=user_id).all()
+        limit = page_size(list_args.get("limit"))
+        after = decode_cursor(list_args.get("cursor"))
+
+        only = list_args.get("only")
+        columns = projected_columns(only)
+        key_column = StoreModel.__table__.c.store_id
+        version_column = StoreModel.__table__.c.version
+
+        def page_etag(versions, next_cursor):
+            return store_page_etag(user_id, after, limit, columns, versions, next_cursor)
+
+        def page_headers(versions, next_cursor):
+            return store_page_headers(page_etag(versions, next_cursor), next_cursor)
+
+        def load_page():
+            stores, next_cursor = paginate(
+                StoreModel.query.filter_by(user_id=user_id), StoreModel.store_id, after, limit
+            )
+            return stores, page_headers(tuple((store.store_id, store.version) for store in stores), next_cursor)
+
+        def load_rows():
+            rows, versions, next_cursor = store_rows_page(
+                columns, (StoreModel.__table__.c.user_id == user_id,), after, limit
+            )
+            return rows, page_headers(versions, next_cursor)
+
+        fast_path = STORE_LIST_FAST_PATH and can_replace_jsonify()
+        if store_cache.enabled:
+            route_reads_to_primary()  # the page is cached under the version the last writer set
+
+            def load_dumped_page():
+                if fast_path or only:
+                    return load_rows()
+                stores, headers = load_page()
+                return StoreSchema(many=True).dump(stores), headers
+
+            page_key = f"{user_stores_key(user_id)}:{after}:{limit}"
+            response = store_cache.get_or_load(
+                f"{page_key}:fields:{','.join(column.key for column in columns)}" if only else page_key,
+                load_dumped_page,
+                store_cache.list_ttl,
+                version_key=f"{user_stores_key(user_id)}:v",
+            )
+            return not_modified_from(response) or response
+
+        # Conditional GET: (store_id, version) of the page come from the covering index, no rows are loaded
+        if request.if_none_match:
+            rows, next_cursor = paginate_rows(
+                db.session,
+                select(key_column, version_column).where(StoreModel.__table__.c.user_id == user_id),
+                key_column,
+                after,
+                limit,
+            )
+            response = not_modified(page_etag(tuple((row["store_id"], row["version"]) for row in rows), next_cursor))
+            if response is not None:
+                return response
+
+        if fast_path:
+            return json_response(*load_rows())
+        if only:
+            return load_rows()
+        return load_page()
+
+
+@blp.route("/stores/search")
+class StoreSearch(MethodView):
+    # Filters the caller's stores: ?country_code=&state_code=&pin_code= (exact match),
+    # ?shipping_time_min=&shipping_time_max= (inclusive range), ?store_name=&customer_name= (prefix).
+    # Paged like GET /stores (limit / cursor / fields); ?count=true adds the number of matches as X-Total-Count
+    # (a COUNT(*) answered from the matching index).
+    @jwt_required()
+    @blp.arguments(StoreSearchArgsSchema, location="query")
+    @blp.response(200, StoreSchema(many=True))
+    def get(self, search_args):
+        user_id = int(get_jwt_identity())
+        limit = page_size(search_args.get("limit"))
+        after = decode_cursor(search_args.get("cursor"))
+        criteria = search_criteria(user_id, search_args)
+        columns = projected_columns(search_args.get("only"))
+
+        rows, _versions, next_cursor = store_rows_page(columns, criteria, after, limit)
+        headers = {}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        if search_args["count"]:
+            total = db.session.execute(select(func.count()).select_from(StoreModel.__table__).where(*criteria))
+            headers["X-Total-Count"] = str(total.scalar_one())
+
+        if STORE_LIST_FAST_PATH and can_replace_jsonify():
+            return json_response(rows, headers)
+        return rows, headers
 
 
 @blp.route("/create_store")  # This is the end-point for creating a store
@@ -133,55 +449,228 @@ class StoreCreate(MethodView):
     def post(self, store_data):
         user_id = int(get_jwt_identity())
         validate_active_session(user_id)
+        if store_data.get("store_number") is None:
+            abort(400, message="store_number is required")
 
         try:
-            insert_statement = text(
-                """
-                INSERT INTO stores (
-                    store_number,
-                    customer_name,
-                    store_name,
-                    address_line1,
-                    address_line2,
-                    address_line3,
-                    pin_code,
-                    state_code,
-                    country_code,
-                    shipping_time,
-                    user_id
-                ) VALUES (
-                    :store_number,
-                    :customer_name,
-                    :store_name,
-                    :address_line1,
-                    :address_line2,
-                    :address_line3,
-                    :pin_code,
-                    :state_code,
-                    :country_code,
-                    :shipping_time,
-                    :user_id
-                )
-                """
-            )
-            db.session.execute(insert_statement, {**store_data, "user_id": user_id})
+            # Columns left out of the payload are stored as NULL, so they are returned as null too.
+            store = dict.fromkeys(STORE_INSERT_COLUMNS)
+            store.update(store_data, user_id=user_id)
+            result = db.session.execute(STORE_INSERT_STATEMENT, store)
             db.session.commit()
 
-            store = StoreModel.query.filter_by(
-                user_id=user_id,
-                store_number=store_data["store_number"],
-            ).first()
+            # The generated primary key comes back with the INSERT; no second SELECT is needed.
+            store["store_id"] = result.lastrowid
         except IntegrityError:
             db.session.rollback()
-            abort(400, message="Store number already exists for this user")
+            # The unique (user_id, store_number) key, or a NOT NULL column left out of the payload
+            duplicate = db.session.query(StoreModel.store_id).filter_by(
+                user_id=user_id, store_number=store_data["store_number"]
+            ).first()
+            if duplicate:
+                abort(400, message="Store number already exists for this user")
+            abort(400, message="Store violates a database constraint")
         except SQLAlchemyError as e:
             db.session.rollback()
             print("SQLAlchemy error:", str(e))
             abort(500, message="Store not available while creating")
 
+        store_cache.invalidate(user_stores_key(user_id))
         return store
 
         # store_id = uuid.uuid4().hex  # unique universal id is being generated
         # new_store = {**store_data, "store_id": store_id}
         # stores_data.stores[store_id] = new_store
         # return stores_data.stores, 201
+
+
+def _insert_store_chunk(rows, user_id):
+    """
+    Insert one chunk of (index, store_data) rows in a single transaction and return per-row results.
+    Store numbers the user already owns are reported as conflicts without being sent to the database; the rest
+    go out as one multi-row executemany. If the batch still hits a constraint (e.g. a concurrent insert), the
+    chunk is replayed row by row inside savepoints so only the offending rows fail.
+    """
+    numbers = [store_data["store_number"] for _, store_data in rows]
+    existing = {
+        number for (number,) in db.session.query(StoreModel.store_number).filter(
+            StoreModel.user_id == user_id, StoreModel.store_number.in_(numbers)
+        )
+    }
+
+    results = {}
+    to_insert = []
+    for index, store_data in rows:
+        if store_data["store_number"] in existing:
+            results[index] = {"status": "conflict", "message": "Store number already exists for this user"}
+        else:
+            params = dict.fromkeys(STORE_INSERT_COLUMNS)
+            params.update(store_data, user_id=user_id)
+            to_insert.append((index, params))
+
+    if to_insert:
+        try:
+            db.session.execute(STORE_INSERT_STATEMENT, [params for _, params in to_insert])
+            db.session.commit()
+            inserted = [index for index, _ in to_insert]
+        except IntegrityError:
+            db.session.rollback()
+            inserted = []
+            for index, params in to_insert:
+                try:
+                    with db.session.begin_nested():
+                        db.session.execute(STORE_INSERT_STATEMENT, params)
+                    inserted.append(index)
+                except IntegrityError:
+                    duplicate = db.session.query(StoreModel.store_id).filter_by(
+                        user_id=user_id, store_number=params["store_number"]
+                    ).first()
+                    if duplicate:
+                        results[index] = {"status": "conflict", "message": "Store number already exists for this user"}
+                    else:
+                        results[index] = {"status": "error", "message": "Store violates a database constraint"}
+            db.session.commit()
+
+        params_by_index = dict(to_insert)
+        inserted_numbers = {params_by_index[index]["store_number"]: index for index in inserted}
+        for store_id, number in db.session.query(StoreModel.store_id, StoreModel.store_number).filter(
+            StoreModel.user_id == user_id, StoreModel.store_number.in_(list(inserted_numbers))
+        ):
+            results[inserted_numbers[number]] = {"status": "created", "store_id": store_id}
+
+    return results
+
+
+@blp.route("/create_stores")  # Bulk variant of /create_store
+class StoreBulkCreate(MethodView):
+    # Accepts a JSON array of stores. Rows are inserted in chunks of BULK_CREATE_CHUNK_SIZE (one transaction and
+    # one executemany per chunk) and every row gets its own result, so a duplicate store_number only fails that
+    # row. Responds 201 when every row was created, 207 (Multi-Status) otherwise.
+    @jwt_required()
+    @blp.arguments(StoreSchema(many=True))
+    @blp.response(201, StoreBulkCreateResultSchema)
+    @blp.alt_response(207, schema=StoreBulkCreateResultSchema, description="Some rows were not created")
+    def post(self, stores_data):
+        user_id = int(get_jwt_identity())
+        validate_active_session(user_id)
+
+        if not stores_data:
+            abort(400, message="No stores to create")
+        if len(stores_data) > BULK_CREATE_MAX_ROWS:
+            abort(413, message=f"At most {BULK_CREATE_MAX_ROWS} stores can be created per request")
+
+        results = {}
+        seen_numbers = set()
+        pending = []
+        for index, store_data in enumerate(stores_data):
+            if store_data.get("store_number") is None:
+                results[index] = {"status": "error", "message": "store_number is required"}
+            elif store_data["store_number"] in seen_numbers:
+                results[index] = {"status": "conflict", "message": "Duplicate store number in request"}
+            else:
+                seen_numbers.add(store_data["store_number"])
+                pending.append((index, store_data))
+
+        for start in range(0, len(pending), BULK_CREATE_CHUNK_SIZE):
+            chunk = pending[start:start + BULK_CREATE_CHUNK_SIZE]
+            try:
+                results.update(_insert_store_chunk(chunk, user_id))
+            except SQLAlchemyError:
+                db.session.rollback()
+                current_app.logger.exception("Bulk store insert failed for user %s", user_id)
+                for index, _ in chunk:
+                    results[index] = {"status": "error", "message": "Store not available while creating"}
+
+        store_cache.invalidate(user_stores_key(user_id))
+
+        rows = [
+            {"index": index, "store_number": store_data.get("store_number"), **results[index]}
+            for index, store_data in enumerate(stores_data)
+        ]
+        created = sum(1 for row in rows if row["status"] == "created")
+        return {"created": created, "failed": len(rows) - created, "results": rows}, (201 if created == len(rows) else 207)
+
+
+def bulk_target_ids(user_id, selection):
+    """
+    Sorted store_ids a bulk request applies to. Listed ids are taken as they are (the UPDATE / DELETE skips the ones
+    the caller does not own); a filter is resolved with one SELECT on the owner's indexes that also locks the rows,
+    so the writes hit exactly the stores that matched.
+    """
+    if "store_ids" in selection:
+        ids = sorted(set(selection["store_ids"]))
+    else:
+        stores = StoreModel.__table__
+        statement = (
+            select(stores.c.store_id)
+            .where(*search_criteria(user_id, selection["filter"]))
+            .order_by(stores.c.store_id)
+            .limit(BULK_WRITE_MAX_STORES + 1)
+            .with_for_update()
+        )
+        ids = list(db.session.execute(statement).scalars())
+    if len(ids) > BULK_WRITE_MAX_STORES:
+        db.session.rollback()
+        abort(413, message=f"At most {BULK_WRITE_MAX_STORES} stores can be changed per request")
+    return ids
+
+
+def bulk_write(user_id, selection, make_statement):
+    """
+    Runs make_statement(where) for every BULK_WRITE_CHUNK_SIZE selected ids - a set-based
+    UPDATE / DELETE ... WHERE store_id IN (<chunk>) AND user_id = :user_id - in one transaction, and returns the
+    number of rows affected. All chunks commit together, so a failure leaves every store as it was.
+    """
+    stores = StoreModel.__table__
+    try:
+        ids = bulk_target_ids(user_id, selection)
+        affected = 0
+        for start in range(0, len(ids), BULK_WRITE_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_WRITE_CHUNK_SIZE]
+            result = db.session.execute(make_statement((stores.c.store_id.in_(chunk), stores.c.user_id == user_id)))
+            affected += result.rowcount
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        abort(400, message="Stores violate a database constraint")
+    except SQLAlchemyError:
+        db.session.rollback()
+        current_app.logger.exception("Bulk store write failed for user %s", user_id)
+        abort(500, message="Error writing stores to database")
+
+    store_cache.invalidate(*(store_key(store_id) for store_id in ids), user_stores_key(user_id))
+    return affected
+
+
+@blp.route("/stores/bulk")  # Bulk variants of PUT / DELETE /store/<store_id>
+class StoreBulk(MethodView):
+    # Both take {"store_ids": [...]} or {"filter": {<GET /stores/search filters>}}, scoped to the caller's stores,
+    # check the session once and write with one statement per BULK_WRITE_CHUNK_SIZE stores. Ids that do not exist
+    # or belong to someone else are left alone and not counted.
+    @jwt_required()
+    @blp.arguments(StoreBulkPatchSchema)
+    @blp.response(200, StoreBulkWriteResultSchema)
+    def patch(self, bulk_data):
+        user_id = int(get_jwt_identity())
+        validate_active_session(user_id)
+
+        stores = StoreModel.__table__
+        values = dict(
+            bulk_data["patch"],
+            # new ETag / Last-Modified for every changed store, as in Store.put
+            version=stores.c.version + 1,
+            updated_at=func.current_timestamp(),
+        )
+        updated = bulk_write(user_id, bulk_data, lambda where: update(stores).where(*where).values(**values))
+        return {"updated": updated}
+
+    @jwt_required()
+    @blp.arguments(StoreBulkSelectionSchema)
+    @blp.response(200, StoreBulkWriteResultSchema)
+    def delete(self, bulk_data):
+        user_id = int(get_jwt_identity())
+        validate_active_session(user_id)
+
+        stores = StoreModel.__table__
+        deleted = bulk_write(user_id, bulk_data, lambda where: delete(stores).where(*where))
+        return {"deleted": deleted}
@@ -0,0 +1,205 @@
+import asyncio
+import json
+
+import redis
+from flask_jwt_extended import decode_token
+from marshmallow import EXCLUDE, ValidationError
+from sqlalchemy import delete, select
+from werkzeug.exceptions import HTTPException
+from werkzeug.wrappers import Response
+
+from store_service.extensions.session_cache import session_cache
+from store_service.extensions.store_cache import store_cache, store_key, user_stores_key
+from store_service.models.store_db import StoreModel
+from store_service.resources.store import projected_columns, store_etag, store_page_etag, store_page_headers
+from store_service.schemas.store_schema import StoreFieldsArgsSchema, StoreListArgsSchema
+from store_service.utils.conditional import validator_headers
+from store_service.utils.fast_json import dumps
+from store_service.utils.pagination import decode_cursor, page_size, paginate_rows_async
+
+"""
+    Async versions of the store endpoints served by store_service/asgi.py: GET /store/<id>, GET /stores and
+    DELETE /store/<id>. Session checks go through redis.asyncio and SQL through the AsyncEngine, so a worker
+    keeps many of these requests in flight while they wait on MySQL and Redis.
+
+    Each handler covers the common path only and returns None for everything else (invalid token or arguments,
+    unknown store, revoked session, store cache enabled, ...). The request is then served by the Flask
+    resource in resources/store.py, so error bodies, status codes and headers stay those of the WSGI app.
+    Successful bodies are byte-identical to it as well (fast_json.dumps of the dumped columns).
+"""
+
+stores = StoreModel.__table__
+
+
+def json_response(payload, status=200, headers=None):
+    return Response(dumps(payload), status=status, headers=headers, mimetype="application/json")
+
+
+def not_modified(request, etag):
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def jwt_identity(flask_app, request):
+    # @jwt_required() for the async handlers: (user_id, token) of a valid access token, else None
+    token_parts = request.headers.get("Authorization", "").split()
+    if len(token_parts) != 2 or token_parts[0] != flask_app.config["JWT_HEADER_TYPE"]:
+        return None
+    try:
+        with flask_app.app_context():
+            claims = decode_token(token_parts[1])
+        if claims.get("type") != "access":
+            return None
+        return int(claims[flask_app.config["JWT_IDENTITY_CLAIM"]]), token_parts[1]
+    except Exception:
+        return None
+
+
+async def has_active_session(redis_client, user_id, token):
+    # validate_active_session() on redis.asyncio: True when the token is the user's current session
+    if session_cache.is_valid(user_id, token):
+        return True
+    generation = session_cache.generation()
+    try:
+        cached_session = await redis_client.get(f"session:{user_id}")
+    except redis.RedisError:
+        return False
+    if not cached_session:
+        return False
+    try:
+        cached_token = json.loads(cached_session).get("token")
+    except Exception:
+        return False
+    if cached_token != token:
+        return False
+    session_cache.add(user_id, token, generation)
+    return True
+
+
+def _load_args(schema, request):
+    try:
+        return schema.load(request.args, unknown=EXCLUDE)
+    except ValidationError:
+        return None
+
+
+async def get_store(app, request, store_id):
+    if store_cache.enabled or not store_id.isdigit():
+        return None
+    field_args = _load_args(StoreFieldsArgsSchema(), request)
+    if field_args is None:
+        return None
+    columns = projected_columns(field_args.get("only"))
+    store_pk = int(store_id)
+
+    async with app.engine.connect() as connection:
+        if request.if_none_match:
+            version = (
+                await connection.execute(select(stores.c.version).where(stores.c.store_id == store_pk))
+            ).scalar()
+            if version is None:
+                return None
+            response = not_modified(request, store_etag(store_pk, version, columns))
+            if response is not None:
+                return response
+
+        result = await connection.execute(
+            select(*columns, stores.c.version, stores.c.updated_at).where(stores.c.store_id == store_pk)
+        )
+        row = result.mappings().first()
+    if row is None:
+        return None
+    store = dict(row)
+    version, updated_at = store.pop("version"), store.pop("updated_at")
+    return json_response(store, headers=validator_headers(store_etag(store_pk, version, columns), updated_at))
+
+
+async def list_stores(app, request):
+    if store_cache.enabled:
+        return None
+    identity = jwt_identity(app.flask_app, request)
+    list_args = _load_args(StoreListArgsSchema(), request)
+    if identity is None or list_args is None:
+        return None
+    user_id = identity[0]
+    try:
+        after = decode_cursor(list_args.get("cursor"))
+    except HTTPException:
+        return None
+    limit = page_size(list_args.get("limit"))
+    columns = projected_columns(list_args.get("only"))
+    key_column, version_column = stores.c.store_id, stores.c.version
+
+    def page_etag(versions, next_cursor):
+        return store_page_etag(user_id, after, limit, columns, versions, next_cursor)
+
+    async with app.engine.connect() as connection:
+        if request.if_none_match:
+            rows, next_cursor = await paginate_rows_async(
+                connection, select(key_column, version_column).where(stores.c.user_id == user_id),
+                key_column, after, limit,
+            )
+            response = not_modified(
+                request, page_etag(tuple((row["store_id"], row["version"]) for row in rows), next_cursor)
+            )
+            if response is not None:
+                return response
+
+        cursor_only = key_column.key not in {column.key for column in columns}
+        rows, next_cursor = await paginate_rows_async(
+            connection,
+            select(*columns, *((key_column,) if cursor_only else ()), version_column).where(
+                stores.c.user_id == user_id
+            ),
+            key_column,
+            after,
+            limit,
+        )
+    versions = tuple((row[key_column.key], row.pop(version_column.key)) for row in rows)
+    if cursor_only:
+        for row in rows:
+            del row[key_column.key]
+    return json_response(rows, headers=store_page_headers(page_etag(versions, next_cursor), next_cursor))
+
+
+def _invalidate(flask_app, *keys):
+    # StoreCache logs a failed invalidation through current_app.logger
+    with flask_app.app_context():
+        store_cache.invalidate(*keys)
+
+
+async def delete_store(app, request, store_id):
+    identity = jwt_identity(app.flask_app, request)
+    if identity is None or not store_id.isdigit():
+        return None
+    user_id, token = identity
+    if not await has_active_session(app.redis, user_id, token):
+        return None
+
+    store_pk = int(store_id)
+    async with app.engine.begin() as connection:
+        result = await connection.execute(
+            delete(stores).where(stores.c.store_id == store_pk, stores.c.user_id == user_id)
+        )
+    if result.rowcount == 0:
+        return None  # missing or owned by someone else: the Flask resource answers the 404
+
+    if store_cache.enabled:  # StoreCache is synchronous; keep the event loop free
+        await asyncio.to_thread(_invalidate, app.flask_app, store_key(store_pk), user_stores_key(user_id))
+    router = app.flask_app.extensions.get("read_replicas")
+    if router is not None:
+        # Read-your-writes, as ReadReplicaRouter.after_request does for the Flask writes (a Redis SET)
+        await asyncio.to_thread(router.pin, user_id)
+    return json_response({"message": "store deleted with store id " + store_id})
+
+
+# (method, path pattern, endpoint name in metrics, handler); the named groups of the pattern are passed to the
+# handler as keyword arguments (see store_service/asgi.py)
+ROUTES = (
+    ("GET", r"/store/(?P<store_id>[^/]+)", "stores.Store", get_store),
+    ("DELETE", r"/store/(?P<store_id>[^/]+)", "stores.Store", delete_store),
+    ("GET", r"/stores", "stores.StoreList", list_stores),
+)
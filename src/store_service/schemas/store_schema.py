@@ -1,4 +1,5 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, ValidationError, fields, validate, validates_schema
+from webargs.fields import DelimitedList
 
 # TODO Nested data validations using Marshmallow
 # TODO Duplicate data validations
@@ -19,4 +20,92 @@ class StoreSchema(Schema):
     pin_code = fields.Str()
     state_code = fields.Str()
     country_code = fields.Str()
-    shipping_time = fields.Int()
\ No newline at end of file
+    shipping_time = fields.Int()
+
+
+# StoreSchema with every field optional: partial=True also when nested (Nested passes its parent's partial=False)
+class StorePatchSchema(StoreSchema):
+    def load(self, data, *, many=None, partial=None, unknown=None):
+        return super().load(data, many=many, partial=True, unknown=unknown)
+
+
+STORE_FIELDS = tuple(StoreSchema().dump_fields)
+
+
+# Sparse fieldsets: ?fields=store_id,store_number,store_name returns (and SELECTs) only those columns
+class StoreFieldsArgsSchema(Schema):
+    only = DelimitedList(fields.Str(validate=validate.OneOf(STORE_FIELDS)), data_key="fields",
+                         validate=validate.Length(min=1))
+
+
+# Query string of GET /stores (keyset pagination)
+class StoreListArgsSchema(StoreFieldsArgsSchema):
+    limit = fields.Int(validate=validate.Range(min=1))
+    cursor = fields.Str()
+
+
+# Filters of GET /stores/search and of the bulk endpoints: exact codes, shipping_time range and name prefixes,
+# ANDed together
+class StoreFilterSchema(Schema):
+    country_code = fields.Str(validate=validate.Length(min=1, max=10))
+    state_code = fields.Str(validate=validate.Length(min=1, max=10))
+    pin_code = fields.Str(validate=validate.Length(min=1, max=10))
+    shipping_time_min = fields.Int(validate=validate.Range(min=0))
+    shipping_time_max = fields.Int(validate=validate.Range(min=0))
+    store_name = fields.Str(validate=validate.Length(min=1, max=40))  # prefix
+    customer_name = fields.Str(validate=validate.Length(min=1, max=100))  # prefix
+
+    @validates_schema
+    def validate_shipping_time_range(self, data, **kwargs):
+        if data.get("shipping_time_min", 0) > data.get("shipping_time_max", float("inf")):
+            raise ValidationError("must not be greater than shipping_time_max", "shipping_time_min")
+
+
+# Query string of GET /stores/search
+class StoreSearchArgsSchema(StoreListArgsSchema, StoreFilterSchema):
+    count = fields.Bool(load_default=False)  # X-Total-Count header with the number of matches
+
+
+# Body of DELETE /stores/bulk: the caller's stores to change, either listed or matched by a filter
+class StoreBulkSelectionSchema(Schema):
+    store_ids = fields.List(fields.Int(validate=validate.Range(min=1)), validate=validate.Length(min=1))
+    filter = fields.Nested(StoreFilterSchema)
+
+    @validates_schema
+    def validate_selection(self, data, **kwargs):
+        if ("store_ids" in data) == ("filter" in data):
+            raise ValidationError("pass either store_ids or filter")
+        if "filter" in data and not data["filter"]:
+            raise ValidationError("must have at least one condition", "filter")
+
+
+# Body of PATCH /stores/bulk: the selection and the fields to set on every selected store.
+# store_number is unique per user, so it cannot be given to several stores at once.
+class StoreBulkPatchSchema(StoreBulkSelectionSchema):
+    patch = fields.Nested(StorePatchSchema(exclude=("store_number",)), required=True)
+
+    @validates_schema
+    def validate_patch(self, data, **kwargs):
+        if not data.get("patch"):
+            raise ValidationError("must set at least one field", "patch")
+
+
+# Response of POST /create_stores (one entry per submitted row, in request order)
+class StoreBulkRowResultSchema(Schema):
+    index = fields.Int()
+    store_number = fields.Int(allow_none=True)
+    status = fields.Str()  # created | conflict | error
+    store_id = fields.Int()
+    message = fields.Str()
+
+
+class StoreBulkCreateResultSchema(Schema):
+    created = fields.Int()
+    failed = fields.Int()
+    results = fields.List(fields.Nested(StoreBulkRowResultSchema))
+
+
+# Response of PATCH / DELETE /stores/bulk
+class StoreBulkWriteResultSchema(Schema):
+    updated = fields.Int()
+    deleted = fields.Int()
@@ -0,0 +1,38 @@
+import hashlib
+
+from flask import current_app, request
+from werkzeug.http import http_date, quote_etag
+
+"""
+    Conditional GET helpers. ETags are derived from row versions (StoreModel.version), never from the body, so
+    a request whose If-None-Match still matches gets a 304 without the row being serialized.
+"""
+
+
+def make_etag(*parts):
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def validator_headers(etag, last_modified=None):
+    headers = {"ETag": quote_etag(etag)}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(etag):
+    """
+    A 304 response when the request's If-None-Match matches etag (weak comparison, RFC 9110), else None.
+    The 304 carries the ETag only; Werkzeug drops representation headers such as Last-Modified from it.
+    """
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def not_modified_from(response):
+    # For responses that already carry their validators (e.g. served from the store cache)
+    etag, _weak = response.get_etag()
+    return not_modified(etag)
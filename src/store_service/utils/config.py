@@ -0,0 +1,12 @@
+import os
+
+"""
+    Environment parsing shared by create_app() and the extensions' from_env() constructors.
+"""
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def env_flag(name, default="false"):
+    """True when the environment variable (or default, when it is unset) is 1, true, yes or on, in any case."""
+    return os.getenv(name, default).strip().lower() in TRUE_VALUES
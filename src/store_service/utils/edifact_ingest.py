@@ -0,0 +1,159 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import delete, insert, select
+
+from store_service.extensions.db import db
+from store_service.models.order_db import IngestCheckpointModel, OrderModel
+from store_service.utils.edifact_transformer import transform_edifact_messages
+
+"""
+    Batch ingestion of nightly EDIFACT drops:  flask ingest-edifact /data/edi --workers 4  (see commands.py)
+
+    discover  - walk the directory for *.edi files and drop the ones already checkpointed (same path, size, mtime)
+    transform - parse + map the files in a process pool (CPU bound, so processes rather than threads)
+    load      - multi-row INSERTs of the orders, flushed every --chunk-size orders; the checkpoint rows of the files
+                in a chunk are written in the same transaction, so after a crash a re-run continues with the first
+                file that was not committed and nothing is inserted twice.
+"""
+
+
+@dataclass
+class IngestReport:
+    files_seen: int = 0
+    files_skipped: int = 0
+    files_done: int = 0
+    files_failed: int = 0
+    orders: int = 0
+    timings: dict = field(default_factory=lambda: {"discover": 0.0, "transform": 0.0, "load": 0.0, "total": 0.0})
+
+    @property
+    def files_per_second(self):
+        processed = self.files_done + self.files_failed
+        return processed / self.timings["total"] if self.timings["total"] else 0.0
+
+
+def transform_file(path):
+    """Worker: returns (path, size, mtime_ns, orders, error, seconds) for one file."""
+    started = time.perf_counter()
+    size = mtime_ns = 0
+    try:
+        # Inside the try: a file removed since discovery becomes a failed checkpoint, not a crashed worker pool
+        stat = os.stat(path)
+        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        orders = [
+            {
+                "message_index": index,
+                "store_number": order["store_number"],
+                "order_status": order["order_status"],
+                "total_amount": order["total_amount"],
+                "currency": order["currency"],
+                "line_count": len(order["line_items"]),
+            }
+            for index, order in enumerate(transform_edifact_messages(path))
+        ]
+        error = None
+    except (ValueError, UnicodeDecodeError, OSError) as e:
+        orders, error = [], str(e)[:255]
+    return path, size, mtime_ns, orders, error, time.perf_counter() - started
+
+
+def discover_files(directory, pattern="*.edi"):
+    """Files under directory matching pattern that are not checkpointed yet (new or changed since)."""
+    done = {
+        source_file: (file_size, file_mtime_ns)
+        for source_file, file_size, file_mtime_ns in db.session.execute(
+            select(
+                IngestCheckpointModel.source_file, IngestCheckpointModel.file_size, IngestCheckpointModel.file_mtime_ns
+            )
+            .where(IngestCheckpointModel.status == "done")
+        )
+    }
+    seen = 0
+    pending = []
+    for path in sorted(Path(directory).rglob(pattern)):
+        if not path.is_file():
+            continue
+        seen += 1
+        stat = path.stat()
+        if done.get(str(path)) != (stat.st_size, stat.st_mtime_ns):
+            pending.append(str(path))
+    return seen, pending
+
+
+def _load_chunk(results):
+    orders = []
+    checkpoints = []
+    for path, size, mtime_ns, file_orders, error, _seconds in results:
+        orders.extend({**order, "source_file": path} for order in file_orders)
+        checkpoints.append({
+            "source_file": path,
+            "file_size": size,
+            "file_mtime_ns": mtime_ns,
+            "status": "failed" if error else "done",
+            "message_count": len(file_orders),
+            "error": error,
+        })
+
+    # A changed file is re-loaded from scratch: drop its previous orders and checkpoint first.
+    paths = [checkpoint["source_file"] for checkpoint in checkpoints]
+    db.session.execute(delete(OrderModel.__table__).where(OrderModel.source_file.in_(paths)))
+    db.session.execute(delete(IngestCheckpointModel.__table__).where(IngestCheckpointModel.source_file.in_(paths)))
+    if orders:
+        db.session.execute(insert(OrderModel.__table__), orders)  # executemany
+    db.session.execute(insert(IngestCheckpointModel.__table__), checkpoints)
+    db.session.commit()
+    return len(orders)
+
+
+def _transformed(paths, workers):
+    if workers <= 0:
+        # In-process mode (debugging, tiny drops)
+        yield from map(transform_file, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Results come back in order; chunksize amortizes the IPC cost over several small files.
+        yield from executor.map(transform_file, paths, chunksize=max(1, min(32, len(paths) // (workers * 4))))
+
+
+def ingest_directory(directory, workers=None, chunk_size=1000, pattern="*.edi", progress=None):
+    report = IngestReport()
+    started = time.perf_counter()
+
+    phase = time.perf_counter()
+    report.files_seen, pending = discover_files(directory, pattern)
+    report.files_skipped = report.files_seen - len(pending)
+    report.timings["discover"] = time.perf_counter() - phase
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    batch = []
+    batch_orders = 0
+    for result in _transformed(pending, workers):
+        report.timings["transform"] += result[5]
+        if result[4]:
+            report.files_failed += 1
+        else:
+            report.files_done += 1
+        batch.append(result)
+        batch_orders += len(result[3])
+
+        if batch_orders >= chunk_size:
+            phase = time.perf_counter()
+            report.orders += _load_chunk(batch)
+            report.timings["load"] += time.perf_counter() - phase
+            batch, batch_orders = [], 0
+            if progress:
+                progress(report)
+
+    if batch:
+        phase = time.perf_counter()
+        report.orders += _load_chunk(batch)
+        report.timings["load"] += time.perf_counter() - phase
+
+    report.timings["total"] = time.perf_counter() - started
+    return report
+
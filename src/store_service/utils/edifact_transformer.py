@@ -1,4 +1,4 @@
-from ..helper.edifact_parser import parse_edifact
+from ..helper.edifact_parser import iter_messages, parse_edifact
 
 def transform_edifact_to_json(file_path: str) -> dict:
     segments = parse_edifact(file_path)
@@ -23,3 +23,56 @@ def transform_edifact_to_json(file_path: str) -> dict:
         "total_amount": total_amount,
         "currency": currency
     }
+
+
+def _component(segment, element_index, component_index, default=""):
+    try:
+        return segment[element_index][component_index]
+    except IndexError:
+        return default
+
+
+def transform_message(segments: list) -> dict:
+    """
+    Maps the segments of one UNH ... UNT message (as yielded by iter_messages) to the order payload.
+    Unlike transform_edifact_to_json, repeated LIN/QTY/PRI groups are all kept: total_amount is the sum of
+    price x quantity over the line items (quantity defaults to 1 when a line has no QTY).
+    """
+    store_number = 0
+    currency = "INR"
+    total_amount = 0.0
+    line_items = []
+    line = None
+
+    for segment in segments:
+        tag = segment[0][0]
+        if tag == "BGM":
+            store_number = int(_component(segment, 2, 0, "0") or 0)
+        elif tag == "CUX":
+            currency = _component(segment, 1, 1) or currency
+        elif tag == "LIN":
+            line = {"line_number": _component(segment, 1, 0), "quantity": 1.0, "price": 0.0}
+            line_items.append(line)
+        elif tag in ("QTY", "PRI"):
+            if line is None:
+                line = {"line_number": "", "quantity": 1.0, "price": 0.0}
+                line_items.append(line)
+            value = float(_component(segment, 1, 1, "0") or 0)
+            line["quantity" if tag == "QTY" else "price"] = value
+
+    for item in line_items:
+        total_amount += item["price"] * item["quantity"]
+
+    return {
+        "store_number": store_number,
+        "order_status": "pending",
+        "total_amount": round(total_amount, 2),
+        "currency": currency,
+        "line_items": line_items,
+    }
+
+
+def transform_edifact_messages(file_path: str):
+    """Streams one order payload per message of the interchange, in file order."""
+    for message in iter_messages(file_path):
+        yield transform_message(message)
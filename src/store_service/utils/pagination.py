@@ -0,0 +1,74 @@
+import base64
+import binascii
+import os
+
+from flask_smorest import abort
+
+"""
+    Keyset (cursor) pagination helpers.
+
+    A page is "WHERE <key> > :after ORDER BY <key> LIMIT :limit + 1", so page 1000 costs the same index range
+    scan as page 1 (OFFSET would read and discard every earlier row). The extra row only tells us whether a
+    next page exists; its key is never exposed, the cursor points at the last row that was returned.
+"""
+
+DEFAULT_PAGE_SIZE = int(os.getenv("STORES_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("STORES_MAX_PAGE_SIZE", "500"))
+
+
+def page_size(requested):
+    if requested is None:
+        return DEFAULT_PAGE_SIZE
+    return min(requested, MAX_PAGE_SIZE)
+
+
+def encode_cursor(last_key):
+    # Opaque to clients; only this module knows it is the last store_id of the previous page.
+    return base64.urlsafe_b64encode(f"k:{last_key}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, last_key = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").partition(":")
+        if prefix != "k":
+            raise ValueError(cursor)
+        return int(last_key)
+    except (binascii.Error, UnicodeError, ValueError):
+        abort(400, message="Invalid pagination cursor")
+
+
+def paginate(query, key_column, after, limit):
+    """Run one keyset page of query; returns (rows, next_cursor or None)."""
+    rows = query.filter(key_column > after).order_by(key_column).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(getattr(rows[-1], key_column.key))
+    return rows, None
+
+
+def paginate_rows(session, statement, key_column, after, limit):
+    """paginate() for a Core select(): returns (list of row dicts, next_cursor or None) without ORM objects."""
+    result = session.execute(_page_statement(statement, key_column, after, limit))
+    return _page_of_rows(result, key_column, limit)
+
+
+async def paginate_rows_async(connection, statement, key_column, after, limit):
+    """paginate_rows() on an AsyncConnection / AsyncSession (see store_service/asgi.py)."""
+    result = await connection.execute(_page_statement(statement, key_column, after, limit))
+    return _page_of_rows(result, key_column, limit)
+
+
+def _page_statement(statement, key_column, after, limit):
+    return statement.where(key_column > after).order_by(key_column).limit(limit + 1)
+
+
+def _page_of_rows(result, key_column, limit):
+    keys = tuple(result.keys())
+    rows = [dict(zip(keys, row)) for row in result]  # about twice as fast as .mappings()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1][key_column.key])
+    return rows, None
@@ -0,0 +1,54 @@
+import os
+import time
+
+"""
+    Boot timing of create_app(), printed once at boot and reported under "startup" in GET /stats.
+
+    phases_ms                  imports, config, extensions, schema, blueprints, observability (in boot order)
+    time_to_first_request_ms   from the import of store_service.main to the start of the first request
+    target_ms                  STARTUP_TARGET_MS; a warning is printed when the first request comes later
+"""
+
+
+class StartupTimings:
+    def __init__(self, started, target_ms=None):
+        self.started = started
+        self.target_ms = float(os.getenv("STARTUP_TARGET_MS", "2000")) if target_ms is None else target_ms
+        self.phases = {}
+        self.time_to_first_request_ms = None
+        self._last = started
+
+    def mark(self, phase, now=None):
+        # Time since the previous mark is charged to this phase (added up when a phase is marked twice).
+        now = time.perf_counter() if now is None else now
+        self.phases[phase] = round(self.phases.get(phase, 0.0) + (now - self._last) * 1000, 3)
+        self._last = now
+
+    def resume(self):
+        # Time between two phases that is not boot work (e.g. between import and create_app()) is not charged.
+        self._last = time.perf_counter()
+
+    @property
+    def total_ms(self):
+        return round(sum(self.phases.values()), 3)
+
+    def first_request(self):
+        if self.time_to_first_request_ms is not None:
+            return
+        self.time_to_first_request_ms = round((time.perf_counter() - self.started) * 1000, 3)
+        if self.time_to_first_request_ms > self.target_ms:
+            print(
+                f"Startup: first request after {self.time_to_first_request_ms:.0f} ms, "
+                f"above STARTUP_TARGET_MS={self.target_ms:.0f}"
+            )
+
+    def summary(self):
+        return " ".join(f"{phase}={ms:.1f}" for phase, ms in self.phases.items()) + f" total={self.total_ms:.1f}"
+
+    def as_dict(self):
+        return {
+            "phases_ms": dict(self.phases),
+            "total_ms": self.total_ms,
+            "time_to_first_request_ms": self.time_to_first_request_ms,
+            "target_ms": self.target_ms,
+        }
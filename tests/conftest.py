@@ -1,9 +1,128 @@
 from pathlib import Path
 import sys
 
+import pytest
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis commands used by the store service."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append(("get", key))
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.commands.append(("mget", tuple(keys)))
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        self.commands.append(("set", key))
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        if ex is not None:
+            self.ttls[key] = ex
+        elif px is not None:
+            self.ttls[key] = px / 1000
+        return True
+
+    def delete(self, *keys):
+        self.commands.append(("delete",) + keys)
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return key in self.data
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args, **kwargs: self.queued.append((method, args, kwargs))
+
+    def execute(self):
+        results = [method(*args, **kwargs) for method, args, kwargs in self.queued]
+        self.queued = []
+        return results
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """create_app() against an in-memory SQLite database."""
+    monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-with-at-least-32-bytes")
+
+    from store_service.main import create_app
+
+    return create_app(db_url="sqlite://")
+
+
+@pytest.fixture
+def auth_headers(app, monkeypatch, fake_redis):
+    """Returns a factory of Authorization headers with a matching Redis session for a user_id."""
+    from flask_jwt_extended import create_access_token
+
+    from store_service.resources import store as store_resource
+
+    monkeypatch.setattr(store_resource, "redis_client", fake_redis)
+
+    def make(user_id=1):
+        with app.app_context():
+            token = create_access_token(identity=str(user_id))
+        fake_redis.set(f"session:{user_id}", f'{{"token": "{token}"}}')
+        return {"Authorization": f"Bearer {token}"}
+
+    return make
+
+
+def make_store(user_id, store_number, **overrides):
+    from store_service.models.store_db import StoreModel
+
+    values = {
+        "user_id": user_id,
+        "store_number": store_number,
+        "customer_name": "Customer",
+        "store_name": f"Store {store_number}",
+        "address_line1": "Line 1",
+        "pin_code": "560001",
+        "state_code": "KA",
+        "country_code": "IN",
+        "shipping_time": 2,
+    }
+    values.update(overrides)
+    return StoreModel(**values)
@@ -0,0 +1,297 @@
+import asyncio
+import json
+
+import pytest
+import redis
+from flask_jwt_extended import create_access_token
+from werkzeug.datastructures import Headers
+from werkzeug.wrappers import Response
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from store_service.asgi import create_asgi_app  # noqa: E402
+from store_service.extensions.db import db  # noqa: E402
+from store_service.extensions.rate_limit import LoadShedder, RateLimiter  # noqa: E402
+from store_service.extensions.store_cache import store_cache  # noqa: E402
+from store_service.models.store_db import StoreModel  # noqa: E402
+from tests.conftest import make_store  # noqa: E402
+
+
+class AsyncFakeRedis:
+    def __init__(self, data):
+        self.data = data
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def close(self):
+        pass
+
+
+async def call(app, method, path, headers=None, body=b""):
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+        "http_version": "1.1",
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    headers = Headers([(name.decode(), value.decode()) for name, value in sent[0]["headers"]])
+    return sent[0]["status"], headers, b"".join(message.get("body", b"") for message in sent[1:])
+
+
+@pytest.fixture
+def asgi_app(monkeypatch, tmp_path, fake_redis):
+    from store_service.resources import store as store_resource
+
+    monkeypatch.setattr(store_resource, "redis_client", fake_redis)  # sessions of the requests Flask serves
+    monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-with-at-least-32-bytes")
+    app = create_asgi_app(db_url=f"sqlite:///{tmp_path / 'stores.db'}")
+    with app.flask_app.app_context():
+        db.session.add_all(make_store(1, number) for number in range(1, 4))
+        db.session.add(make_store(2, 1))
+        db.session.commit()
+        app.token = create_access_token(identity="1")
+    fake_redis.set("session:1", json.dumps({"token": app.token}))
+    app.sessions = fake_redis.data
+    return app
+
+
+@pytest.fixture
+def delegated(monkeypatch):
+    paths = []
+    from_app = Response.from_app
+
+    def record(app, environ, buffered=False):
+        paths.append(f"{environ['REQUEST_METHOD']} {environ['PATH_INFO']}")
+        return from_app(app, environ, buffered)
+
+    monkeypatch.setattr(Response, "from_app", record)
+    return paths
+
+
+def run(app, scenario):
+    async def main():
+        await app.startup()
+        app.redis = AsyncFakeRedis(app.sessions)
+        try:
+            return await scenario()
+        finally:
+            await app.shutdown()
+
+    return asyncio.run(main())
+
+
+def test_reads_are_served_natively_and_match_the_flask_app(asgi_app, delegated):
+    client = asgi_app.flask_app.test_client()
+    auth = {"Authorization": f"Bearer {asgi_app.token}"}
+    urls = ["/store/1", "/store/2?fields=store_name,store_number", "/stores?limit=2", "/stores?fields=store_name"]
+
+    async def scenario():
+        return [await call(asgi_app, "GET", url, auth) for url in urls]
+
+    results = run(asgi_app, scenario)
+
+    assert delegated == []
+    for url, (status, headers, body) in zip(urls, results):
+        expected = client.get(url, headers=auth)
+        assert status == expected.status_code == 200
+        assert body == expected.get_data()
+        for name in ("ETag", "Last-Modified", "X-Next-Cursor", "Content-Type", "Content-Length"):
+            assert headers.get(name) == expected.headers.get(name)
+
+
+def test_conditional_gets_answer_304(asgi_app, delegated):
+    auth = {"Authorization": f"Bearer {asgi_app.token}"}
+
+    async def scenario():
+        _, store_headers, _ = await call(asgi_app, "GET", "/store/1")
+        _, page_headers, _ = await call(asgi_app, "GET", "/stores", auth)
+        return (
+            await call(asgi_app, "GET", "/store/1", {"If-None-Match": store_headers["ETag"]}),
+            await call(asgi_app, "GET", "/stores", {**auth, "If-None-Match": page_headers["ETag"]}),
+        )
+
+    store, page = run(asgi_app, scenario)
+
+    assert store[0] == page[0] == 304
+    assert store[2] == page[2] == b""
+    assert "Content-Length" not in store[1]
+    assert delegated == []
+
+
+def test_delete_uses_the_async_session_check(asgi_app, delegated):
+    auth = {"Authorization": f"Bearer {asgi_app.token}"}
+
+    async def scenario():
+        deleted = await call(asgi_app, "DELETE", "/store/2", auth)
+        missing = await call(asgi_app, "DELETE", "/store/2", auth)
+        asgi_app.sessions.clear()  # revoked
+        revoked = await call(asgi_app, "DELETE", "/store/3", auth)
+        return deleted, missing, revoked
+
+    deleted, missing, revoked = run(asgi_app, scenario)
+
+    assert deleted[0] == 200
+    assert json.loads(deleted[2]) == {"message": "store deleted with store id 2"}
+    assert missing[0] == 404 and revoked[0] == 401
+    assert delegated == ["DELETE /store/2", "DELETE /store/3"]
+    with asgi_app.flask_app.app_context():
+        assert db.session.get(StoreModel, 3) is not None
+
+
+def test_delete_survives_a_failed_cache_invalidation(asgi_app, delegated, monkeypatch, caplog):
+    class DownRedis:
+        def pipeline(self, transaction=True):
+            raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(store_cache, "enabled", True)
+    monkeypatch.setattr(store_cache, "client", DownRedis())
+
+    status, _, body = run(
+        asgi_app, lambda: call(asgi_app, "DELETE", "/store/2", {"Authorization": f"Bearer {asgi_app.token}"})
+    )
+
+    assert status == 200 and json.loads(body) == {"message": "store deleted with store id 2"}
+    assert delegated == []
+    assert "Store cache invalidation failed" in caplog.text
+
+
+def test_native_requests_are_rate_limited_and_shed(asgi_app, delegated):
+    class EmptyBucket:
+        def __init__(self):
+            self.calls = 0
+
+        def evalsha(self, *args):
+            self.calls += 1
+            return [0, 0, 1500]
+
+    guard = asgi_app.flask_app.extensions["rate_limiting"]
+    guard.limiter = RateLimiter(client=EmptyBucket(), enabled=True, read_burst=3)
+    guard.shedder = LoadShedder(max_concurrent=2, retry_after=4)
+    auth = {"Authorization": f"Bearer {asgi_app.token}"}
+
+    limited = run(asgi_app, lambda: call(asgi_app, "GET", "/stores", auth))
+    assert limited[0] == 429
+    assert (limited[1]["Retry-After"], limited[1]["X-RateLimit-Limit"]) == ("2", "3")
+    assert json.loads(limited[2])["message"] == "Too many requests"
+
+    guard.limiter.enabled = False
+    guard.shedder.in_flight = 2  # two requests being served
+    shed = run(asgi_app, lambda: call(asgi_app, "GET", "/store/1", auth))
+    assert (shed[0], shed[1]["Retry-After"]) == (503, "4")
+
+    guard.shedder.in_flight = 0
+    served = run(asgi_app, lambda: call(asgi_app, "GET", "/store/1", auth))
+    assert served[0] == 200
+    assert delegated == []
+    assert guard.shedder.in_flight == 0  # released once answered
+    assert guard.stats()["load_shedding"]["shed"] == 1
+
+
+def test_declined_native_requests_are_not_checked_twice(asgi_app, delegated):
+    guard = asgi_app.flask_app.extensions["rate_limiting"]
+    guard.limiter = RateLimiter(client=None, enabled=True, read_burst=1)
+    taken = []
+    guard.limiter.take = lambda key, burst, rate, cost=1: taken.append(key) or (True, 0, 0.0)
+    guard.shedder = LoadShedder(max_concurrent=1)
+
+    missing = run(asgi_app, lambda: call(asgi_app, "GET", "/store/99", {"Authorization": f"Bearer {asgi_app.token}"}))
+
+    assert missing[0] == 404
+    assert delegated == ["GET /store/99"]
+    assert len(taken) == 1
+    assert guard.shedder.in_flight == 0 and guard.shedder.shed == 0
+
+
+def test_native_delete_pins_the_writer_to_the_primary(monkeypatch, tmp_path, fake_redis, delegated):
+    from store_service.extensions.read_replicas import pin_key
+    from store_service.resources import store as store_resource
+
+    monkeypatch.setattr(store_resource, "redis_client", fake_redis)
+    monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-with-at-least-32-bytes")
+    monkeypatch.setenv("DB_REPLICA_URLS", f"sqlite:///{tmp_path / 'replica.db'}")
+    app = create_asgi_app(db_url=f"sqlite:///{tmp_path / 'primary.db'}")
+    router = app.flask_app.extensions["read_replicas"]
+    router.client = fake_redis
+    with app.flask_app.app_context():
+        for engine in (db.engine, router.engines["replica_0"]):
+            db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                for store in (make_store(1, number) for number in range(1, 4)):
+                    values = {column.key: getattr(store, column.key) for column in store.__table__.columns}
+                    connection.execute(store.__table__.insert().values(
+                        {key: value for key, value in values.items() if value is not None}
+                    ))
+        token = create_access_token(identity="1")
+    fake_redis.set("session:1", json.dumps({"token": token}))
+    app.sessions = fake_redis.data
+    auth = {"Authorization": f"Bearer {token}"}
+
+    deleted = run(app, lambda: call(app, "DELETE", "/store/2", auth))
+    listed = app.flask_app.test_client().get("/stores", headers=auth)  # Flask-served read right after
+
+    assert deleted[0] == 200 and delegated == []
+    assert fake_redis.data[pin_key(1)] == "1"
+    assert [store["store_id"] for store in listed.get_json()] == [1, 3]  # the replica still has store 2
+
+
+def test_other_requests_and_declined_ones_go_to_flask(asgi_app, delegated):
+    async def scenario():
+        return (
+            await call(asgi_app, "GET", "/health"),
+            await call(asgi_app, "GET", "/stores"),  # no token: Flask answers the 401
+            await call(asgi_app, "GET", "/store/99"),
+            await call(asgi_app, "GET", "/store/1?fields=secret"),
+        )
+
+    health, unauthenticated, missing, invalid = run(asgi_app, scenario)
+
+    assert health[0] == 200 and json.loads(health[2]) == {"status": "healthy"}
+    assert (unauthenticated[0], missing[0], invalid[0]) == (401, 404, 422)
+    assert delegated == ["GET /health", "GET /stores", "GET /store/99", "GET /store/1"]
+
+
+def test_many_requests_in_flight_on_one_loop(asgi_app):
+    auth = {"Authorization": f"Bearer {asgi_app.token}"}
+
+    async def scenario():
+        return await asyncio.gather(*(call(asgi_app, "GET", "/stores?limit=1", auth) for _ in range(50)))
+
+    results = run(asgi_app, scenario)
+
+    assert {status for status, _, _ in results} == {200}
+    assert len({body for _, _, body in results}) == 1
+
+
+def test_lifespan_opens_and_closes_the_pools(asgi_app):
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+        if message["type"] == "lifespan.startup.complete":
+            assert asgi_app.engine is not None and asgi_app.redis is not None
+
+    asyncio.run(asgi_app({"type": "lifespan"}, receive, send))
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert asgi_app.engine is None
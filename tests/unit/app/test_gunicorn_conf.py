@@ -0,0 +1,42 @@
+import importlib
+
+from store_service import gunicorn_conf
+
+
+def test_gunicorn_conf_reads_environment(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "2")
+    monkeypatch.setenv("GUNICORN_THREADS", "8")
+    monkeypatch.setenv("GUNICORN_KEEPALIVE", "10")
+    monkeypatch.setenv("GUNICORN_TIMEOUT", "60")
+    monkeypatch.setenv("PORT", "8000")
+
+    conf = importlib.reload(gunicorn_conf)
+
+    assert conf.workers == 2
+    assert conf.threads == 8
+    assert conf.worker_class == "gthread"
+    assert conf.keepalive == 10
+    assert conf.timeout == 60
+    assert conf.bind == "0.0.0.0:8000"
+    assert conf.preload_app is True
+
+
+def test_post_fork_disposes_inherited_engine_connections(app, monkeypatch):
+    from store_service.extensions.db import db
+
+    disposed = []
+
+    class FakeGunicornApp:
+        def wsgi(self):
+            return app
+
+    class FakeWorker:
+        app = FakeGunicornApp()
+
+    with app.app_context():
+        engine = db.engine
+        monkeypatch.setattr(type(engine), "dispose", lambda self, close=True: disposed.append(close))
+
+    gunicorn_conf.post_fork(server=None, worker=FakeWorker())
+
+    assert disposed == [False]
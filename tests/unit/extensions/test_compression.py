@@ -0,0 +1,121 @@
+import gzip
+import zlib
+
+from flask import Flask, jsonify, stream_with_context
+
+from store_service.extensions.compression import ResponseCompression, init_compression
+from store_service.extensions.db import db
+from tests.conftest import make_store
+
+GZIP = {"Accept-Encoding": "gzip, deflate, br"}
+
+
+def _seed(app, count=30):
+    with app.app_context():
+        db.session.add_all(make_store(1, number) for number in range(1, count + 1))
+        db.session.commit()
+
+
+def test_large_store_list_is_gzipped_when_accepted(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    plain = client.get("/stores", headers=headers)
+    compressed = client.get("/stores", headers={**headers, **GZIP})
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert int(compressed.headers["Content-Length"]) < len(plain.get_data()) / 4
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+
+def test_small_bodies_and_refusals_are_not_compressed(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    health = client.get("/health", headers=GZIP)
+    refused = client.get("/stores", headers={**headers, "Accept-Encoding": "gzip;q=0, *"})
+    identity = client.get("/stores", headers={**headers, "Accept-Encoding": "identity"})
+
+    assert health.get_json() == {"status": "healthy"}
+    assert "Content-Encoding" not in health.headers
+    assert "Content-Encoding" not in refused.headers
+    assert "Content-Encoding" not in identity.headers
+    assert client.get("/stores", headers={**headers, "Accept-Encoding": "*"}).headers["Content-Encoding"] == "gzip"
+
+
+def test_compressed_responses_keep_answering_conditional_gets(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = {**auth_headers(1), **GZIP}
+
+    first = client.get("/stores", headers=headers)
+    second = client.get("/stores", headers={**headers, "If-None-Match": first.headers["ETag"]})
+
+    assert first.headers["ETag"].startswith('W/"')
+    assert second.status_code == 304
+    assert "Content-Encoding" not in second.headers
+
+
+def test_streamed_responses_are_compressed_chunk_by_chunk():
+    app = Flask(__name__)
+    app.after_request(ResponseCompression(min_size=100, level=1).after_request)
+    closed = []
+
+    @app.route("/export")
+    def export():
+        def rows():
+            try:
+                for number in range(50):
+                    yield f'{{"store_number": {number}}}\n'
+            finally:
+                closed.append(True)
+
+        return app.response_class(stream_with_context(rows()), mimetype="application/json")
+
+    response = app.test_client().get("/export", headers=GZIP)
+    chunks = list(response.response)
+    response.close()
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert len(chunks) > 1
+    expected = "".join(f'{{"store_number": {number}}}\n' for number in range(50)).encode()
+    assert zlib.decompress(b"".join(chunks), 31) == expected
+    assert closed == [True]
+
+
+def test_compression_settings_from_env(monkeypatch):
+    monkeypatch.setenv("COMPRESSION_MIN_SIZE", "2048")
+    monkeypatch.setenv("COMPRESSION_LEVEL", "12")
+    compression = ResponseCompression.from_env()
+
+    assert (compression.min_size, compression.level) == (2048, 9)
+
+    monkeypatch.setenv("COMPRESSION_ENABLED", "false")
+    app = Flask(__name__)
+    assert init_compression(app) is None
+    assert app.after_request_funcs == {}
+
+
+def test_binary_and_incompressible_bodies_pass_through():
+    app = Flask(__name__)
+    app.after_request(ResponseCompression(min_size=10).after_request)
+
+    @app.route("/random")
+    def random_bytes():
+        return app.response_class(bytes(range(256)) * 8, mimetype="application/octet-stream")
+
+    @app.route("/short")
+    def short():
+        # Above min_size, but gzip's header and trailer make it longer
+        return jsonify(["a1", "b2", "c3"])
+
+    client = app.test_client()
+    assert "Content-Encoding" not in client.get("/random", headers=GZIP).headers
+    short_response = client.get("/short", headers=GZIP)
+    assert "Content-Encoding" not in short_response.headers
+    assert short_response.get_json() == ["a1", "b2", "c3"]
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from store_service.extensions.db import TimedQueuePool, engine_options_from_env, pool_stats
+
+
+def test_engine_options_from_environment(monkeypatch):
+    monkeypatch.setenv("SQLALCHEMY_POOL_SIZE", "8")
+    monkeypatch.setenv("SQLALCHEMY_MAX_OVERFLOW", "2")
+    monkeypatch.setenv("SQLALCHEMY_POOL_TIMEOUT", "1.5")
+    monkeypatch.setenv("SQLALCHEMY_POOL_RECYCLE", "280")
+    monkeypatch.setenv("SQLALCHEMY_POOL_PRE_PING", "false")
+    monkeypatch.setenv("DB_READ_TIMEOUT", "10")
+
+    options = engine_options_from_env("mysql+pymysql://user:pass@db:3306/store_db")
+
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 8
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 1.5
+    assert options["pool_recycle"] == 280
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"]["read_timeout"] == 10
+    assert engine_options_from_env("sqlite://") == {}
+
+
+def test_timed_queue_pool_reports_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.01
+    )
+
+    held = engine.connect()
+    held.execute(text("SELECT 1"))
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    stats = pool_stats(engine)
+    assert stats["pool"] == "TimedQueuePool"
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["waiting"] == 0
+    assert stats["wait_time_max_ms"] >= 10
+
+    held.close()
+    engine.dispose()
+    assert pool_stats(engine)["checkouts"] == 2
+
+
+def test_timed_queue_pool_counts_a_retried_checkout_once(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=0)
+    checkout = QueuePool._do_get
+    observed = []
+
+    def retrying_do_get(self):
+        # As QueuePool does after losing the race for an overflow slot
+        observed.append(self.waiting)
+        if len(observed) == 1:
+            return self._do_get()
+        return checkout(self)
+
+    monkeypatch.setattr(QueuePool, "_do_get", retrying_do_get)
+    engine.connect().close()
+
+    assert observed == [1, 1]
+    stats = pool_stats(engine)
+    assert (stats["checkouts"], stats["waiting"]) == (1, 0)
+    engine.dispose()
@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+from flask import Flask
+from flask_jwt_extended import create_access_token, decode_token
+from flask_jwt_extended.exceptions import JWTDecodeError
+from jwt import ExpiredSignatureError, InvalidSignatureError
+
+from store_service.extensions import jwt_cache as jwt_cache_module
+from store_service.extensions.jwt_cache import CachingJWTManager, VerifiedTokenCache
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def jwt_app():
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "first-secret-key-with-at-least-32-bytes"
+    cache = VerifiedTokenCache(max_size=2)
+    CachingJWTManager(app, cache=cache)
+    return app, cache
+
+
+def _count_verifications(monkeypatch):
+    calls = []
+    decode = jwt_cache_module.JWTManager._decode_jwt_from_config
+
+    def counting(self, *args, **kwargs):
+        calls.append(args[0])
+        return decode(self, *args, **kwargs)
+
+    monkeypatch.setattr(jwt_cache_module.JWTManager, "_decode_jwt_from_config", counting)
+    return calls
+
+
+def test_a_token_is_verified_once(jwt_app, monkeypatch):
+    app, cache = jwt_app
+    verifications = _count_verifications(monkeypatch)
+    with app.app_context():
+        token = create_access_token(identity="7")
+        claims = [decode_token(token) for _ in range(3)]
+
+    assert len(verifications) == 1
+    assert claims[0] == claims[2] and claims[0]["sub"] == "7"
+    assert cache.stats()["hits"] == 2
+    claims[0]["sub"] = "tampered"  # callers get copies
+    with app.app_context():
+        assert decode_token(token)["sub"] == "7"
+
+
+def test_entries_expire_at_the_token_exp(jwt_app, monkeypatch):
+    app, cache = jwt_app
+    with app.app_context():
+        token = create_access_token(identity="7", expires_delta=timedelta(seconds=60))
+        claims = decode_token(token)
+        monkeypatch.setattr(cache, "_clock", Clock(claims["exp"]))
+
+        assert cache.get(token, jwt_cache_module.settings_fingerprint()) is None
+        monkeypatch.setattr(jwt_cache_module.JWTManager, "_decode_jwt_from_config", _raise_expired)
+        with pytest.raises(ExpiredSignatureError):
+            decode_token(token)
+
+
+def _raise_expired(*_args, **_kwargs):
+    raise ExpiredSignatureError("Signature has expired")
+
+
+def test_tokens_without_exp_are_capped_by_max_ttl():
+    clock = Clock(1000.0)
+    cache = VerifiedTokenCache(max_ttl=30, clock=clock)
+    cache.add("token", b"fp", {"sub": "7"})
+
+    clock.now = 1029.0
+    assert cache.get("token", b"fp") == {"sub": "7"}
+    clock.now = 1030.0
+    assert cache.get("token", b"fp") is None
+
+
+def test_secret_rotation_rejects_tokens_signed_with_the_old_key(jwt_app):
+    app, cache = jwt_app
+    with app.app_context():
+        old_token = create_access_token(identity="7")
+        decode_token(old_token)
+
+        app.config["JWT_SECRET_KEY"] = "second-secret-key-with-at-least-32-bytes"
+        with pytest.raises(InvalidSignatureError):
+            decode_token(old_token)
+        new_token = create_access_token(identity="7")
+        assert decode_token(new_token)["sub"] == "7"
+
+
+def test_the_cache_is_bounded(jwt_app):
+    app, cache = jwt_app
+    with app.app_context():
+        tokens = [create_access_token(identity=str(user_id)) for user_id in range(3)]
+        for token in tokens:
+            decode_token(token)
+
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalid_tokens_and_disabled_cache_are_not_cached(jwt_app, monkeypatch):
+    app, cache = jwt_app
+    with app.app_context():
+        with pytest.raises(JWTDecodeError):
+            decode_token(_token_without_identity(app))
+        assert cache.stats()["size"] == 0
+
+        cache.enabled = False
+        verifications = _count_verifications(monkeypatch)
+        token = create_access_token(identity="7")
+        decode_token(token)
+        decode_token(token)
+        assert len(verifications) == 2 and cache.stats()["size"] == 0
+
+
+def _token_without_identity(app):
+    return jwt.encode({"type": "access"}, app.config["JWT_SECRET_KEY"], algorithm="HS256")
+
+
+def test_jwt_required_endpoints_use_the_cache(app, auth_headers, monkeypatch):
+    cache = VerifiedTokenCache()
+    monkeypatch.setattr(app.extensions["flask-jwt-extended"], "token_cache", cache)
+    headers = auth_headers(1)
+    client = app.test_client()
+
+    responses = [client.get("/stores", headers=headers) for _ in range(3)]
+
+    assert {response.status_code for response in responses} == {200}
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
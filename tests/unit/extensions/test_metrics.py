@@ -0,0 +1,58 @@
+import redis
+from prometheus_client import REGISTRY
+
+from store_service.extensions import redis_client as redis_module
+from tests.conftest import make_store
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_record_route_latency_status_and_db_queries(app):
+    from store_service.extensions.db import db
+
+    with app.app_context():
+        db.session.add(make_store(user_id=1, store_number=1))
+        db.session.commit()
+    client = app.test_client()
+    labels = {"endpoint": "stores.Store", "method": "GET"}
+    requests_before = _sample("store_http_requests_total", status="200", **labels)
+    latency_before = _sample("store_http_request_duration_seconds_count", **labels)
+    queries_before = _sample("store_db_queries_per_request_sum", endpoint="stores.Store")
+
+    assert client.get("/store/1").status_code == 200
+
+    assert _sample("store_http_requests_total", status="200", **labels) == requests_before + 1
+    assert _sample("store_http_request_duration_seconds_count", **labels) == latency_before + 1
+    assert _sample("store_db_queries_per_request_sum", endpoint="stores.Store") == queries_before + 1
+    assert _sample("store_http_requests_in_progress", **labels) == 0
+
+
+def test_metrics_endpoint_serves_prometheus_text(app):
+    client = app.test_client()
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert b'store_http_requests_total{endpoint="health",method="GET",status="200"}' in response.data
+
+
+def test_metrics_endpoint_aggregates_multiprocess_directory(app, monkeypatch, tmp_path):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    response = app.test_client().get("/metrics")
+
+    assert response.status_code == 200
+
+
+def test_redis_commands_are_timed(monkeypatch):
+    monkeypatch.setattr(redis.Redis, "execute_command", lambda self, *args, **options: "value")
+    client = redis_module.InstrumentedRedis(connection_pool=redis_module.build_connection_pool())
+    before = _sample("store_redis_command_duration_seconds_count", command="GET")
+
+    assert client.get("session:1") == "value"
+
+    assert _sample("store_redis_command_duration_seconds_count", command="GET") == before + 1
@@ -0,0 +1,79 @@
+import json
+
+from store_service.extensions import profiling as profiling_module
+from store_service.extensions.profiling import RequestProfiling, StackProfiler
+from store_service.main import create_app
+from tests.conftest import make_store
+
+
+def _profiled_app(monkeypatch, tmp_path, **env):
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    monkeypatch.setenv("PROFILING_DIR", str(tmp_path))
+    monkeypatch.setenv("PROFILING_TOKEN", "let-me-profile")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-with-at-least-32-bytes!")
+    return create_app(db_url="sqlite://")
+
+
+def test_profiling_is_not_hooked_in_when_disabled(monkeypatch):
+    monkeypatch.delenv("PROFILING_ENABLED", raising=False)
+
+    assert RequestProfiling.from_env() is None
+
+
+def test_stack_profiler_folds_nested_calls():
+    def inner():
+        return sum(range(1000))
+
+    def outer():
+        return inner()
+
+    profiler = StackProfiler()
+    profiler.start()
+    outer()
+    profiler.stop()
+
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.folded().splitlines()]
+    assert any(stack.startswith("outer (") and ";inner (" in stack for stack in stacks)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in profiler.folded().splitlines())
+
+
+def test_request_with_token_writes_folded_stacks_and_sql(monkeypatch, tmp_path):
+    app = _profiled_app(monkeypatch, tmp_path)
+    from store_service.extensions.db import db
+
+    with app.app_context():
+        db.session.add(make_store(user_id=1, store_number=1))
+        db.session.commit()
+
+    response = app.test_client().get("/store/1", headers={"X-Profile-Token": "let-me-profile"})
+
+    profile_id = response.headers["X-Profile-Id"]
+    assert (tmp_path / f"{profile_id}.folded").read_text().strip()
+    sql = json.loads((tmp_path / f"{profile_id}.sql.json").read_text())
+    assert sql["path"] == "/store/1" and sql["status"] == 200
+    assert len(sql["statements"]) == 1
+    assert sql["statements"][0]["statement"].startswith("SELECT")
+
+
+def test_wrong_token_and_zero_sample_rate_do_not_profile(monkeypatch, tmp_path):
+    app = _profiled_app(monkeypatch, tmp_path)
+
+    client = app.test_client()
+
+    responses = [client.get("/health", headers={"X-Profile-Token": token}) for token in ("guess", "lét-me-profile")]
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert all("X-Profile-Id" not in response.headers for response in responses)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sampled_requests_are_profiled(monkeypatch, tmp_path):
+    app = _profiled_app(monkeypatch, tmp_path, PROFILING_SAMPLE_RATE="0.5")
+    monkeypatch.setattr(profiling_module.random, "random", lambda: 0.1)
+
+    response = app.test_client().get("/health")
+
+    assert "X-Profile-Id" in response.headers
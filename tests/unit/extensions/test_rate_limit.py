@@ -0,0 +1,195 @@
+import math
+
+import pytest
+import redis
+from sqlalchemy import event
+
+from store_service.extensions.db import db
+from store_service.extensions.rate_limit import (
+    TOKEN_BUCKET_SCRIPT,
+    TOKEN_BUCKET_SHA,
+    LoadShedder,
+    RateLimiter,
+    bucket_key,
+)
+from tests.conftest import FakeRedis, make_store
+
+
+class BucketRedis(FakeRedis):
+    """FakeRedis running a Python port of TOKEN_BUCKET_SCRIPT, on a clock the test moves (ms)."""
+
+    def __init__(self):
+        super().__init__()
+        self.now_ms = 1_000_000
+        self.buckets = {}
+        self.scripts = set()
+
+    def eval(self, script, numkeys, key, burst, rate, cost):
+        assert script == TOKEN_BUCKET_SCRIPT and numkeys == 1
+        self.scripts.add(TOKEN_BUCKET_SHA)
+        return self._run(key, burst, rate, cost)
+
+    def evalsha(self, sha, numkeys, key, burst, rate, cost):
+        self.commands.append(("evalsha", key))
+        if sha not in self.scripts:
+            raise redis.exceptions.NoScriptError("NOSCRIPT No matching script")
+        return self._run(key, burst, rate, cost)
+
+    def _run(self, key, burst, rate, cost):
+        tokens, ts = self.buckets.get(key, (burst, self.now_ms))
+        if self.now_ms > ts:
+            tokens = min(burst, tokens + (self.now_ms - ts) * rate / 1000)
+        allowed, retry_ms = 0, 0
+        if tokens >= cost:
+            tokens -= cost
+            allowed = 1
+        else:
+            retry_ms = math.ceil((cost - tokens) * 1000 / rate)
+        self.buckets[key] = (tokens, max(self.now_ms, ts))
+        return [allowed, math.floor(tokens), retry_ms]
+
+
+@pytest.fixture
+def bucket_redis():
+    return BucketRedis()
+
+
+@pytest.fixture
+def limited_app(app, bucket_redis):
+    guard = app.extensions["rate_limiting"]
+    guard.limiter = RateLimiter(client=bucket_redis, enabled=True, read_burst=3, read_rate=1.0, write_burst=1,
+                                write_rate=0.5)
+    with app.app_context():
+        db.session.add_all([make_store(1, 1), make_store(2, 1)])
+        db.session.commit()
+    return app
+
+
+def test_bucket_allows_the_burst_then_answers_429(limited_app, auth_headers, bucket_redis):
+    client = limited_app.test_client()
+    headers = auth_headers(1)
+
+    statuses = [client.get("/stores", headers=headers).status_code for _ in range(4)]
+    limited = client.get("/stores", headers=headers)
+
+    assert statuses == [200, 200, 200, 429]
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "1"
+    assert limited.headers["X-RateLimit-Limit"] == "3" and limited.headers["X-RateLimit-Remaining"] == "0"
+    assert limited.get_json()["message"] == "Too many requests"
+
+    bucket_redis.now_ms += 1000  # one token back
+    assert client.get("/stores", headers=headers).status_code == 200
+    assert client.get("/stores", headers=headers).status_code == 429
+
+
+def test_buckets_are_per_identity_and_route(limited_app, auth_headers, bucket_redis):
+    client = limited_app.test_client()
+    first, second = auth_headers(1), auth_headers(2)
+
+    for _ in range(3):
+        client.get("/stores", headers=first)
+
+    assert client.get("/stores", headers=first).status_code == 429
+    assert client.get("/stores", headers=second).status_code == 200
+    assert client.get("/store/1", headers=first).status_code == 200
+    assert bucket_key("1", "GET", "stores.StoreList") in bucket_redis.buckets
+
+
+def test_writes_have_their_own_limit_and_429_skips_the_database(limited_app, auth_headers, bucket_redis):
+    client = limited_app.test_client()
+    headers = auth_headers(1)
+    payload = {"store_number": 5, "customer_name": "Customer", "store_name": "Five", "address_line1": "Line 1",
+               "pin_code": "560001", "state_code": "KA", "country_code": "IN", "shipping_time": 2}
+    assert client.post("/create_store", json=payload, headers=headers).status_code == 201
+
+    statements = []
+    with limited_app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    limited = client.post("/create_store", json={**payload, "store_number": 6}, headers=headers)
+
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "2"  # 0.5 tokens per second
+    assert statements == []
+    assert client.get("/stores", headers=headers).status_code == 200  # reads are not drained by writes
+
+
+def test_anonymous_requests_and_other_blueprints_are_not_limited(limited_app, bucket_redis):
+    client = limited_app.test_client()
+
+    assert [client.get("/store/1").status_code for _ in range(5)] == [200] * 5
+    assert client.get("/stores").status_code == 401
+    assert client.get("/stores", headers={"Authorization": "Bearer not-a-jwt"}).status_code == 422
+    assert client.get("/health").status_code == 200
+    assert bucket_redis.buckets == {}
+
+
+def test_redis_errors_let_requests_through(limited_app, auth_headers):
+    class DownRedis:
+        def evalsha(self, *args):
+            raise redis.ConnectionError("down")
+
+    guard = limited_app.extensions["rate_limiting"]
+    guard.limiter.client = DownRedis()
+    headers = auth_headers(1)
+
+    assert [limited_app.test_client().get("/stores", headers=headers).status_code for _ in range(5)] == [200] * 5
+    assert guard.limiter.stats()["redis_errors"] == 5
+
+
+def test_script_is_loaded_once_then_called_by_sha(limited_app, auth_headers, bucket_redis):
+    headers = auth_headers(1)
+    client = limited_app.test_client()
+
+    client.get("/stores", headers=headers)
+    client.get("/stores", headers=headers)
+
+    assert bucket_redis.scripts == {TOKEN_BUCKET_SHA}
+    assert [command for command in bucket_redis.commands if command[0] == "evalsha"] == [
+        ("evalsha", bucket_key("1", "GET", "stores.StoreList"))
+    ] * 2
+
+
+def test_load_shedding_on_concurrency(app, auth_headers):
+    guard = app.extensions["rate_limiting"]
+    guard.shedder = LoadShedder(max_concurrent=1, retry_after=2)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    assert client.get("/stores", headers=headers).status_code == 200
+    assert guard.shedder.in_flight == 0  # released by teardown_request
+
+    guard.shedder.in_flight = 1  # another request is being served
+    shed = client.get("/stores", headers=headers)
+
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "2"
+    assert guard.shedder.in_flight == 1
+    assert app.test_client().get("/stats").get_json()["load_shedding"]["shed"] == 1
+
+
+def test_load_shedding_on_db_pool_queue(app, auth_headers, monkeypatch):
+    guard = app.extensions["rate_limiting"]
+    guard.shedder = LoadShedder(max_db_waiting=2)
+    client = app.test_client()
+    headers = auth_headers(1)
+    with app.app_context():
+        pool = db.engine.pool
+
+    monkeypatch.setattr(pool, "waiting", 1, raising=False)
+    assert client.get("/stores", headers=headers).status_code == 200
+    monkeypatch.setattr(pool, "waiting", 2, raising=False)
+    assert client.get("/stores", headers=headers).status_code == 503
+    assert client.get("/health").status_code == 200
+
+
+def test_limits_from_environment(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("RATE_LIMIT_WRITE_BURST", "4")
+    monkeypatch.setenv("LOAD_SHED_MAX_DB_WAITING", "8")
+
+    limiter, shedder = RateLimiter.from_env(), LoadShedder.from_env()
+
+    assert limiter.enabled and limiter.write_limit == (4, 2.0) and limiter.read_limit == (40, 20.0)
+    assert shedder.enabled and shedder.max_db_waiting == 8 and shedder.max_concurrent == 0
+    assert not LoadShedder().enabled
@@ -8,16 +8,123 @@ def test_redis_client_uses_environment_values(monkeypatch):
 
     from store_service.extensions import redis_client as redis_module
 
-    captured = {}
-
-    class FakeRedis:
-        def __init__(self, **kwargs):
-            captured.update(kwargs)
-
-    monkeypatch.setattr(redis_module.redis, "Redis", FakeRedis)
-    importlib.reload(redis_module)
+    pool = redis_module.build_connection_pool()
+    captured = pool.connection_kwargs
 
     assert captured["host"] == "cache.local"
     assert captured["port"] == 6380
     assert captured["password"] == "secret"
     assert captured["decode_responses"] is True
+
+
+def test_redis_client_pool_settings_from_environment(monkeypatch):
+    monkeypatch.setenv("REDIS_PASSWORD", "")
+    monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("REDIS_POOL_TIMEOUT", "0.25")
+    monkeypatch.setenv("REDIS_SOCKET_TIMEOUT", "0.2")
+    monkeypatch.setenv("REDIS_CONNECT_TIMEOUT", "0.1")
+    monkeypatch.setenv("REDIS_HEALTH_CHECK_INTERVAL", "15")
+    monkeypatch.setenv("REDIS_RETRIES", "4")
+
+    from store_service.extensions import redis_client as redis_module
+
+    importlib.reload(redis_module)
+    pool = redis_module.redis_client.connection_pool
+    captured = pool.connection_kwargs
+
+    assert isinstance(pool, redis_module.InstrumentedBlockingConnectionPool)
+    assert pool.max_connections == 7
+    assert pool.timeout == 0.25
+    assert captured["password"] is None
+    assert captured["socket_timeout"] == 0.2
+    assert captured["socket_connect_timeout"] == 0.1
+    assert captured["health_check_interval"] == 15
+    assert captured["retry"]._retries == 4
+    assert redis_module.pool_stats() == {
+        "max_connections": 7,
+        "created": 0,
+        "in_use": 0,
+        "idle": 0,
+        "checkouts": 0,
+        "exhausted": 0,
+        "wait_time_avg_ms": 0.0,
+        "wait_time_max_ms": 0.0,
+    }
+
+
+def test_pubsub_client_has_no_read_timeout(monkeypatch):
+    monkeypatch.setenv("REDIS_SOCKET_TIMEOUT", "0.2")
+    monkeypatch.setenv("REDIS_HEALTH_CHECK_INTERVAL", "15")
+
+    from store_service.extensions import redis_client as redis_module
+
+    pool = redis_module.build_pubsub_client().connection_pool
+    captured = pool.connection_kwargs
+
+    assert pool is not redis_module.redis_client.connection_pool
+    assert captured["socket_timeout"] is None
+    assert captured["retry_on_timeout"] is False
+    assert captured["health_check_interval"] == 15
+    assert captured["socket_keepalive"] is True
+
+
+def test_redis_pool_counts_exhaustion(monkeypatch):
+    from store_service.extensions import redis_client as redis_module
+
+    pool = redis_module.InstrumentedBlockingConnectionPool(max_connections=1, timeout=0.01)
+    pool.pool.get_nowait()  # take the only slot
+
+    try:
+        pool.get_connection("GET")
+    except redis_module.redis.ConnectionError:
+        pass
+
+    stats = pool.stats()
+    assert stats["exhausted"] == 1
+    assert stats["checkouts"] == 1
+
+
+def test_get_many_uses_single_mget(monkeypatch):
+    from store_service.extensions import redis_client as redis_module
+
+    calls = []
+
+    def fake_mget(keys):
+        calls.append(keys)
+        return ["a", None]
+
+    monkeypatch.setattr(redis_module.redis_client, "mget", fake_mget)
+
+    assert redis_module.get_many(["k1", "k2"]) == {"k1": "a", "k2": None}
+    assert redis_module.get_many([]) == {}
+    assert calls == [["k1", "k2"]]
+
+
+def test_run_pipeline_executes_commands_in_one_round_trip(monkeypatch):
+    from store_service.extensions import redis_client as redis_module
+
+    calls = []
+
+    class FakePipeline:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+        def get(self, key):
+            calls.append(("get", key))
+
+        def ttl(self, key):
+            calls.append(("ttl", key))
+
+        def execute(self):
+            calls.append("execute")
+            return ["value", 30]
+
+    monkeypatch.setattr(redis_module.redis_client, "pipeline", lambda transaction: FakePipeline())
+
+    result = redis_module.run_pipeline([("get", ("session:1",)), ("ttl", ("session:1",))])
+
+    assert result == ["value", 30]
+    assert calls == [("get", "session:1"), ("ttl", "session:1"), "execute"]
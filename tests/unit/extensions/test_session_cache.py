@@ -0,0 +1,218 @@
+import socket
+import threading
+import time
+
+import redis
+
+from store_service.extensions.redis_client import build_pubsub_client
+from store_service.extensions.session_cache import SessionCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _listening_cache(**kwargs):
+    cache = SessionCache(enabled=True, **kwargs)
+    # Pretend the revocation subscriber of this worker is already up.
+    cache.ensure_listener = lambda: None
+    cache._listening = True
+    return cache
+
+
+def test_session_cache_disabled_never_hits():
+    cache = SessionCache(enabled=False)
+
+    cache.add(1, "token", cache.generation())
+
+    assert cache.is_valid(1, "token") is False
+    assert cache.stats()["size"] == 0
+
+
+def test_session_cache_hits_and_counts():
+    cache = _listening_cache()
+
+    assert cache.is_valid(1, "token") is False
+    cache.add(1, "token", cache.generation())
+
+    assert cache.is_valid(1, "token") is True
+    assert cache.is_valid(1, "other-token") is False
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_session_cache_expires_entries():
+    clock = _Clock()
+    cache = _listening_cache(ttl=5, clock=clock)
+    cache.add(1, "token", cache.generation())
+
+    clock.now += 6
+
+    assert cache.is_valid(1, "token") is False
+
+
+def test_session_cache_evicts_least_recently_used():
+    cache = _listening_cache(max_size=2)
+    for user_id in (1, 2):
+        cache.add(user_id, "token", cache.generation())
+    cache.is_valid(1, "token")
+    cache.add(3, "token", cache.generation())
+
+    assert cache.is_valid(2, "token") is False
+    assert cache.is_valid(1, "token") is True
+    assert cache.stats()["evictions"] == 1
+
+
+def test_session_cache_skips_add_when_revoked_during_lookup():
+    cache = _listening_cache()
+    generation = cache.generation()
+
+    cache.invalidate(1)
+    cache.add(1, "token", generation)
+
+    assert cache.is_valid(1, "token") is False
+
+
+def test_session_cache_not_served_without_listener():
+    cache = _listening_cache()
+    cache.add(1, "token", cache.generation())
+
+    cache._listening = False
+
+    assert cache.is_valid(1, "token") is False
+
+
+def test_session_cache_handles_revocation_messages():
+    cache = _listening_cache()
+    for user_id in (7, 8, 9):
+        cache.add(user_id, "token", cache.generation())
+
+    cache.handle_message({"type": "pmessage", "channel": "__keyspace@0__:session:7", "data": "del"})
+    cache.handle_message({"type": "message", "channel": "session:revoked", "data": "8"})
+
+    assert cache.is_valid(7, "token") is False
+    assert cache.is_valid(8, "token") is False
+    assert cache.is_valid(9, "token") is True
+
+    cache.handle_message({"type": "message", "channel": "session:revoked", "data": "garbage"})
+
+    assert cache.stats()["size"] == 0
+
+
+def test_session_cache_listen_once_subscribes_and_clears_on_exit():
+    calls = {}
+
+    class FakePubSub:
+        def subscribe(self, channel):
+            calls["channel"] = channel
+
+        def psubscribe(self, pattern):
+            calls["pattern"] = pattern
+
+        def get_message(self, timeout):
+            calls.setdefault("timeouts", []).append(timeout)
+            if len(calls["timeouts"]) == 1:
+                cache.add(5, "token", cache.generation())
+                return {"type": "message", "data": "4"}
+            raise redis.ConnectionError("connection lost")
+
+        def close(self):
+            calls["closed"] = True
+
+    class FakeRedis:
+        def pubsub(self, **_kwargs):
+            return FakePubSub()
+
+    cache = SessionCache(client=FakeRedis(), enabled=True)
+    cache.listen_once()
+
+    assert calls["channel"] == "session:revoked"
+    assert calls["pattern"] == "__keyspace@*__:session:*"
+    assert calls["closed"] is True
+    assert cache.active is False
+    assert cache.stats()["size"] == 0
+
+
+class _PubSubServer:
+    """Just enough of a Redis server for a SUBSCRIBE / PSUBSCRIBE / PING connection; counts the connections."""
+
+    def __init__(self):
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self.listener.getsockname()[1]
+        self.connections = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            self.connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        reader = conn.makefile("rb")
+        try:
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                args = []
+                for _ in range(int(line[1:])):
+                    length = int(reader.readline()[1:])
+                    args.append(reader.read(length + 2)[:-2].decode())
+                command = args[0].lower()
+                if command == "ping" and len(args) == 1:  # connection health check
+                    conn.sendall(b"+PONG\r\n")
+                elif command == "ping":  # subscribed connection health check: ["pong", message]
+                    conn.sendall(f"*2\r\n$4\r\npong\r\n${len(args[1])}\r\n{args[1]}\r\n".encode())
+                else:
+                    target = args[1]
+                    conn.sendall(
+                        f"*3\r\n${len(command)}\r\n{command}\r\n${len(target)}\r\n{target}\r\n:1\r\n".encode()
+                    )
+        except OSError:
+            return
+
+    def publish(self, channel, data):
+        self.connections[-1].sendall(
+            f"*3\r\n$7\r\nmessage\r\n${len(channel)}\r\n{channel}\r\n${len(data)}\r\n{data}\r\n".encode()
+        )
+
+    def close(self):
+        self.listener.close()
+        for conn in self.connections:
+            conn.close()
+
+
+def test_idle_listener_outlives_the_socket_timeout(monkeypatch):
+    server = _PubSubServer()
+    monkeypatch.setenv("REDIS_HOST", "127.0.0.1")
+    monkeypatch.setenv("REDIS_PORT", str(server.port))
+    monkeypatch.setenv("REDIS_SOCKET_TIMEOUT", "0.1")
+    cache = SessionCache(client=build_pubsub_client(), enabled=True)
+    cache.ensure_listener = lambda: None  # listen_once() runs on the thread below
+    threading.Thread(target=cache.listen_once, daemon=True).start()
+    try:
+        deadline = time.monotonic() + 5
+        while not cache.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+        cache.add(4, "token", cache.generation())
+
+        time.sleep(1.5)  # quiet channel, 15x REDIS_SOCKET_TIMEOUT
+
+        assert cache.active and len(server.connections) == 1
+        assert cache.is_valid(4, "token")
+        server.publish("session:revoked", "4")
+        deadline = time.monotonic() + 5
+        while cache.stats()["revocations"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not cache.is_valid(4, "token")
+    finally:
+        server.close()
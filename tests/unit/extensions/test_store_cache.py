@@ -0,0 +1,87 @@
+import redis
+from flask import Flask
+
+from store_service.extensions.store_cache import StoreCache, store_key, user_stores_key
+
+
+def _cache(client, **kwargs):
+    return StoreCache(client=client, enabled=True, **kwargs)
+
+
+def test_store_cache_loads_once_and_serves_identical_body(fake_redis):
+    app = Flask(__name__)
+    cache = _cache(fake_redis)
+    loads = {"count": 0}
+
+    def loader():
+        loads["count"] += 1
+        return {"store_id": 1, "store_name": "Main"}
+
+    with app.app_context():
+        first = cache.get_or_load(store_key(1), loader, ttl=60)
+        second = cache.get_or_load(store_key(1), loader, ttl=60)
+
+    assert loads["count"] == 1
+    assert first.get_data() == second.get_data()
+    assert second.mimetype == "application/json"
+    assert "store:1:lock" not in fake_redis.data
+
+
+def test_store_cache_invalidate_bumps_version(fake_redis):
+    app = Flask(__name__)
+    cache = _cache(fake_redis)
+    payloads = iter([{"store_name": "old"}, {"store_name": "new"}])
+
+    with app.app_context():
+        cache.get_or_load(store_key(1), lambda: next(payloads), ttl=60)
+        cache.invalidate(store_key(1), user_stores_key(5))
+        response = cache.get_or_load(store_key(1), lambda: next(payloads), ttl=60)
+
+    assert response.get_json() == {"store_name": "new"}
+    assert fake_redis.data["store:1:v"] == "1"
+    assert fake_redis.data["stores:user:5:v"] == "1"
+
+
+def test_store_cache_ignores_body_written_under_old_version(fake_redis):
+    app = Flask(__name__)
+    cache = _cache(fake_redis)
+    # A slow reader stored its body after a writer already bumped the version.
+    fake_redis.data["store:1:v"] = "2"
+    fake_redis.data["store:1"] = '1|{"store_name":"stale"}'
+
+    with app.app_context():
+        response = cache.get_or_load(store_key(1), lambda: {"store_name": "fresh"}, ttl=60)
+
+    assert response.get_json() == {"store_name": "fresh"}
+    assert fake_redis.data["store:1"].startswith("2|")
+
+
+def test_store_cache_waits_for_lock_holder_then_falls_back(fake_redis):
+    app = Flask(__name__)
+    cache = _cache(fake_redis, lock_wait_ms=30, poll_interval_ms=10)
+    fake_redis.data["store:1:lock"] = "other-worker"
+
+    with app.app_context():
+        response = cache.get_or_load(store_key(1), lambda: {"store_name": "db"}, ttl=60)
+
+    assert response.get_json() == {"store_name": "db"}
+    # Only the lock holder fills the cache.
+    assert "store:1" not in fake_redis.data
+
+
+def test_store_cache_bypasses_redis_errors():
+    class BrokenRedis:
+        def mget(self, _keys):
+            raise redis.ConnectionError("down")
+
+        def pipeline(self, transaction):
+            raise redis.ConnectionError("down")
+
+    app = Flask(__name__)
+    cache = _cache(BrokenRedis())
+
+    with app.app_context():
+        response = cache.get_or_load(store_key(1), lambda: {"store_name": "db"}, ttl=60)
+        cache.invalidate(store_key(1))
+
+    assert response.get_json() == {"store_name": "db"}
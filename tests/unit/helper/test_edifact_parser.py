@@ -1,4 +1,8 @@
-from store_service.helper.edifact_parser import parse_edifact
+import io
+
+import pytest
+
+from store_service.helper.edifact_parser import iter_messages, iter_segments, parse_edifact
 
 
 def test_parse_edifact_parses_segments(tmp_path):
@@ -19,3 +23,61 @@ def test_parse_edifact_ignores_empty_segments(tmp_path):
     parsed = parse_edifact(str(edi_file))
 
     assert set(parsed.keys()) == {"BGM", "PRI"}
+
+
+def test_iter_segments_keeps_repeated_segments_in_order(tmp_path):
+    edi_file = tmp_path / "repeated.edi"
+    edi_file.write_text("LIN+1'PRI+AAA:10'LIN+2'PRI+AAA:20'", encoding="utf-8")
+
+    segments = list(iter_segments(str(edi_file)))
+
+    assert segments == [
+        [["LIN"], ["1"]],
+        [["PRI"], ["AAA", "10"]],
+        [["LIN"], ["2"]],
+        [["PRI"], ["AAA", "20"]],
+    ]
+
+
+def test_iter_segments_honours_una_and_release_character():
+    # UNA redefines component ";" element "*" release "!" terminator "~"
+    stream = io.StringIO("UNA;*.! ~\nBGM*220*2!*3~\nFTX*AAI***note!;with!!bang;x~")
+
+    segments = list(iter_segments(stream))
+
+    assert segments == [
+        [["BGM"], ["220"], ["2*3"]],
+        [["FTX"], ["AAI"], [""], [""], ["note;with!bang", "x"]],
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_iter_segments_is_independent_of_chunk_boundaries(chunk_size):
+    content = "UNA:+.? 'UNH+1+ORDERS:D:96A:UN'FTX+AAI+++a?'b?+c'UNT+3+1'"
+
+    segments = list(iter_segments(io.StringIO(content), chunk_size=chunk_size))
+
+    assert segments == [
+        [["UNH"], ["1"], ["ORDERS", "D", "96A", "UN"]],
+        [["FTX"], ["AAI"], [""], [""], ["a'b+c"]],
+        [["UNT"], ["3"], ["1"]],
+    ]
+
+
+def test_iter_messages_yields_every_message_of_an_interchange():
+    content = (
+        "UNB+UNOC:3+SENDER+RECEIVER+240101:1200+1'"
+        "UNH+1+ORDERS:D:96A:UN'BGM+220+2+9'UNT+3+1'"
+        "UNH+2+ORDERS:D:96A:UN'BGM+220+5+9'UNT+3+2'"
+        "UNZ+2+1'"
+    )
+
+    messages = list(iter_messages(io.StringIO(content)))
+
+    assert [message[1] for message in messages] == [[["BGM"], ["220"], ["2"], ["9"]], [["BGM"], ["220"], ["5"], ["9"]]]
+    assert all(message[0][0] == ["UNH"] and message[-1][0] == ["UNT"] for message in messages)
+
+
+def test_iter_messages_rejects_unterminated_message():
+    with pytest.raises(ValueError):
+        list(iter_messages(io.StringIO("UNH+1+ORDERS:D:96A:UN'BGM+220+2+9'")))
@@ -0,0 +1,97 @@
+from store_service.extensions.db import db
+from store_service.models.store_db import StoreModel
+from tests.conftest import make_store
+
+
+def _payload(store_number, **overrides):
+    payload = {
+        "store_number": store_number,
+        "customer_name": "Customer",
+        "store_name": f"Store {store_number}",
+        "address_line1": "Line 1",
+        "pin_code": "560001",
+        "state_code": "KA",
+        "country_code": "IN",
+        "shipping_time": 2,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_bulk_create_inserts_all_rows(app, auth_headers, monkeypatch):
+    from store_service.resources import store as store_resource
+
+    monkeypatch.setattr(store_resource, "BULK_CREATE_CHUNK_SIZE", 2)
+
+    response = app.test_client().post(
+        "/create_stores", json=[_payload(number) for number in range(1, 6)], headers=auth_headers(1)
+    )
+
+    body = response.get_json()
+    assert response.status_code == 201
+    assert body["created"] == 5
+    assert [row["status"] for row in body["results"]] == ["created"] * 5
+    with app.app_context():
+        stored = {store.store_number: store.store_id for store in StoreModel.query.filter_by(user_id=1)}
+    assert {row["store_number"]: row["store_id"] for row in body["results"]} == stored
+
+
+def test_bulk_create_reports_conflicts_per_row(app, auth_headers):
+    with app.app_context():
+        db.session.add(make_store(1, 2))
+        db.session.commit()
+
+    response = app.test_client().post(
+        "/create_stores",
+        json=[_payload(1), _payload(2), _payload(3), _payload(3)],
+        headers=auth_headers(1),
+    )
+
+    body = response.get_json()
+    assert response.status_code == 207
+    assert [row["status"] for row in body["results"]] == ["created", "conflict", "created", "conflict"]
+    assert body["created"] == 2
+    assert body["failed"] == 2
+
+
+def test_bulk_create_replays_chunk_after_integrity_error(app, auth_headers):
+    # store_name is optional in the schema but NOT NULL in the table: the executemany fails and the chunk is
+    # retried row by row, so only that row is rejected.
+    incomplete = _payload(2)
+    del incomplete["store_name"]
+
+    response = app.test_client().post("/create_stores", json=[_payload(1), incomplete], headers=auth_headers(1))
+
+    body = response.get_json()
+    assert response.status_code == 207
+    assert [row["status"] for row in body["results"]] == ["created", "error"]
+
+
+def test_bulk_create_validates_payload_and_size(app, auth_headers, monkeypatch):
+    from store_service.resources import store as store_resource
+
+    client = app.test_client()
+    headers = auth_headers(1)
+    monkeypatch.setattr(store_resource, "BULK_CREATE_MAX_ROWS", 1)
+
+    assert client.post("/create_stores", json=[{"store_number": 1}], headers=headers).status_code == 422
+    assert client.post("/create_stores", json=[], headers=headers).status_code == 400
+    assert client.post("/create_stores", json=[_payload(1), _payload(2)], headers=headers).status_code == 413
+
+
+def test_bulk_create_logs_database_errors(app, auth_headers, monkeypatch, caplog):
+    from sqlalchemy.exc import OperationalError
+
+    from store_service.resources import store as store_resource
+
+    def failing_chunk(_rows, _user_id):
+        raise OperationalError("INSERT", {}, Exception("server has gone away"))
+
+    monkeypatch.setattr(store_resource, "_insert_store_chunk", failing_chunk)
+
+    response = app.test_client().post("/create_stores", json=[_payload(1)], headers=auth_headers(1))
+
+    assert response.status_code == 207
+    assert response.get_json()["results"][0]["status"] == "error"
+    assert "Bulk store insert failed for user 1" in caplog.text
+    assert "server has gone away" in caplog.text
@@ -0,0 +1,142 @@
+import pytest
+from sqlalchemy import event, select
+
+from store_service.extensions.db import db
+from store_service.models.store_db import StoreModel
+from store_service.resources import store as store_resource
+from tests.conftest import make_store
+
+
+@pytest.fixture
+def seeded(app):
+    # user 1 owns store_id 1-5 (3 and 5 in MH), user 2 owns store_id 6
+    with app.app_context():
+        db.session.add_all(
+            [make_store(1, number, state_code="MH" if number in (3, 5) else "KA") for number in range(1, 6)]
+        )
+        db.session.add(make_store(2, 1))
+        db.session.commit()
+    return app
+
+
+def _stores(app):
+    with app.app_context():
+        stores = StoreModel.__table__
+        rows = db.session.execute(select(stores.c.store_id, stores.c.store_name, stores.c.version)).all()
+    return {store_id: (name, version) for store_id, name, version in rows}
+
+
+def _statements(app):
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_bulk_patch_updates_the_callers_stores_in_chunks(seeded, auth_headers, monkeypatch):
+    monkeypatch.setattr(store_resource, "BULK_WRITE_CHUNK_SIZE", 2)
+    statements = _statements(seeded)
+
+    response = seeded.test_client().patch(
+        "/stores/bulk",
+        json={"store_ids": [1, 2, 3, 3, 6, 99], "patch": {"store_name": "Renamed", "shipping_time": 4}},
+        headers=auth_headers(1),
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {"updated": 3}
+    stores = _stores(seeded)
+    assert [stores[store_id] for store_id in (1, 2, 3)] == [("Renamed", 2)] * 3
+    assert stores[4] == ("Store 4", 1) and stores[6] == ("Store 1", 1)  # not listed / someone else's
+    updates = [statement for statement in statements if statement.lstrip().upper().startswith("UPDATE")]
+    assert len(updates) == 3  # ids 1,2 | 3,6 | 99
+    assert all("store_id IN" in statement and "user_id = " in statement for statement in updates)
+
+
+def test_bulk_patch_by_filter(seeded, auth_headers):
+    response = seeded.test_client().patch(
+        "/stores/bulk",
+        json={"filter": {"state_code": "MH"}, "patch": {"customer_name": "West"}},
+        headers=auth_headers(1),
+    )
+
+    assert response.get_json() == {"updated": 2}
+    with seeded.app_context():
+        stores = StoreModel.__table__
+        west = db.session.execute(select(stores.c.store_id).where(stores.c.customer_name == "West")).scalars().all()
+    assert sorted(west) == [3, 5]
+
+
+def test_bulk_delete_by_ids_and_by_filter(seeded, auth_headers):
+    client = seeded.test_client()
+    headers = auth_headers(1)
+
+    by_ids = client.delete("/stores/bulk", json={"store_ids": [1, 6]}, headers=headers)
+    by_filter = client.delete("/stores/bulk", json={"filter": {"state_code": "MH"}}, headers=headers)
+    nothing = client.delete("/stores/bulk", json={"filter": {"state_code": "MH"}}, headers=headers)
+
+    assert (by_ids.get_json(), by_filter.get_json(), nothing.get_json()) == (
+        {"deleted": 1}, {"deleted": 2}, {"deleted": 0}
+    )
+    assert sorted(_stores(seeded)) == [2, 4, 6]
+
+
+def test_bulk_writes_invalidate_the_store_cache(seeded, auth_headers, fake_redis, monkeypatch):
+    monkeypatch.setattr(store_resource.store_cache, "enabled", True)
+    monkeypatch.setattr(store_resource.store_cache, "client", fake_redis)
+    client = seeded.test_client()
+    headers = auth_headers(1)
+    assert client.get("/store/3").get_json()["store_name"] == "Store 3"
+
+    client.patch("/stores/bulk", json={"filter": {"state_code": "MH"}, "patch": {"store_name": "Cached"}},
+                 headers=headers)
+
+    assert client.get("/store/3").get_json()["store_name"] == "Cached"
+    assert fake_redis.data["store:5:v"] == "1"
+    assert fake_redis.data["stores:user:1:v"] == "1"
+
+
+@pytest.mark.parametrize("method, body", [
+    ("patch", {"store_ids": [1], "filter": {"state_code": "KA"}, "patch": {"store_name": "x"}}),
+    ("patch", {"patch": {"store_name": "x"}}),
+    ("patch", {"store_ids": [1]}),
+    ("patch", {"store_ids": [1], "patch": {}}),
+    ("patch", {"store_ids": [1], "patch": {"store_number": 9}}),
+    ("patch", {"store_ids": [1], "patch": {"customer_name": None}}),
+    ("patch", {"store_ids": [], "patch": {"store_name": "x"}}),
+    ("delete", {"filter": {}}),
+    ("delete", {"filter": {"shipping_time_min": 5, "shipping_time_max": 1}}),
+    ("delete", {"store_ids": ["abc"]}),
+])
+def test_bulk_writes_validate_the_body(seeded, auth_headers, method, body):
+    response = getattr(seeded.test_client(), method)("/stores/bulk", json=body, headers=auth_headers(1))
+
+    assert response.status_code == 422
+    assert all(version == 1 for _, version in _stores(seeded).values())
+    assert len(_stores(seeded)) == 6
+
+
+def test_bulk_writes_are_capped_and_authenticated(seeded, auth_headers, monkeypatch):
+    monkeypatch.setattr(store_resource, "BULK_WRITE_MAX_STORES", 2)
+    client = seeded.test_client()
+    headers = auth_headers(1)
+
+    assert client.delete("/stores/bulk", json={"store_ids": [1, 2, 3]}, headers=headers).status_code == 413
+    assert client.delete("/stores/bulk", json={"filter": {"state_code": "KA"}}, headers=headers).status_code == 413
+    assert client.delete("/stores/bulk", json={"store_ids": [1]}).status_code == 401
+    assert len(_stores(seeded)) == 6
+
+
+def test_bulk_write_database_errors_are_logged(seeded, auth_headers, monkeypatch, caplog):
+    from sqlalchemy.exc import OperationalError
+
+    def failing_execute(*_args, **_kwargs):
+        raise OperationalError("UPDATE", {}, Exception("server has gone away"))
+
+    with seeded.app_context():
+        monkeypatch.setattr(db.session, "execute", failing_execute)
+        response = seeded.test_client().delete("/stores/bulk", json={"store_ids": [1]}, headers=auth_headers(1))
+
+    assert response.status_code == 500
+    assert "Bulk store write failed for user 1" in caplog.text
+    assert "server has gone away" in caplog.text
@@ -0,0 +1,129 @@
+from sqlalchemy import event
+
+from store_service.extensions.db import db
+from store_service.resources import store as store_resource
+from tests.conftest import make_store
+
+
+def _seed(app, count=2):
+    with app.app_context():
+        db.session.add_all(make_store(1, number) for number in range(1, count + 1))
+        db.session.commit()
+
+
+def _record_statements(app):
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_store_get_answers_304_from_the_version_only(app):
+    _seed(app, count=1)
+    client = app.test_client()
+    first = client.get("/store/1")
+    statements = _record_statements(app)
+
+    second = client.get("/store/1", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200 and first.headers["ETag"] and first.headers["Last-Modified"]
+    assert second.status_code == 304
+    assert second.get_data() == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(statements) == 1
+    assert "store_name" not in statements[0]
+
+
+def test_store_put_bumps_the_version_and_etag(app, auth_headers):
+    _seed(app, count=1)
+    client = app.test_client()
+    etag = client.get("/store/1").headers["ETag"]
+
+    client.put("/store/1", json={"customer_name": "Renamed"}, headers=auth_headers(1))
+    after_put = client.get("/store/1", headers={"If-None-Match": etag})
+
+    assert after_put.status_code == 200
+    assert after_put.get_json()["customer_name"] == "Renamed"
+    assert after_put.headers["ETag"] != etag
+    with app.app_context():
+        assert db.session.get(store_resource.StoreModel, 1).version == 2
+
+
+def test_projections_have_their_own_etag(app):
+    _seed(app, count=1)
+    client = app.test_client()
+
+    full = client.get("/store/1")
+    projected = client.get("/store/1?fields=store_name")
+
+    assert projected.headers["ETag"] != full.headers["ETag"]
+    assert client.get("/store/1?fields=store_name", headers={"If-None-Match": full.headers["ETag"]}).status_code == 200
+    assert client.get(
+        "/store/1?fields=store_name", headers={"If-None-Match": projected.headers["ETag"]}
+    ).status_code == 304
+    assert client.get("/store/9", headers={"If-None-Match": full.headers["ETag"]}).status_code == 404
+
+
+def test_store_list_etag_changes_with_creates_updates_and_deletes(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    def etag_of_first_page():
+        return client.get("/stores", headers=headers).headers["ETag"]
+
+    etags = [etag_of_first_page()]
+    client.post("/create_store", json=make_store_payload(3), headers=headers)
+    etags.append(etag_of_first_page())
+    client.put("/store/1", json={"customer_name": "Renamed"}, headers=headers)
+    etags.append(etag_of_first_page())
+    client.delete("/store/2", headers=headers)
+    etags.append(etag_of_first_page())
+
+    assert len(set(etags)) == 4
+
+
+def test_store_list_answers_304_from_the_index(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+    etag = client.get("/stores?limit=1", headers=headers).headers["ETag"]
+    statements = _record_statements(app)
+
+    response = client.get("/stores?limit=1", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert "X-Next-Cursor" not in response.headers
+    assert len(statements) == 1
+    assert "customer_name" not in statements[0]
+
+
+def test_cached_responses_keep_their_etag(app, auth_headers, monkeypatch, fake_redis):
+    _seed(app, count=1)
+    monkeypatch.setattr(store_resource.store_cache, "enabled", True)
+    monkeypatch.setattr(store_resource.store_cache, "client", fake_redis)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    first = client.get("/store/1")
+    cached = client.get("/store/1", headers={"If-None-Match": first.headers["ETag"]})
+    listed = client.get("/stores", headers=headers)
+    listed_again = client.get("/stores", headers={**headers, "If-None-Match": listed.headers["ETag"]})
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == first.headers["ETag"]
+    assert first.headers["Last-Modified"]
+    assert listed_again.status_code == 304
+
+
+def make_store_payload(number):
+    return {
+        "store_number": number,
+        "customer_name": "Customer",
+        "store_name": f"Store {number}",
+        "address_line1": "Line 1",
+        "pin_code": "560001",
+        "state_code": "KA",
+        "country_code": "IN",
+        "shipping_time": 2,
+    }
@@ -0,0 +1,95 @@
+from sqlalchemy import event
+
+from store_service.extensions.db import db
+from store_service.resources import store as store_resource
+from tests.conftest import make_store
+
+
+def _seed(app, count=3):
+    with app.app_context():
+        db.session.add_all(make_store(1, number) for number in range(1, count + 1))
+        db.session.commit()
+
+
+def _record_selects(app):
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_store_list_returns_and_selects_only_requested_fields(app, auth_headers):
+    _seed(app)
+    statements = _record_selects(app)
+
+    response = app.test_client().get("/stores?fields=store_id,store_number,store_name", headers=auth_headers(1))
+
+    assert response.status_code == 200
+    assert response.get_json()[0] == {"store_id": 1, "store_number": 1, "store_name": "Store 1"}
+    select_clause = statements[-1].split("FROM")[0]
+    assert "store_name" in select_clause
+    assert "customer_name" not in select_clause and "address_line1" not in select_clause
+
+
+def test_store_list_pages_without_the_key_field(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    first = client.get("/stores?fields=store_name&limit=2", headers=headers)
+    second = client.get(f"/stores?fields=store_name&limit=2&cursor={first.headers['X-Next-Cursor']}", headers=headers)
+
+    assert first.get_json() == [{"store_name": "Store 1"}, {"store_name": "Store 2"}]
+    assert second.get_json() == [{"store_name": "Store 3"}]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_unknown_or_empty_fields_are_rejected(app, auth_headers):
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    assert client.get("/stores?fields=store_name,password", headers=headers).status_code == 422
+    assert client.get("/stores?fields=", headers=headers).status_code == 422
+    assert client.get("/store/1?fields=secret").status_code == 422
+
+
+def test_store_get_projection(app):
+    _seed(app, count=1)
+    client = app.test_client()
+
+    response = client.get("/store/1?fields=store_number,store_name")
+
+    assert response.get_json() == {"store_number": 1, "store_name": "Store 1"}
+    assert client.get("/store/99?fields=store_name").status_code == 404
+    assert client.get("/store/abc?fields=store_name").status_code == 404
+
+
+def test_fast_path_projection_is_byte_identical(app, auth_headers, monkeypatch):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+    url = "/stores?fields=store_name,store_number&limit=2"
+
+    schema_response = client.get(url, headers=headers)
+    monkeypatch.setattr(store_resource, "STORE_LIST_FAST_PATH", True)
+    fast_response = client.get(url, headers=headers)
+
+    assert fast_response.get_data() == schema_response.get_data()
+    assert fast_response.headers["X-Next-Cursor"] == schema_response.headers["X-Next-Cursor"]
+
+
+def test_projections_are_cached_under_their_own_key(app, auth_headers, monkeypatch, fake_redis):
+    _seed(app, count=1)
+    monkeypatch.setattr(store_resource.store_cache, "enabled", True)
+    monkeypatch.setattr(store_resource.store_cache, "client", fake_redis)
+    client = app.test_client()
+
+    full = client.get("/store/1")
+    projected = client.get("/store/1?fields=store_name")
+    listed = client.get("/stores?fields=store_name", headers=auth_headers(1))
+
+    assert set(full.get_json()) > {"store_name"}
+    assert projected.get_json() == {"store_name": "Store 1"}
+    assert fake_redis.data["store:1:fields:store_name"].endswith('{"store_name":"Store 1"}\n')
+    assert listed.get_json() == [{"store_name": "Store 1"}]
+    assert "stores:user:1:0:100:fields:store_name" in fake_redis.data
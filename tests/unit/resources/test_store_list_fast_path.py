@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from flask import jsonify
+
+from store_service.extensions.db import db
+from store_service.models.store_db import StoreModel
+from store_service.resources import store as store_resource
+from store_service.schemas.store_schema import StoreSchema
+from store_service.utils import fast_json
+from tests.conftest import make_store
+
+
+def _seed(app):
+    with app.app_context():
+        db.session.add_all([
+            make_store(1, 1),
+            make_store(1, 2, store_name="Café Zoë", address_line2="Straße 5"),
+            make_store(1, 3, customer_name="quote \" back\\slash \x7f tab\t", address_line3=None),
+            make_store(1, 4, store_name="店舗 🛒"),
+            make_store(2, 1),
+        ])
+        db.session.commit()
+
+
+def _get_pages(client, headers, limit):
+    pages, cursor = [], None
+    while True:
+        url = f"/stores?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url, headers=headers)
+        pages.append((response.status_code, response.get_data(), response.headers.get("X-Next-Cursor")))
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+@pytest.mark.parametrize("limit", [2, 100])
+def test_fast_path_is_byte_identical_to_schema_path(app, auth_headers, monkeypatch, limit):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    schema_pages = _get_pages(client, headers, limit)
+    monkeypatch.setattr(store_resource, "STORE_LIST_FAST_PATH", True)
+    fast_pages = _get_pages(client, headers, limit)
+
+    assert fast_pages == schema_pages
+
+
+def test_fast_path_rows_match_store_schema_dump(app, auth_headers, monkeypatch):
+    _seed(app)
+    monkeypatch.setattr(store_resource, "STORE_LIST_FAST_PATH", True)
+
+    response = app.test_client().get("/stores", headers=auth_headers(1))
+
+    with app.app_context():
+        stores = StoreModel.query.filter_by(user_id=1).order_by(StoreModel.store_id).all()
+        assert json.loads(response.get_data()) == StoreSchema(many=True).dump(stores)
+    assert StoreSchema(many=True).validate(
+        [{key: value for key, value in row.items() if key not in ("store_id", "user_id")} for row in response.get_json()]
+    ) == {}
+
+
+@pytest.mark.parametrize("payload", [
+    [{"b": 1, "a": None, "c": "plain"}],
+    [{"name": "Zoë ✓ 🛒"}],
+    [{"name": "del \x7f ctrl \x01 \n"}],
+    {"big": 2 ** 70},
+    [],
+])
+def test_dumps_matches_jsonify(app, payload):
+    with app.app_context():
+        assert fast_json.dumps(payload) == jsonify(payload).get_data()
+
+
+def test_fast_path_is_not_used_when_jsonify_would_indent(app):
+    with app.app_context():
+        assert fast_json.can_replace_jsonify()
+        app.debug = True
+        assert not fast_json.can_replace_jsonify()
@@ -0,0 +1,61 @@
+from store_service.extensions.db import db
+from tests.conftest import make_store
+
+
+def _seed(app, user_id, count):
+    with app.app_context():
+        db.session.add_all(make_store(user_id, number) for number in range(1, count + 1))
+        db.session.commit()
+
+
+def test_store_list_pages_with_cursor(app, auth_headers):
+    _seed(app, user_id=1, count=5)
+    _seed(app, user_id=2, count=3)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    first = client.get("/stores?limit=2", headers=headers)
+    second = client.get(f"/stores?limit=2&cursor={first.headers['X-Next-Cursor']}", headers=headers)
+    last = client.get(f"/stores?limit=2&cursor={second.headers['X-Next-Cursor']}", headers=headers)
+
+    assert [store["store_number"] for store in first.get_json()] == [1, 2]
+    assert [store["store_number"] for store in second.get_json()] == [3, 4]
+    assert [store["store_number"] for store in last.get_json()] == [5]
+    assert "X-Next-Cursor" not in last.headers
+    assert {store["user_id"] for store in first.get_json() + second.get_json() + last.get_json()} == {1}
+
+
+def test_store_list_caps_page_size(app, auth_headers, monkeypatch):
+    from store_service.utils import pagination
+
+    monkeypatch.setattr(pagination, "MAX_PAGE_SIZE", 3)
+    _seed(app, user_id=1, count=5)
+
+    response = app.test_client().get("/stores?limit=1000", headers=auth_headers(1))
+
+    assert len(response.get_json()) == 3
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_store_list_rejects_bad_cursor_and_limit(app, auth_headers):
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    assert client.get("/stores?cursor=not-a-cursor", headers=headers).status_code == 400
+    assert client.get("/stores?limit=0", headers=headers).status_code == 422
+
+
+def test_store_list_cached_pages_keep_cursor(app, auth_headers, monkeypatch, fake_redis):
+    from store_service.resources import store as store_resource
+
+    monkeypatch.setattr(store_resource.store_cache, "enabled", True)
+    monkeypatch.setattr(store_resource.store_cache, "client", fake_redis)
+    _seed(app, user_id=1, count=3)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    uncached = client.get("/stores?limit=2", headers=headers)
+    cached = client.get("/stores?limit=2", headers=headers)
+
+    assert cached.get_data() == uncached.get_data()
+    assert cached.headers["X-Next-Cursor"] == uncached.headers["X-Next-Cursor"]
@@ -4,17 +4,6 @@ from flask import Flask
 from store_service.resources import store as store_resource
 
 
-class _FakeQuery:
-    def __init__(self, result):
-        self._result = result
-
-    def filter_by(self, **_kwargs):
-        return self
-
-    def first(self):
-        return self._result
-
-
 def test_validate_active_session_success(monkeypatch):
     app = Flask(__name__)
 
@@ -38,29 +27,23 @@ def test_validate_active_session_rejects_missing_authorization_header():
     assert getattr(exc_info.value, "code", None) == 401
 
 
-def test_get_user_product_or_404_returns_store(monkeypatch):
-    expected_store = object()
-    fake_model = type(
-        "FakeStoreModel",
-        (),
-        {"query": _FakeQuery(result=expected_store)},
-    )
-    monkeypatch.setattr(store_resource, "StoreModel", fake_model)
-
-    result = store_resource.get_user_product_or_404(store_id=1, user_id=1)
-
-    assert result is expected_store
+def test_validate_active_session_uses_session_cache(monkeypatch):
+    app = Flask(__name__)
+    redis_calls = {"count": 0}
 
+    def fake_get(_key):
+        redis_calls["count"] += 1
+        return '{"token": "valid-token"}'
 
-def test_get_user_product_or_404_raises_404(monkeypatch):
-    fake_model = type(
-        "FakeStoreModel",
-        (),
-        {"query": _FakeQuery(result=None)},
-    )
-    monkeypatch.setattr(store_resource, "StoreModel", fake_model)
+    cache = store_resource.session_cache
+    monkeypatch.setattr(cache, "enabled", True)
+    monkeypatch.setattr(cache, "_listening", True)
+    monkeypatch.setattr(cache, "ensure_listener", lambda: None)
+    monkeypatch.setattr(store_resource.redis_client, "get", fake_get)
 
-    with pytest.raises(Exception) as exc_info:
-        store_resource.get_user_product_or_404(store_id=1, user_id=1)
+    with app.test_request_context(headers={"Authorization": "Bearer valid-token"}):
+        store_resource.validate_active_session(user_id=10)
+        store_resource.validate_active_session(user_id=10)
 
-    assert getattr(exc_info.value, "code", None) == 404
+    cache.clear()
+    assert redis_calls["count"] == 1
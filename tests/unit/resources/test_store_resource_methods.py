@@ -1,8 +1,10 @@
 import inspect
+import json
 
 import pytest
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from store_service.models.store_db import StoreModel as _StoreModel
 from store_service.resources import store as store_resource
 
 
@@ -28,10 +30,37 @@ class _QueryAll:
     def filter_by(self, **_kwargs):
         return self
 
+    def filter(self, *_criteria):
+        return self
+
+    def order_by(self, *_columns):
+        return self
+
+    def limit(self, _limit):
+        return self
+
     def all(self):
         return self.values
 
 
+class _Result:
+    def __init__(self, rowcount=0, row=None, lastrowid=None):
+        self.rowcount = rowcount
+        self.row = row
+        self.lastrowid = lastrowid
+
+    def mappings(self):
+        return self
+
+    def first(self):
+        return self.row
+
+
+class _Bind:
+    def __init__(self, update_returning):
+        self.dialect = type("FakeDialect", (), {"update_returning": update_returning})()
+
+
 class _QueryGetOr404:
     def __init__(self, value):
         self.value = value
@@ -66,37 +95,69 @@ def test_validate_active_session_rejects_token_mismatch(monkeypatch):
     assert getattr(exc_info.value, "code", None) == 401
 
 
+class _VersionedStore:
+    def __init__(self, store_id, version=1):
+        self.store_id = store_id
+        self.version = version
+        self.updated_at = None
+
+
 def test_store_get_returns_query_result(monkeypatch):
-    expected_store = object()
+    from flask import Flask
+
+    expected_store = _VersionedStore(11)
     fake_model = type("FakeStoreModel", (), {"query": _QueryGetOr404(expected_store)})
     monkeypatch.setattr(store_resource, "StoreModel", fake_model)
 
-    result = _unwrap(store_resource.Store.get)(store_resource.Store(), "11")
+    with Flask(__name__).test_request_context():
+        store, headers = _unwrap(store_resource.Store.get)(store_resource.Store(), {}, "11")
 
-    assert result is expected_store
+    assert store is expected_store
+    assert set(headers) == {"ETag"}
 
 
 def test_store_delete_success(monkeypatch):
     calls = {}
-    fake_store = object()
 
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
     monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
-    monkeypatch.setattr(store_resource, "get_user_product_or_404", lambda _store_id, _user_id: fake_store)
-    monkeypatch.setattr(store_resource.db.session, "delete", lambda store: calls.setdefault("deleted", store))
+    def fake_execute(statement):
+        calls["statement"] = statement
+        return _Result(rowcount=1)
+
+    monkeypatch.setattr(store_resource.db.session, "execute", fake_execute)
     monkeypatch.setattr(store_resource.db.session, "commit", lambda: calls.setdefault("committed", True))
 
     result = _unwrap(store_resource.Store.delete)(store_resource.Store(), "77")
 
     assert result == {"message": "store deleted with store id 77"}
-    assert calls["deleted"] is fake_store
+    assert calls["statement"].compile().params == {"store_id_1": 77, "user_id_1": 42}
     assert calls["committed"] is True
 
 
+def test_store_delete_not_found_when_no_row_matches(monkeypatch):
+    rollback_calls = {"count": 0}
+
+    monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
+    monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
+    monkeypatch.setattr(store_resource.db.session, "execute", lambda _statement: _Result(rowcount=0))
+    monkeypatch.setattr(
+        store_resource.db.session,
+        "rollback",
+        lambda: rollback_calls.__setitem__("count", rollback_calls["count"] + 1),
+    )
+
+    for store_id in ("77", "not-a-number"):
+        with pytest.raises(Exception) as exc_info:
+            _unwrap(store_resource.Store.delete)(store_resource.Store(), store_id)
+        assert getattr(exc_info.value, "code", None) == 404
+
+    assert rollback_calls["count"] == 1
+
+
 def test_store_put_rejects_product_code(monkeypatch):
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
     monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
-    monkeypatch.setattr(store_resource, "get_user_product_or_404", lambda _store_id, _user_id: object())
 
     with pytest.raises(Exception) as exc_info:
         _unwrap(store_resource.Store.put)(
@@ -109,18 +170,17 @@ def test_store_put_rejects_product_code(monkeypatch):
 
 
 def test_store_put_success_updates_store(monkeypatch):
-    class _Store:
-        user_id = 1
-        store_id = 9
-        store_name = "old"
+    calls = {"statements": []}
+    updated_row = {"store_id": 9, "user_id": 42, "store_name": "new-name"}
 
-    calls = {}
-    store = _Store()
+    def fake_execute(statement):
+        calls["statements"].append(statement)
+        return _Result(rowcount=1, row=updated_row)
 
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
     monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
-    monkeypatch.setattr(store_resource, "get_user_product_or_404", lambda _store_id, _user_id: store)
-    monkeypatch.setattr(store_resource.db.session, "add", lambda value: calls.setdefault("added", value))
+    monkeypatch.setattr(store_resource.db.session, "get_bind", lambda: _Bind(update_returning=False))
+    monkeypatch.setattr(store_resource.db.session, "execute", fake_execute)
     monkeypatch.setattr(store_resource.db.session, "commit", lambda: calls.setdefault("committed", True))
 
     result = _unwrap(store_resource.Store.put)(
@@ -129,26 +189,54 @@ def test_store_put_success_updates_store(monkeypatch):
         "9",
     )
 
-    assert result is store
-    assert store.store_name == "new-name"
-    assert store.user_id == 1
-    assert store.store_id == 9
-    assert calls["added"] is store
+    assert result == updated_row
+    update_params = calls["statements"][0].compile().params
+    assert update_params["store_name"] == "new-name"
+    assert "user_id" not in {key for key in update_params if not key.endswith("_1")}
+    assert update_params["user_id_1"] == 42
+    assert update_params["store_id_1"] == 9
     assert calls["committed"] is True
 
 
-def test_store_put_handles_integrity_error(monkeypatch):
-    class _Store:
-        pass
+def test_store_put_uses_returning_when_supported(monkeypatch):
+    calls = {"statements": []}
+
+    def fake_execute(statement):
+        calls["statements"].append(statement)
+        return _Result(rowcount=1, row={"store_id": 9})
 
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
     monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
-    monkeypatch.setattr(store_resource, "get_user_product_or_404", lambda _store_id, _user_id: _Store())
-    monkeypatch.setattr(store_resource.db.session, "add", lambda _value: None)
+    monkeypatch.setattr(store_resource.db.session, "get_bind", lambda: _Bind(update_returning=True))
+    monkeypatch.setattr(store_resource.db.session, "execute", fake_execute)
+    monkeypatch.setattr(store_resource.db.session, "commit", lambda: None)
+
+    _unwrap(store_resource.Store.put)(store_resource.Store(), {"store_name": "x"}, "9")
+
+    assert len(calls["statements"]) == 1
+
+
+def test_store_put_not_found_when_no_row_matches(monkeypatch):
+    monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
+    monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
+    monkeypatch.setattr(store_resource.db.session, "get_bind", lambda: _Bind(update_returning=False))
+    monkeypatch.setattr(store_resource.db.session, "execute", lambda _statement: _Result(rowcount=0))
+    monkeypatch.setattr(store_resource.db.session, "rollback", lambda: None)
+
+    with pytest.raises(Exception) as exc_info:
+        _unwrap(store_resource.Store.put)(store_resource.Store(), {"store_name": "x"}, "9")
+
+    assert getattr(exc_info.value, "code", None) == 404
+
+
+def test_store_put_handles_integrity_error(monkeypatch):
+    monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
+    monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
+    monkeypatch.setattr(store_resource.db.session, "get_bind", lambda: _Bind(update_returning=False))
     monkeypatch.setattr(
         store_resource.db.session,
-        "commit",
-        lambda: (_ for _ in ()).throw(IntegrityError("stmt", "params", Exception("dup"))),
+        "execute",
+        lambda _statement: (_ for _ in ()).throw(IntegrityError("stmt", "params", Exception("dup"))),
     )
     rollback_calls = {"count": 0}
     monkeypatch.setattr(
@@ -165,17 +253,13 @@ def test_store_put_handles_integrity_error(monkeypatch):
 
 
 def test_store_put_handles_sqlalchemy_error(monkeypatch):
-    class _Store:
-        pass
-
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "42")
     monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
-    monkeypatch.setattr(store_resource, "get_user_product_or_404", lambda _store_id, _user_id: _Store())
-    monkeypatch.setattr(store_resource.db.session, "add", lambda _value: None)
+    monkeypatch.setattr(store_resource.db.session, "get_bind", lambda: _Bind(update_returning=False))
     monkeypatch.setattr(
         store_resource.db.session,
-        "commit",
-        lambda: (_ for _ in ()).throw(SQLAlchemyError("db error")),
+        "execute",
+        lambda _statement: (_ for _ in ()).throw(SQLAlchemyError("db error")),
     )
     rollback_calls = {"count": 0}
     monkeypatch.setattr(
@@ -192,29 +276,34 @@ def test_store_put_handles_sqlalchemy_error(monkeypatch):
 
 
 def test_store_list_get_filters_by_user(monkeypatch):
-    expected = [object(), object()]
-    fake_model = type("FakeStoreModel", (), {"query": _QueryAll(expected)})
+    from flask import Flask
+
+    expected = [_VersionedStore(1), _VersionedStore(2)]
+    fake_model = type(
+        "FakeStoreModel", (),
+        {"query": _QueryAll(expected), "store_id": _StoreModel.store_id, "__table__": _StoreModel.__table__},
+    )
     monkeypatch.setattr(store_resource, "StoreModel", fake_model)
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "12")
 
-    result = _unwrap(store_resource.StoreList.get)(store_resource.StoreList())
+    with Flask(__name__).test_request_context():
+        stores, headers = _unwrap(store_resource.StoreList.get)(store_resource.StoreList(), {})
 
-    assert result == expected
+    assert stores == expected
+    assert set(headers) == {"ETag"}
 
 
 def test_store_create_post_success(monkeypatch):
     calls = {"execute": 0}
-    expected_store = object()
-    fake_model = type("FakeStoreModel", (), {"query": _QueryFirst(expected_store)})
 
-    monkeypatch.setattr(store_resource, "StoreModel", fake_model)
     monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "24")
     monkeypatch.setattr(store_resource, "validate_active_session", lambda _user_id: None)
-    monkeypatch.setattr(
-        store_resource.db.session,
-        "execute",
-        lambda _stmt, params: calls.update({"execute": calls["execute"] + 1, "params": params}),
-    )
+
+    def fake_execute(_stmt, params):
+        calls.update({"execute": calls["execute"] + 1, "params": params})
+        return _Result(lastrowid=501)
+
+    monkeypatch.setattr(store_resource.db.session, "execute", fake_execute)
     monkeypatch.setattr(store_resource.db.session, "commit", lambda: calls.setdefault("committed", True))
 
     result = _unwrap(store_resource.StoreCreate.post)(
@@ -224,8 +313,6 @@ def test_store_create_post_success(monkeypatch):
             "customer_name": "A",
             "store_name": "S",
             "address_line1": "L1",
-            "address_line2": None,
-            "address_line3": None,
             "pin_code": "123456",
             "state_code": "KA",
             "country_code": "IN",
@@ -233,9 +320,13 @@ def test_store_create_post_success(monkeypatch):
         },
     )
 
-    assert result is expected_store
+    # Built from the INSERT parameters and the generated key - no re-SELECT.
+    assert result["store_id"] == 501
+    assert result["user_id"] == 24
+    assert result["address_line2"] is None
     assert calls["execute"] == 1
     assert calls["params"]["user_id"] == 24
+    assert calls["params"]["address_line3"] is None
     assert calls["committed"] is True
 
 
@@ -247,6 +338,7 @@ def test_store_create_post_handles_integrity_error(monkeypatch):
         "execute",
         lambda _stmt, _params: (_ for _ in ()).throw(IntegrityError("stmt", "params", Exception("dup"))),
     )
+    monkeypatch.setattr(store_resource.db.session, "query", lambda *_columns: _QueryFirst((7,)))
     rollback_calls = {"count": 0}
     monkeypatch.setattr(
         store_resource.db.session,
@@ -272,6 +364,7 @@ def test_store_create_post_handles_integrity_error(monkeypatch):
         )
 
     assert getattr(exc_info.value, "code", None) == 400
+    assert exc_info.value.data["message"] == "Store number already exists for this user"
     assert rollback_calls["count"] == 1
 
 
@@ -309,3 +402,53 @@ def test_store_create_post_handles_sqlalchemy_error(monkeypatch):
 
     assert getattr(exc_info.value, "code", None) == 500
     assert rollback_calls["count"] == 1
+
+
+def test_store_get_uses_read_through_cache(monkeypatch, fake_redis):
+    from flask import Flask
+
+    class _Store:
+        store_id = 11
+        store_number = 1
+        store_name = "S"
+        version = 1
+        updated_at = None
+
+    queries = {"count": 0}
+
+    class _CountingQuery:
+        def get_or_404(self, _store_id):
+            queries["count"] += 1
+            return _Store()
+
+    monkeypatch.setattr(store_resource, "StoreModel", type("FakeStoreModel", (), {"query": _CountingQuery()}))
+    monkeypatch.setattr(store_resource.store_cache, "enabled", True)
+    monkeypatch.setattr(store_resource.store_cache, "client", fake_redis)
+
+    with Flask(__name__).test_request_context():
+        first = _unwrap(store_resource.Store.get)(store_resource.Store(), {}, "11")
+        second = _unwrap(store_resource.Store.get)(store_resource.Store(), {}, "11")
+
+    assert queries["count"] == 1
+    assert second.get_json() == {"store_id": 11, "store_number": 1, "store_name": "S"}
+    assert first.get_data() == second.get_data()
+
+
+def test_store_list_get_uses_read_through_cache(monkeypatch, fake_redis):
+    from flask import Flask
+
+    fake_model = type(
+        "FakeStoreModel", (),
+        {"query": _QueryAll([]), "store_id": _StoreModel.store_id, "__table__": _StoreModel.__table__},
+    )
+    monkeypatch.setattr(store_resource, "StoreModel", fake_model)
+    monkeypatch.setattr(store_resource, "get_jwt_identity", lambda: "12")
+    monkeypatch.setattr(store_resource.store_cache, "enabled", True)
+    monkeypatch.setattr(store_resource.store_cache, "client", fake_redis)
+
+    with Flask(__name__).test_request_context():
+        result = _unwrap(store_resource.StoreList.get)(store_resource.StoreList(), {})
+
+    assert result.get_json() == []
+    cached_headers = json.dumps({"ETag": result.headers["ETag"]})
+    assert fake_redis.data["stores:user:12:0:100"] == f"0|{cached_headers}\n[]\n"
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import event, func, select, text
+
+from store_service.extensions.db import db
+from store_service.models.store_db import StoreModel
+from store_service.resources import store as store_resource
+from tests.conftest import make_store
+
+
+def _seed(app):
+    with app.app_context():
+        db.session.add_all([
+            make_store(1, 1, store_name="Alpha Mart", customer_name="Acme", shipping_time=1),
+            make_store(1, 2, store_name="Alpha Depot", customer_name="Acme", state_code="MH", pin_code="400001",
+                       shipping_time=3),
+            make_store(1, 3, store_name="Beta Stores", customer_name="Bolt", shipping_time=5),
+            make_store(1, 4, store_name="100%_Fresh", customer_name="Bolt", country_code="US", state_code="CA",
+                       pin_code="94016", shipping_time=7),
+            make_store(2, 1, store_name="Alpha Mart", customer_name="Acme", shipping_time=1),
+        ])
+        db.session.commit()
+
+
+def _numbers(response):
+    return [store["store_number"] for store in response.get_json()]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("country_code=IN", [1, 2, 3]),
+    ("country_code=IN&state_code=KA", [1, 3]),
+    ("country_code=IN&state_code=MH&pin_code=400001", [2]),
+    ("shipping_time_min=3", [2, 3, 4]),
+    ("shipping_time_min=3&shipping_time_max=5", [2, 3]),
+    ("store_name=Alpha", [1, 2]),
+    ("store_name=100%25_", [4]),
+    ("store_name=100%25x", []),
+    ("customer_name=Bo&shipping_time_max=5", [3]),
+    ("", [1, 2, 3, 4]),
+])
+def test_search_filters_the_callers_stores(app, auth_headers, query, expected):
+    _seed(app)
+
+    response = app.test_client().get(f"/stores/search?{query}", headers=auth_headers(1))
+
+    assert response.status_code == 200
+    assert _numbers(response) == expected
+    assert {store["user_id"] for store in response.get_json()} <= {1}
+
+
+def test_search_pages_and_counts(app, auth_headers):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    first = client.get("/stores/search?country_code=IN&limit=2&count=true&fields=store_number", headers=headers)
+    second = client.get(
+        f"/stores/search?country_code=IN&limit=2&cursor={first.headers['X-Next-Cursor']}", headers=headers
+    )
+
+    assert first.get_json() == [{"store_number": 1}, {"store_number": 2}]
+    assert first.headers["X-Total-Count"] == "3"
+    assert _numbers(second) == [3]
+    assert "X-Next-Cursor" not in second.headers and "X-Total-Count" not in second.headers
+
+
+def test_search_fast_path_is_byte_identical(app, auth_headers, monkeypatch):
+    _seed(app)
+    client = app.test_client()
+    headers = auth_headers(1)
+    url = "/stores/search?store_name=Alpha&count=true"
+
+    schema_response = client.get(url, headers=headers)
+    monkeypatch.setattr(store_resource, "STORE_LIST_FAST_PATH", True)
+    fast_response = client.get(url, headers=headers)
+
+    assert fast_response.get_data() == schema_response.get_data()
+    assert fast_response.headers["X-Total-Count"] == schema_response.headers["X-Total-Count"] == "2"
+
+
+def test_search_rejects_invalid_filters(app, auth_headers):
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    assert client.get("/stores/search?shipping_time_min=5&shipping_time_max=2", headers=headers).status_code == 422
+    assert client.get("/stores/search?shipping_time_min=-1", headers=headers).status_code == 422
+    assert client.get("/stores/search?store_name=", headers=headers).status_code == 422
+    assert client.get("/stores/search?country_code=IN").status_code == 401
+
+
+@pytest.mark.parametrize("search_args, index", [
+    ({"country_code": "IN", "state_code": "KA"}, "ix_stores_user_id_location"),
+    ({"country_code": "IN", "state_code": "KA", "pin_code": "560001", "shipping_time_max": 3},
+     "ix_stores_user_id_location"),
+    ({"shipping_time_min": 2, "shipping_time_max": 4}, "ix_stores_user_id_shipping_time"),
+    ({"store_name": "Alpha"}, "ix_stores_user_id_store_name"),
+    ({"customer_name": "Ac"}, "ix_stores_user_id_customer_name"),
+])
+def test_search_counts_are_answered_from_an_index(app, search_args, index):
+    with app.app_context():
+        # SQLite only uses an index for LIKE when LIKE is case sensitive (MySQL's collations handle this)
+        db.session.execute(text("PRAGMA case_sensitive_like = ON"))
+        statement = select(func.count()).select_from(StoreModel.__table__).where(
+            *store_resource.search_criteria(1, search_args)
+        )
+        compiled = statement.compile(db.engine, compile_kwargs={"literal_binds": True})
+        plan = " ".join(row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+    assert f"USING COVERING INDEX {index}" in plan
+
+
+def test_search_issues_one_select_without_count(app, auth_headers):
+    _seed(app)
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    app.test_client().get("/stores/search?country_code=IN", headers=auth_headers(1))
+
+    assert len(statements) == 1
+    assert "count(" not in statements[0].lower()
@@ -0,0 +1,82 @@
+from sqlalchemy import event
+
+from store_service.extensions.db import db
+from tests.conftest import make_store
+
+
+def _count_statements(app):
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_create_update_delete_round_trips(app, auth_headers):
+    client = app.test_client()
+    headers = auth_headers(1)
+    statements = _count_statements(app)
+
+    created = client.post(
+        "/create_store",
+        json={
+            "store_number": 7,
+            "customer_name": "Customer",
+            "store_name": "Main",
+            "address_line1": "Line 1",
+            "pin_code": "560001",
+            "state_code": "KA",
+            "country_code": "IN",
+            "shipping_time": 2,
+        },
+        headers=headers,
+    )
+    store_id = created.get_json()["store_id"]
+    assert created.status_code == 201
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("INSERT")
+    assert created.get_json() == client.get(f"/store/{store_id}").get_json()
+
+    statements.clear()
+    updated = client.put(f"/store/{store_id}", json={"customer_name": "Renamed"}, headers=headers)
+    assert updated.status_code == 200
+    assert updated.get_json()["customer_name"] == "Renamed"
+    assert updated.get_json()["store_name"] == "Main"
+    # SQLite supports UPDATE ... RETURNING
+    assert len(statements) == 1
+
+    statements.clear()
+    deleted = client.delete(f"/store/{store_id}", headers=headers)
+    assert deleted.status_code == 200
+    assert len(statements) == 1
+    assert client.get(f"/store/{store_id}").status_code == 404
+
+
+def test_writes_on_another_users_store_return_404(app, auth_headers):
+    with app.app_context():
+        store = make_store(user_id=2, store_number=1)
+        db.session.add(store)
+        db.session.commit()
+        store_id = store.store_id
+
+    client = app.test_client()
+    headers = auth_headers(1)
+
+    assert client.put(f"/store/{store_id}", json={"customer_name": "x"}, headers=headers).status_code == 404
+    assert client.delete(f"/store/{store_id}", headers=headers).status_code == 404
+    assert client.get(f"/store/{store_id}").get_json()["customer_name"] == "Customer"
+
+
+def test_create_errors_tell_missing_fields_from_duplicates(app, auth_headers):
+    client = app.test_client()
+    headers = auth_headers(1)
+    payload = {"store_number": 7, "customer_name": "Customer", "store_name": "Main", "address_line1": "Line 1",
+               "pin_code": "560001", "state_code": "KA", "country_code": "IN", "shipping_time": 2}
+    assert client.post("/create_store", json=payload, headers=headers).status_code == 201
+
+    duplicate = client.post("/create_store", json=payload, headers=headers)
+    no_number = client.post("/create_store", json={"customer_name": "C"}, headers=headers)
+    incomplete = client.post("/create_store", json={"store_number": 8, "customer_name": "C"}, headers=headers)
+
+    assert (duplicate.status_code, duplicate.get_json()["message"]) == (400, "Store number already exists for this user")
+    assert (no_number.status_code, no_number.get_json()["message"]) == (400, "store_number is required")
+    assert (incomplete.status_code, incomplete.get_json()["message"]) == (400, "Store violates a database constraint")
@@ -1,7 +1,7 @@
 import pytest
 from marshmallow import ValidationError
 
-from store_service.schemas.store_schema import StoreSchema
+from store_service.schemas.store_schema import StoreBulkPatchSchema, StoreSchema
 
 
 def test_store_schema_requires_customer_name():
@@ -28,3 +28,16 @@ def test_store_schema_rejects_dump_only_fields_on_load():
 
     assert exc_info.value.messages["store_id"] == ["Unknown field."]
     assert exc_info.value.messages["user_id"] == ["Unknown field."]
+
+
+def test_bulk_patch_schema_loads_a_partial_store_once():
+    schema = StoreBulkPatchSchema()
+
+    loaded = schema.load({"store_ids": [2, 1], "patch": {"shipping_time": 3}})
+
+    assert loaded == {"store_ids": [2, 1], "patch": {"shipping_time": 3}}
+    with pytest.raises(ValidationError) as exc_info:
+        schema.load({"store_ids": [1], "patch": {"store_number": 4, "shipping_time": "soon"}})
+    assert exc_info.value.messages["patch"] == {
+        "store_number": ["Unknown field."], "shipping_time": ["Not a valid integer."]
+    }
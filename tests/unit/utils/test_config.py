@@ -0,0 +1,24 @@
+import pytest
+
+from store_service.utils.config import env_flag
+
+
+@pytest.mark.parametrize("value", ["1", "true", "TRUE", " yes ", "On"])
+def test_env_flag_true_values(monkeypatch, value):
+    monkeypatch.setenv("SOME_FLAG", value)
+
+    assert env_flag("SOME_FLAG") is True
+
+
+@pytest.mark.parametrize("value", ["0", "false", "no", "off", "", "enabled"])
+def test_env_flag_other_values_are_false(monkeypatch, value):
+    monkeypatch.setenv("SOME_FLAG", value)
+
+    assert env_flag("SOME_FLAG", "true") is False
+
+
+def test_env_flag_default_when_unset(monkeypatch):
+    monkeypatch.delenv("SOME_FLAG", raising=False)
+
+    assert env_flag("SOME_FLAG") is False
+    assert env_flag("SOME_FLAG", "true") is True
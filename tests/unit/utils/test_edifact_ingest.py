@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from store_service.extensions.db import db
+from store_service.models.order_db import IngestCheckpointModel, OrderModel
+from store_service.utils import edifact_ingest
+
+ORDER = "UNH+{n}+ORDERS:D:96A:UN'BGM+220+{store}+9'LIN+1'QTY+21:2'PRI+AAA:5'UNT+6+{n}'"
+
+
+def _write_drop(directory, count, messages_per_file=2):
+    for index in range(count):
+        content = "".join(ORDER.format(n=n, store=index) for n in range(messages_per_file))
+        (directory / f"order_{index:03}.edi").write_text(content, encoding="utf-8")
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_ingest_directory_loads_orders_in_chunks(app, tmp_path, workers):
+    _write_drop(tmp_path, 5)
+
+    with app.app_context():
+        report = edifact_ingest.ingest_directory(tmp_path, workers=workers, chunk_size=3)
+
+        assert report.files_done == 5
+        assert report.orders == 10
+        assert OrderModel.query.count() == 10
+        assert {order.total_amount for order in OrderModel.query} == {10}
+        assert IngestCheckpointModel.query.filter_by(status="done").count() == 5
+        assert set(report.timings) == {"discover", "transform", "load", "total"}
+        assert report.files_per_second > 0
+
+
+def test_ingest_directory_resumes_from_checkpoint(app, tmp_path, monkeypatch):
+    _write_drop(tmp_path, 4)
+    real_load_chunk = edifact_ingest._load_chunk
+    loaded = {"chunks": 0}
+
+    def crash_after_first_chunk(results):
+        if loaded["chunks"] == 1:
+            raise RuntimeError("worker killed")
+        loaded["chunks"] += 1
+        return real_load_chunk(results)
+
+    with app.app_context():
+        monkeypatch.setattr(edifact_ingest, "_load_chunk", crash_after_first_chunk)
+        with pytest.raises(RuntimeError):
+            edifact_ingest.ingest_directory(tmp_path, workers=0, chunk_size=2)
+        db.session.rollback()
+        monkeypatch.setattr(edifact_ingest, "_load_chunk", real_load_chunk)
+
+        report = edifact_ingest.ingest_directory(tmp_path, workers=0, chunk_size=2)
+
+        assert report.files_skipped == 1
+        assert report.files_done == 3
+        assert OrderModel.query.count() == 8
+
+
+def test_ingest_directory_records_failed_files_and_retries_them(app, tmp_path):
+    (tmp_path / "broken.edi").write_text("UNH+1+ORDERS:D:96A:UN'BGM+220+1+9'", encoding="utf-8")
+
+    with app.app_context():
+        report = edifact_ingest.ingest_directory(tmp_path, workers=0)
+        checkpoint = db.session.get(IngestCheckpointModel, str(tmp_path / "broken.edi"))
+
+        assert report.files_failed == 1
+        assert checkpoint.status == "failed"
+        assert "UNT" in checkpoint.error
+
+        (tmp_path / "broken.edi").write_text(ORDER.format(n=1, store=1), encoding="utf-8")
+        report = edifact_ingest.ingest_directory(tmp_path, workers=0)
+
+        assert report.files_done == 1
+        assert OrderModel.query.count() == 1
+
+
+def test_ingest_edifact_command_reports_throughput(app, tmp_path):
+    _write_drop(tmp_path, 2)
+
+    result = app.test_cli_runner().invoke(args=["ingest-edifact", str(tmp_path), "--workers", "0"])
+
+    assert result.exit_code == 0
+    assert "2 loaded" in result.output
+    assert "files/sec" in result.output
+
+
+def test_checkpoints_keep_the_exact_mtime_and_skip_unchanged_files(app, tmp_path):
+    _write_drop(tmp_path, 2)
+    for path in tmp_path.iterdir():
+        os.utime(path, ns=(1_792_341_757_050_000_123, 1_792_341_757_050_000_123))  # beyond single precision
+
+    with app.app_context():
+        edifact_ingest.ingest_directory(tmp_path, workers=0)
+        report = edifact_ingest.ingest_directory(tmp_path, workers=0)
+
+        assert (report.files_seen, report.files_skipped) == (2, 2)
+        assert {checkpoint.file_mtime_ns for checkpoint in IngestCheckpointModel.query} == {1_792_341_757_050_000_123}
+
+
+def test_transform_file_reports_a_file_removed_since_discovery(tmp_path):
+    path, size, mtime_ns, orders, error, _seconds = edifact_ingest.transform_file(str(tmp_path / "gone.edi"))
+
+    assert (size, mtime_ns, orders) == (0, 0, [])
+    assert "No such file" in error
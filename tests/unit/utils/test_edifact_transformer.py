@@ -33,3 +33,27 @@ def test_transform_edifact_to_json_uses_defaults(monkeypatch):
         "total_amount": 0.0,
         "currency": "INR",
     }
+
+
+def test_transform_edifact_messages_sums_line_items(tmp_path):
+    edi_file = tmp_path / "orders.edi"
+    edi_file.write_text(
+        "UNH+1+ORDERS:D:96A:UN'BGM+220+2+9'CUX+2:USD:9'"
+        "LIN+1'QTY+21:2'PRI+AAA:10.25'LIN+2'PRI+AAA:5'UNT+8+1'"
+        "UNH+2+ORDERS:D:96A:UN'BGM+220+3+9'UNT+3+2'",
+        encoding="utf-8",
+    )
+
+    results = list(edifact_transformer.transform_edifact_messages(str(edi_file)))
+
+    assert [result["store_number"] for result in results] == [2, 3]
+    assert results[0]["currency"] == "USD"
+    assert results[0]["total_amount"] == 25.5
+    assert [item["line_number"] for item in results[0]["line_items"]] == ["1", "2"]
+    assert results[1] == {
+        "store_number": 3,
+        "order_status": "pending",
+        "total_amount": 0.0,
+        "currency": "INR",
+        "line_items": [],
+    }
@@ -0,0 +1,28 @@
+import pytest
+
+from store_service.utils import pagination
+
+
+def test_cursor_round_trip():
+    cursor = pagination.encode_cursor(1234)
+
+    assert "1234" not in cursor
+    assert pagination.decode_cursor(cursor) == 1234
+    assert pagination.decode_cursor(None) == 0
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "Zm9v", pagination.encode_cursor("abc")])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(Exception) as exc_info:
+        pagination.decode_cursor(cursor)
+
+    assert getattr(exc_info.value, "code", None) == 400
+
+
+def test_page_size_defaults_and_caps(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 50)
+    monkeypatch.setattr(pagination, "MAX_PAGE_SIZE", 200)
+
+    assert pagination.page_size(None) == 50
+    assert pagination.page_size(10) == 10
+    assert pagination.page_size(1000) == 200
@@ -0,0 +1,27 @@
+from store_service.utils.startup import StartupTimings
+
+
+def test_phases_add_up_and_skip_resumed_gaps():
+    timings = StartupTimings(started=10.0, target_ms=1000)
+
+    timings.mark("imports", now=10.5)
+    timings._last = 20.0  # as after resume(): the gap between import and create_app() is not charged
+    timings.mark("config", now=20.25)
+    timings.mark("extensions", now=20.5)
+    timings.mark("config", now=20.75)
+
+    assert timings.phases == {"imports": 500.0, "config": 500.0, "extensions": 250.0}
+    assert timings.total_ms == 1250.0
+    assert timings.summary() == "imports=500.0 config=500.0 extensions=250.0 total=1250.0"
+
+
+def test_first_request_is_recorded_once_and_warns_above_target(capsys):
+    timings = StartupTimings(started=0.0, target_ms=1)
+
+    timings.first_request()
+    first = timings.time_to_first_request_ms
+    timings.first_request()
+
+    assert timings.time_to_first_request_ms == first
+    assert capsys.readouterr().out.count("above STARTUP_TARGET_MS=1") == 1
+    assert timings.as_dict()["target_ms"] == 1